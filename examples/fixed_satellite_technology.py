@@ -1,14 +1,39 @@
 from manim import *
 
+from physics.atmosphere import AMSR2_CHANNELS, freeze_brightness_temperature
+from physics.freezing import (
+    FREEZE_BREAKPOINTS, ICE_EMISSIVITY, WATER_EMISSIVITY,
+    emissivity, physical_temperature, brightness_temperature,
+)
+from physics.retrieval import retrieve, synthetic_freeze_up
+from rendering.emission import WaveEmitter
+from rendering.layers import LayeredScene
+from rendering.orbit import OrbitMotion
+from rendering.plotting import plot_family, plot_piecewise
+from rendering.prefetch import prefetch_text
+from rendering.raster import AdvanceIceFront, FreezingSurface, RasterMap
+from rendering.tables import GridTable
+from rendering.text import cached_text
+
+# Baisse de température physique plus marquée dans les scènes satellite
+MICROWAVE_COOLING = 0.2
+
+# Anneaux micro-onde émis par seconde pour une émissivité de 1
+MICROWAVE_RATE = 80
+
 class SatelliteMicroReSonaFixed(Scene):
     """
     Version corrigée de la classe SatelliteMicroResonaTechnology
     avec correction des erreurs de Table et optimisation pour MiKTeX
     """
+    def setup(self):
+        # Textes et formules préparés en arrière-plan pendant les premières animations
+        prefetch_text(self)
+
     def construct(self):
         # Titre avec animation élégante
-        title = Text("Télédétection Micro-onde par Satellite", font_size=48)
-        subtitle = Text("Technologie & Instrumentation", font_size=36, color=BLUE)
+        title = cached_text("Télédétection Micro-onde par Satellite", font_size=48)
+        subtitle = cached_text("Technologie & Instrumentation", font_size=36, color=BLUE)
         subtitle.next_to(title, DOWN)
         
         self.play(Write(title), run_time=1.5)
@@ -21,7 +46,7 @@ class SatelliteMicroReSonaFixed(Scene):
         )
         
         # Présentation des capteurs satellites - sans utiliser Table
-        sensors_title = Text("Capteurs Satellites Principaux", font_size=36, color=YELLOW)
+        sensors_title = cached_text("Capteurs Satellites Principaux", font_size=36, color=YELLOW)
         sensors_title.next_to(subtitle, DOWN, buff=0.7)
         
         # Créer un tableau manuellement avec des Textes et des rectangles
@@ -35,31 +60,8 @@ class SatelliteMicroReSonaFixed(Scene):
             ["SMOS", "2009-", "1.4 GHz (L-band)", "SMOS"]
         ]
         
-        # Créer la grille du tableau
-        table_group = VGroup()
-        cell_width = 2.2
-        cell_height = 0.5
-        rows = len(table_data)
-        cols = len(table_data[0])
-        
-        for i in range(rows):
-            for j in range(cols):
-                # Créer le rectangle de la cellule
-                cell = Rectangle(
-                    width=cell_width, 
-                    height=cell_height,
-                    stroke_width=2,
-                    fill_opacity=0.1 if i == 0 else 0
-                )
-                cell.move_to(RIGHT * (j * cell_width - (cols-1) * cell_width / 2) + 
-                             DOWN * (i * cell_height - (rows-1) * cell_height / 2))
-                
-                # Créer le texte de la cellule
-                text = Text(table_data[i][j], font_size=18)
-                text.move_to(cell.get_center())
-                
-                # Ajouter la cellule et le texte au groupe
-                table_group.add(cell, text)
+        # Grille et textes regroupés en trois mobjects (rendering.tables)
+        table_group = GridTable(table_data, cell_width=2.2, cell_height=0.5, font_size=18)
         
         # Positionner le tableau
         table_group.scale(0.8)
@@ -71,7 +73,7 @@ class SatelliteMicroReSonaFixed(Scene):
         self.wait(1.5)
         
         # Schéma de l'orbite polaire
-        orbit_title = Text("Orbite Polaire Héliosynchrone", font_size=30, color=GREEN)
+        orbit_title = cached_text("Orbite Polaire Héliosynchrone", font_size=30, color=GREEN)
         orbit_title.to_edge(LEFT, buff=1).shift(DOWN * 2)
         
         earth = Circle(radius=1.2, color=BLUE)
@@ -89,36 +91,25 @@ class SatelliteMicroReSonaFixed(Scene):
         self.play(Write(orbit_title), Create(earth), run_time=1.5)
         self.play(Create(orbit), run_time=1)
         
-        # Animation du satellite sur son orbite
-        satellite_path = ParametricFunction(
-            lambda t: earth.get_center() + np.array([
-                1.5 * np.cos(t),
-                1.6 * np.sin(t),
-                0
-            ]),
-            t_range=[0, 2*PI],
-            color=RED
-        )
-        
-        satellite.move_to(satellite_path.point_from_proportion(0))
+        # Animation du satellite sur son orbite (position calculée en forme fermée)
+        satellite.move_to(earth.get_center() + RIGHT * 1.5)
         self.add(satellite)
         
         self.play(
-            MoveAlongPath(satellite, satellite_path),
-            run_time=5,
-            rate_func=linear
+            OrbitMotion(satellite, earth.get_center(), 1.5, 1.6),
+            run_time=5
         )
         self.wait(1)
         
         # Explication du principe de fonctionnement des radiomètres
-        principle_title = Text("Principe du Radiomètre Micro-onde", font_size=30, color=YELLOW)
+        principle_title = cached_text("Principe du Radiomètre Micro-onde", font_size=30, color=YELLOW)
         principle_title.to_edge(RIGHT, buff=1).shift(DOWN * 2)
         
         # Utilisation de Text au lieu de BulletedList pour éviter les problèmes LaTeX
-        principle_item1 = Text("• Mesure passive du rayonnement émis", font_size=22)
-        principle_item2 = Text("• Détection de la température de brillance", font_size=22)
-        principle_item3 = Text("• Multiple fréquences et polarisations", font_size=22)
-        principle_item4 = Text("• Calcul de l'émissivité des surfaces", font_size=22)
+        principle_item1 = cached_text("• Mesure passive du rayonnement émis", font_size=22)
+        principle_item2 = cached_text("• Détection de la température de brillance", font_size=22)
+        principle_item3 = cached_text("• Multiple fréquences et polarisations", font_size=22)
+        principle_item4 = cached_text("• Calcul de l'émissivité des surfaces", font_size=22)
         
         principle_points = VGroup(principle_item1, principle_item2, principle_item3, principle_item4)
         principle_points.arrange(DOWN, aligned_edge=LEFT, buff=0.2)
@@ -140,8 +131,77 @@ class SatelliteMicroReSonaFixed(Scene):
             FadeOut(principle_points),
             run_time=1
         )
-        
-        advantages_title = Text("Avantages de la Télédétection Micro-onde", font_size=36, color=GREEN)
+
+        # Tᴮ au sommet de l'atmosphère pour tous les canaux d'AMSR2 pendant le gel
+        channels_title = cached_text("Canaux AMSR2 pendant le gel (polarisation V, 55°)", font_size=30, color=YELLOW)
+        channels_title.next_to(subtitle, DOWN, buff=0.5)
+
+        channels_axes = Axes(
+            x_range=[0, 10, 1],
+            y_range=[140, 260, 20],
+            axis_config={"include_tip": False, "include_numbers": True, "font_size": 20},
+            x_length=8,
+            y_length=4.2,
+        )
+        channels_axes.next_to(channels_title, DOWN, buff=0.4).to_edge(LEFT, buff=1)
+        channels_x_label = channels_axes.get_x_axis_label(MathTex(r"\text{Temps (jours)}", font_size=24), edge=DOWN, direction=DOWN)
+        channels_y_label = channels_axes.get_y_axis_label(MathTex(r"T_B~\text{(K)}", font_size=24), edge=LEFT, direction=LEFT)
+
+        # Une courbe par canal, toutes calculées en une seule opération
+        channels = np.array(AMSR2_CHANNELS)
+        channel_curves = plot_family(
+            channels_axes,
+            lambda x, frequency: freeze_brightness_temperature(x, frequency),
+            channels,
+            x_range=[0, 10],
+            stroke_width=3,
+        ).set_color_by_gradient(BLUE, GREEN, YELLOW, RED)
+
+        channel_legend = VGroup(*[
+            cached_text(f"{frequency:g} GHz", font_size=18, color=curve.get_color())
+            for frequency, curve in zip(AMSR2_CHANNELS, channel_curves)
+        ]).arrange(DOWN, aligned_edge=LEFT, buff=0.12)
+        channel_legend.next_to(channels_axes, RIGHT, buff=0.5)
+
+        # Curseur temporel : Tᴮ de tous les canaux à l'instant courant, en un appel par image
+        day = ValueTracker(0)
+        day_marker = always_redraw(lambda: VGroup(
+            DashedLine(
+                channels_axes.coords_to_point(day.get_value(), 140),
+                channels_axes.coords_to_point(day.get_value(), 260),
+                color=GRAY,
+            ),
+            *[
+                Dot(point, radius=0.06, color=curve.get_color())
+                for point, curve in zip(
+                    np.asarray(channels_axes.coords_to_point(
+                        np.full(len(channels), day.get_value()),
+                        freeze_brightness_temperature(day.get_value(), channels),
+                    )).T,
+                    channel_curves,
+                )
+            ],
+        ))
+
+        self.play(Write(channels_title), Create(channels_axes), Write(channels_x_label), Write(channels_y_label), run_time=1.5)
+        self.play(Create(channel_curves, lag_ratio=0.1), Write(channel_legend), run_time=2)
+        self.add(day_marker)
+        self.play(day.animate.set_value(10), run_time=4, rate_func=linear)
+        day_marker.clear_updaters()
+        self.wait(1)
+
+        self.play(
+            FadeOut(channels_title),
+            FadeOut(channels_axes),
+            FadeOut(channels_x_label),
+            FadeOut(channels_y_label),
+            FadeOut(channel_curves),
+            FadeOut(channel_legend),
+            FadeOut(day_marker),
+            run_time=1
+        )
+
+        advantages_title = cached_text("Avantages de la Télédétection Micro-onde", font_size=36, color=GREEN)
         advantages_title.next_to(subtitle, DOWN, buff=0.7)
         
         # Créer des listes à puces sans utiliser BulletedList
@@ -159,10 +219,10 @@ class SatelliteMicroReSonaFixed(Scene):
             "• Mesures multi-fréquences",
         ]
         
-        adv_left = VGroup(*[Text(text, font_size=28) for text in adv_left_items])
+        adv_left = VGroup(*[cached_text(text, font_size=28) for text in adv_left_items])
         adv_left.arrange(DOWN, aligned_edge=LEFT, buff=0.2)
         
-        adv_right = VGroup(*[Text(text, font_size=28) for text in adv_right_items])
+        adv_right = VGroup(*[cached_text(text, font_size=28) for text in adv_right_items])
         adv_right.arrange(DOWN, aligned_edge=LEFT, buff=0.2)
         
         advantages = VGroup(adv_left, adv_right).arrange(RIGHT, buff=1)
@@ -173,7 +233,7 @@ class SatelliteMicroReSonaFixed(Scene):
         self.wait(1.5)
         
         # Algorithmes et produits dérivés
-        algorithms_title = Text("Algorithmes & Produits", font_size=36, color=BLUE)
+        algorithms_title = cached_text("Algorithmes & Produits", font_size=36, color=BLUE)
         algorithms_title.next_to(advantages, DOWN, buff=0.7)
         
         algorithms_items = [
@@ -185,7 +245,7 @@ class SatelliteMicroReSonaFixed(Scene):
             "• Détection du dégel de surface",
         ]
         
-        algorithms = VGroup(*[Text(text, font_size=28) for text in algorithms_items])
+        algorithms = VGroup(*[cached_text(text, font_size=28) for text in algorithms_items])
         algorithms.arrange(DOWN, aligned_edge=LEFT, buff=0.2)
         algorithms.next_to(algorithms_title, DOWN, buff=0.3)
         
@@ -202,7 +262,7 @@ class SatelliteMicroReSonaFixed(Scene):
             run_time=1
         )
         
-        conclusion = Text(
+        conclusion = cached_text(
             "La télédétection micro-onde constitue un outil essentiel\n"
             "pour surveiller et comprendre les changements climatiques\n"
             "dans les régions polaires.",
@@ -215,11 +275,14 @@ class SatelliteMicroReSonaFixed(Scene):
         self.wait(2)
 
 
-class ImprovedMicrowaveRemoteSensing(Scene):
+class ImprovedMicrowaveRemoteSensing(LayeredScene):
     """
     Version optimisée de la classe MicrowaveRemoteSensing
     avec correction des problèmes de LaTeX
     """
+    def setup(self):
+        prefetch_text(self)
+
     def construct(self):
         # Couleurs personnalisées pour rendre l'animation plus professionnelle
         WATER_COLOR = "#0C2D48"
@@ -228,8 +291,8 @@ class ImprovedMicrowaveRemoteSensing(Scene):
         WAVE_COLOR = "#FFD700"
         
         # Titre principal avec animation plus sophistiquée
-        title = Text("Télédétection Micro-onde en Arctique", font_size=48)
-        subtitle = Text("Principes physiques et applications", font_size=32, color=BLUE_C)
+        title = cached_text("Télédétection Micro-onde en Arctique", font_size=48)
+        subtitle = cached_text("Principes physiques et applications", font_size=32, color=BLUE_C)
         subtitle.next_to(title, DOWN)
         
         title_group = VGroup(title, subtitle)
@@ -245,17 +308,17 @@ class ImprovedMicrowaveRemoteSensing(Scene):
         )
         
         # Introduction au concept de température de brillance
-        tb_def = Text("Température de Brillance (Tᴮ)", font_size=36, color=YELLOW_C)
+        tb_def = cached_text("Température de Brillance (Tᴮ)", font_size=36, color=YELLOW_C)
         tb_def.next_to(title_group, DOWN, buff=0.5)
         
         # Utiliser Text au lieu de MathTex pour éviter les problèmes LaTeX
-        tb_equation = Text("Tᴮ(θ, ν) = ε(θ, ν) · Tphysique", font_size=36)
+        tb_equation = cached_text("Tᴮ(θ, ν) = ε(θ, ν) · Tphysique", font_size=36)
         tb_equation.next_to(tb_def, DOWN, buff=0.3)
         
         # Utiliser des textes individuels au lieu de BulletedList
-        tb_explanation1 = Text("• Température apparente perçue par un capteur satellite", font_size=28)
-        tb_explanation2 = Text("• Dépend de l'émissivité de la surface", font_size=28)
-        tb_explanation3 = Text("• Varie selon l'angle (θ) et la fréquence (ν)", font_size=28)
+        tb_explanation1 = cached_text("• Température apparente perçue par un capteur satellite", font_size=28)
+        tb_explanation2 = cached_text("• Dépend de l'émissivité de la surface", font_size=28)
+        tb_explanation3 = cached_text("• Varie selon l'angle (θ) et la fréquence (ν)", font_size=28)
         
         tb_explanation = VGroup(tb_explanation1, tb_explanation2, tb_explanation3)
         tb_explanation.arrange(DOWN, aligned_edge=LEFT, buff=0.2)
@@ -277,19 +340,19 @@ class ImprovedMicrowaveRemoteSensing(Scene):
         )
         
         # Expliquer le concept d'émissivité
-        emissivity_title = Text("Émissivité (ε)", font_size=36, color=GREEN_C)
+        emissivity_title = cached_text("Émissivité (ε)", font_size=36, color=GREEN_C)
         emissivity_title.next_to(title_group, DOWN, buff=0.5)
         
         # Utiliser des textes individuels au lieu de BulletedList
-        emissivity_def1 = Text("• Mesure de la capacité d'un matériau à émettre de l'énergie", font_size=28)
-        emissivity_def2 = Text("• Varie entre 0 (réflecteur parfait) et 1 (corps noir)", font_size=28)
+        emissivity_def1 = cached_text("• Mesure de la capacité d'un matériau à émettre de l'énergie", font_size=28)
+        emissivity_def2 = cached_text("• Varie entre 0 (réflecteur parfait) et 1 (corps noir)", font_size=28)
         
         emissivity_def = VGroup(emissivity_def1, emissivity_def2)
         emissivity_def.arrange(DOWN, aligned_edge=LEFT, buff=0.2)
         emissivity_def.next_to(emissivity_title, DOWN, buff=0.3)
         
         # Tableau des valeurs d'émissivité créé manuellement
-        table_title = Text("Valeurs d'émissivité typiques:", font_size=28)
+        table_title = cached_text("Valeurs d'émissivité typiques:", font_size=28)
         table_title.next_to(emissivity_def, DOWN, buff=0.4)
         
         table_data = [
@@ -300,28 +363,9 @@ class ImprovedMicrowaveRemoteSensing(Scene):
             ["Neige sèche", "0.65-0.83"]
         ]
         
-        # Créer le tableau manuellement
-        table_group = VGroup()
-        cell_width = 3.0
-        cell_height = 0.5
-        rows = len(table_data)
-        cols = len(table_data[0])
-        
-        for i in range(rows):
-            for j in range(cols):
-                cell = Rectangle(
-                    width=cell_width, 
-                    height=cell_height,
-                    stroke_width=2,
-                    fill_opacity=0.1 if i == 0 else 0
-                )
-                cell.move_to(RIGHT * (j * cell_width - (cols-1) * cell_width / 2) + 
-                             DOWN * (i * cell_height - (rows-1) * cell_height / 2 + 4))
-                
-                text = Text(table_data[i][j], font_size=20)
-                text.move_to(cell.get_center())
-                
-                table_group.add(cell, text)
+        # Créer le tableau (grille et textes regroupés)
+        table_group = GridTable(table_data, cell_width=3.0, cell_height=0.5, font_size=20)
+        table_group.shift(DOWN * 4)
         
         self.play(Write(emissivity_title))
         self.play(Write(emissivity_def), run_time=1.5)
@@ -345,7 +389,7 @@ class ImprovedMicrowaveRemoteSensing(Scene):
         ocean = Rectangle(width=10, height=1.5, fill_opacity=0.8, fill_color=WATER_COLOR, stroke_color=WHITE)
         ocean.to_edge(DOWN, buff=1)
         
-        ocean_label = Text("Océan Arctique", font_size=24, color=WHITE)
+        ocean_label = cached_text("Océan Arctique", font_size=24, color=WHITE)
         ocean_label.next_to(ocean, UP, buff=0.2)
         
         # Créer les axes pour les graphiques
@@ -359,48 +403,33 @@ class ImprovedMicrowaveRemoteSensing(Scene):
         axes.to_edge(LEFT, buff=1)
         axes.shift(UP*0.5)
         
-        x_label = Text("Temps (jours)", font_size=20)
+        x_label = cached_text("Temps (jours)", font_size=20)
         x_label.next_to(axes, DOWN, buff=0.2)
         
-        y_label = Text("Valeur normalisée", font_size=20)
+        y_label = cached_text("Valeur normalisée", font_size=20)
         y_label.next_to(axes, LEFT, buff=0.2)
         y_label.rotate(PI/2)
         
-        # Définir les fonctions pour les courbes
-        def emissivity_function(x):
-            if x < 3:
-                return 0.55  # Émissivité de l'eau
-            elif x < 6:
-                return 0.55 + (0.92 - 0.55) * (x - 3) / 3  # Transition
-            else:
-                return 0.92  # Émissivité de la glace
-        
-        def temp_physical(x):
-            # Température physique qui diminue légèrement pendant le gel
-            if x < 3:
-                return 1  # Température initiale
-            elif x < 6:
-                return 1 - 0.2 * (x - 3) / 3  # Diminution pendant la transition
-            else:
-                return 0.8  # Température stabilisée
-        
-        def temp_brightness(x):
-            # Température de brillance = émissivité * température physique
-            return emissivity_function(x) * temp_physical(x)
-        
-        # Tracer les courbes
-        emissivity_curve = axes.plot(emissivity_function, x_range=[0, 10], color=GREEN)
-        temp_phys_curve = axes.plot(temp_physical, x_range=[0, 10], color=BLUE)
-        tb_curve = axes.plot(temp_brightness, x_range=[0, 10], color=RED)
+        # Tracer les courbes (émissivité, température physique qui diminue
+        # pendant le gel, et Tᴮ = émissivité * température physique)
+        emissivity_curve = plot_piecewise(axes, emissivity, FREEZE_BREAKPOINTS, x_range=[0, 10], color=GREEN)
+        temp_phys_curve = plot_piecewise(
+            axes, lambda x: physical_temperature(x, cooling=MICROWAVE_COOLING),
+            FREEZE_BREAKPOINTS, x_range=[0, 10], color=BLUE
+        )
+        tb_curve = plot_piecewise(
+            axes, lambda x: brightness_temperature(x, cooling=MICROWAVE_COOLING),
+            FREEZE_BREAKPOINTS, x_range=[0, 10], degree=2, color=RED
+        )
         
         # Étiquettes pour les courbes
-        emissivity_label = Text("Émissivité (ε)", font_size=20, color=GREEN).next_to(axes, RIGHT, buff=0.2)
+        emissivity_label = cached_text("Émissivité (ε)", font_size=20, color=GREEN).next_to(axes, RIGHT, buff=0.2)
         emissivity_label.shift(UP*1)
         
-        temp_phys_label = Text("Température physique", font_size=20, color=BLUE).next_to(axes, RIGHT, buff=0.2)
+        temp_phys_label = cached_text("Température physique", font_size=20, color=BLUE).next_to(axes, RIGHT, buff=0.2)
         temp_phys_label.shift(UP*0.5)
         
-        tb_label = Text("Température de brillance (Tᴮ)", font_size=20, color=RED).next_to(axes, RIGHT, buff=0.2)
+        tb_label = cached_text("Température de brillance (Tᴮ)", font_size=20, color=RED).next_to(axes, RIGHT, buff=0.2)
         tb_label.shift(UP*0)
         
         # Animer l'apparition du système physique
@@ -430,64 +459,50 @@ class ImprovedMicrowaveRemoteSensing(Scene):
         self.wait(1)
         
         # Animation des micro-ondes
-        def create_microwave(start, end, num_waves=4):
-            path = Line(start, end)
-            waves = []
-            for i in range(num_waves):
-                t = i / (num_waves - 1) if num_waves > 1 else 0.5
-                point = path.point_from_proportion(t)
-                wave = Circle(radius=0.1, color=WAVE_COLOR, fill_opacity=0, stroke_width=2)
-                wave.move_to(point)
-                waves.append(wave)
-            return VGroup(*waves)
-        
-        def animate_microwave_propagation(waves, direction, run_time=1.5):
-            animations = []
-            for wave in waves:
-                animations.append(
-                    wave.animate.scale(3).set_opacity(0).shift(direction)
-                )
-            self.play(*animations, run_time=run_time)
-        
         # Point de départ des micro-ondes (surface)
         surface_point = ocean.get_top() + UP*0.2
         
         # Créer et animer les micro-ondes à différents moments
         # 1. Eau de mer (émissivité faible)
-        microwaves_water = create_microwave(surface_point, satellite.get_center())
-        self.play(FadeIn(microwaves_water))
-        animate_microwave_propagation(microwaves_water, UP*2)
+        # Émission continue, d'autant plus dense que l'émissivité est forte
+        microwaves_water = WaveEmitter(
+            surface_point, satellite.get_center(),
+            rate=MICROWAVE_RATE * WATER_EMISSIVITY, spread=1.0, color=WAVE_COLOR
+        )
+        self.add(microwaves_water.start())
+        self.wait(2)
+        microwaves_water.stop()
+        self.wait(microwaves_water.lifetime)
+        self.remove(microwaves_water)
         
         # Animation du gel progressif
-        ice_formation = Rectangle(
-            width=0, height=1.5, 
-            fill_opacity=0.8, 
-            fill_color=ICE_COLOR,
-            stroke_width=0
-        )
-        ice_formation.align_to(ocean, DOWN+LEFT)
+        ice_formation = FreezingSurface(ocean.width, ocean.height, color=ICE_COLOR, opacity=0.8)
+        ice_formation.move_to(ocean)
+        self.add(ice_formation)
         
-        self.play(
-            GrowFromPoint(ice_formation, ice_formation.get_center(), rate_func=linear),
-            ice_formation.animate.stretch_to_fit_width(10),
-            run_time=5
-        )
+        self.play(AdvanceIceFront(ice_formation, ocean.width), run_time=5)
         
         # 2. Glace de mer (émissivité élevée)
-        microwaves_ice = create_microwave(surface_point, satellite.get_center(), num_waves=8)
-        self.play(FadeIn(microwaves_ice))
-        animate_microwave_propagation(microwaves_ice, UP*2)
+        microwaves_ice = WaveEmitter(
+            surface_point, satellite.get_center(),
+            rate=MICROWAVE_RATE * ICE_EMISSIVITY, spread=1.0, color=WAVE_COLOR
+        )
+        self.add(microwaves_ice.start())
+        self.wait(2)
+        microwaves_ice.stop()
+        self.wait(microwaves_ice.lifetime)
+        self.remove(microwaves_ice)
         
         # Annotations sur le graphique pour expliquer le phénomène - utilisez Text
         explanation_box = Rectangle(width=6, height=2, fill_opacity=0.7, fill_color=BLACK, stroke_color=YELLOW, stroke_width=2)
         explanation_box.to_corner(DOWN + RIGHT, buff=0.5)
         
-        explanation_title = Text("Phénomène observé :", font_size=28, color=YELLOW_C)
+        explanation_title = cached_text("Phénomène observé :", font_size=28, color=YELLOW_C)
         explanation_title.next_to(explanation_box, UP, buff=0.2)
         
-        explanation_text1 = Text("• Émissivité de l'eau faible (0.45-0.65)", font_size=24)
-        explanation_text2 = Text("• Émissivité de la glace élevée (≈ 0.92)", font_size=24)
-        explanation_text3 = Text("• Tᴮ augmente malgré une température physique constante/diminuant", font_size=24)
+        explanation_text1 = cached_text("• Émissivité de l'eau faible (0.45-0.65)", font_size=24)
+        explanation_text2 = cached_text("• Émissivité de la glace élevée (≈ 0.92)", font_size=24)
+        explanation_text3 = cached_text("• Tᴮ augmente malgré une température physique constante/diminuant", font_size=24)
         
         explanation_text = VGroup(explanation_text1, explanation_text2, explanation_text3)
         explanation_text.arrange(DOWN, aligned_edge=LEFT, buff=0.2)
@@ -506,7 +521,7 @@ class ImprovedMicrowaveRemoteSensing(Scene):
         self.wait(2)
         
         # Conclusion finale
-        conclusion = Text(
+        conclusion = cached_text(
             "La télédétection micro-onde permet de surveiller les changements\n"
             "des surfaces glacées en Arctique même par temps nuageux ou la nuit.",
             font_size=30,
@@ -522,3 +537,71 @@ class ImprovedMicrowaveRemoteSensing(Scene):
             run_time=2
         )
         self.wait(3)
+
+
+class SeaIceConcentrationRetrieval(Scene):
+    """
+    Concentration de la glace de mer calculée par NASA Team et Bootstrap sur
+    des grilles de Tᴮ (448 × 304 × 7 canaux) pendant dix jours d'englacement
+    """
+    def setup(self):
+        prefetch_text(self)
+
+    def construct(self):
+        # Titre
+        title = cached_text("Concentration de la glace de mer", font_size=40)
+        subtitle = cached_text("Grilles de Tᴮ de 448 × 304 pixels et 7 canaux", font_size=26, color=BLUE)
+        VGroup(title, subtitle).arrange(DOWN, buff=0.2).to_edge(UP, buff=0.4)
+
+        self.play(Write(title), FadeIn(subtitle), run_time=1.5)
+
+        # Une grille de Tᴮ par image, inversée par les deux algorithmes ;
+        # couleurs de l'eau libre (0 %) à la glace consolidée (100 %)
+        day = ValueTracker(0)
+        algorithms = ("nasa_team", "bootstrap")
+        first_grid = synthetic_freeze_up(0)
+        maps = Group(*[
+            RasterMap(retrieve(first_grid, algorithm), colors=["#0C2D48", "#4FA3D1", "#B3E5FC", WHITE], height=4.5)
+            for algorithm in algorithms
+        ])
+        maps.arrange(RIGHT, buff=1.5).next_to(subtitle, DOWN, buff=0.6)
+
+        frames = VGroup(*[SurroundingRectangle(image, color=WHITE, buff=0, stroke_width=2) for image in maps])
+        map_labels = VGroup(
+            cached_text("NASA Team (PR, GR)", font_size=24, color=YELLOW),
+            cached_text("Bootstrap (19V, 37V)", font_size=24, color=YELLOW),
+        )
+        for label, image in zip(map_labels, maps):
+            label.next_to(image, UP, buff=0.15)
+
+        def show_day(group):
+            grid = synthetic_freeze_up(day.get_value())
+            for image, algorithm in zip(group, algorithms):
+                image.update_field(retrieve(grid, algorithm))
+
+        day_label = cached_text("Jour", font_size=24)
+        day_counter = DecimalNumber(0, num_decimal_places=1, font_size=30)
+        day_counter.add_updater(lambda m: m.set_value(day.get_value()))
+        day_display = VGroup(day_label, day_counter).arrange(RIGHT, buff=0.2)
+        day_display.next_to(maps, DOWN, buff=0.3)
+
+        self.play(FadeIn(maps), Create(frames), Write(map_labels), run_time=1.5)
+        self.add(day_display)
+        maps.add_updater(show_day)
+        self.play(day.animate.set_value(10), run_time=8, rate_func=linear)
+        maps.clear_updaters()
+        day_counter.clear_updaters()
+        self.wait(1)
+
+        # Écart entre les deux algorithmes sur la dernière grille
+        final_grid = synthetic_freeze_up(10)
+        difference = np.abs(retrieve(final_grid, "nasa_team") - retrieve(final_grid, "bootstrap")).mean()
+        note = cached_text(
+            f"Écart moyen entre les deux algorithmes : {100 * difference:.1f} %",
+            font_size=24, color=YELLOW
+        )
+        note.next_to(day_display, DOWN, buff=0.2)
+        self.play(Write(note), run_time=1.5)
+        self.wait(2)
+
+        self.play(*[FadeOut(mob) for mob in self.mobjects], run_time=1.5)
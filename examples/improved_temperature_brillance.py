@@ -1,17 +1,30 @@
 from manim import *
 
-class BrightnessTemperatureEvolutionImproved(Scene):
+from physics.freezing import (
+    FREEZE_BREAKPOINTS, emissivity, physical_temperature, brightness_temperature
+)
+from rendering.plotting import plot_piecewise
+from rendering.layers import LayeredScene
+from rendering.prefetch import prefetch_text
+from rendering.raster import AdvanceIceFront, FreezingSurface
+from rendering.text import cached_text
+
+class BrightnessTemperatureEvolutionImproved(LayeredScene):
     """
     Version améliorée de l'animation sur l'évolution de la température de brillance
     avec une meilleure disposition des éléments et clarté visuelle
     """
+    def setup(self):
+        # Textes et formules préparés en arrière-plan pendant les premières animations
+        prefetch_text(self)
+
     def construct(self):
         # Configuration de la scène avec fond noir
         self.camera.background_color = BLACK
         
         # Titre avec style amélioré
-        title = Text("Évolution de la Température de Brillance", font_size=48, color=WHITE)
-        subtitle = Text("Pendant le gel de l'eau salée en Arctique", font_size=36, color=BLUE_B)
+        title = cached_text("Évolution de la Température de Brillance", font_size=48, color=WHITE)
+        subtitle = cached_text("Pendant le gel de l'eau salée en Arctique", font_size=36, color=BLUE_B)
         
         title_group = VGroup(title, subtitle).arrange(DOWN, buff=0.3)
         
@@ -23,6 +36,8 @@ class BrightnessTemperatureEvolutionImproved(Scene):
             title_group.animate.scale(0.7).to_edge(UP, buff=0.5),
             run_time=1
         )
+        # Éléments terminés : rastérisés une seule fois dans la couche statique
+        self.add_static(title_group)
         
         # Configuration des axes avec meilleur positionnement
         axes = Axes(
@@ -45,71 +60,68 @@ class BrightnessTemperatureEvolutionImproved(Scene):
         
         axes_labels = VGroup(x_label, y_label)
         
-        # Définition scientifique des fonctions pour les courbes avec séparation claire
-        def physical_temperature(x):
-            # Température physique avec légère diminution pendant la transition
-            if x < 3:
-                return 1.0  # Eau à température initiale
-            elif x < 6:
-                return 1.0 - 0.1 * (x - 3) / 3  # Légère baisse pendant la transition
-            else:
-                return 0.9  # Eau gelée (légèrement plus froide)
-        
-        def emissivity(x):
-            # Émissivité qui change pendant la transition eau-glace
-            # Valeurs basées sur des mesures scientifiques
-            if x < 3:
-                return 0.55  # Émissivité de l'eau de mer (19-37 GHz)
-            elif x < 6:
-                return 0.55 + (0.92 - 0.55) * (x - 3) / 3  # Transition progressive
-            else:
-                return 0.92  # Émissivité de la nouvelle glace de mer
-        
-        def brightness_temperature(x):
-            # Température de brillance = émissivité * température physique
-            return emissivity(x) * physical_temperature(x)
-        
         # Création des courbes avec épaisseur et couleurs distinctes
-        temp_phys_curve = axes.plot(
+        temp_phys_curve = plot_piecewise(
+            axes,
             physical_temperature,
+            FREEZE_BREAKPOINTS,
             x_range=[0, 10],
             color=BLUE_C,
             stroke_width=4,
         )
         
-        emissivity_curve = axes.plot(
-            emissivity,
+        # Émissivités de Fresnel de l'eau et de la glace (AMSR2, 36.5 GHz, 55°)
+        emissivity_curve = plot_piecewise(
+            axes,
+            lambda x: emissivity(x, polarization="V"),
+            FREEZE_BREAKPOINTS,
             x_range=[0, 10],
             color=GREEN_D,
             stroke_width=4,
         )
         
-        tb_curve = axes.plot(
-            brightness_temperature,
+        emissivity_h_curve = plot_piecewise(
+            axes,
+            lambda x: emissivity(x, polarization="H"),
+            FREEZE_BREAKPOINTS,
             x_range=[0, 10],
+            color=GREEN_B,
+            stroke_width=3,
+        )
+        
+        tb_curve = plot_piecewise(
+            axes,
+            lambda x: brightness_temperature(x, polarization="V"),
+            FREEZE_BREAKPOINTS,
+            x_range=[0, 10],
+            degree=2,
             color=RED_C,
             stroke_width=4,
         )
         
         # Placement plus clair des étiquettes de courbes
-        temp_phys_label = Text("Température physique", font_size=28, color=BLUE_C)
+        temp_phys_label = cached_text("Température physique", font_size=28, color=BLUE_C)
         temp_phys_label.to_edge(RIGHT).shift(UP*1.5 + LEFT*3)
         
-        emissivity_label = Text("Émissivité (ε)", font_size=28, color=GREEN_D)
+        emissivity_label = cached_text("Émissivité V (ε)", font_size=28, color=GREEN_D)
         emissivity_label.to_edge(RIGHT).shift(UP*0.5 + LEFT*5)
         
-        tb_label = Text("Température de brillance (Tᴮ)", font_size=28, color=RED_C)
+        emissivity_h_label = cached_text("Émissivité H", font_size=24, color=GREEN_B)
+        emissivity_h_label.next_to(emissivity_label, DOWN, buff=0.15, aligned_edge=LEFT)
+        
+        tb_label = cached_text("Température de brillance (Tᴮ)", font_size=28, color=RED_C)
         tb_label.to_edge(RIGHT).shift(DOWN*0.5 + LEFT*2.5)
         
         # Animation progressive avec pauses pour meilleure lisibilité
         self.play(Create(axes), Write(axes_labels), run_time=1.5)
+        self.add_static(axes, axes_labels)
         self.wait(0.5)
         
         # Visualisation de l'océan et de la formation de glace
         ocean = Rectangle(width=9, height=1.2, fill_opacity=0.8, fill_color="#0C2D48", stroke_color=BLUE_E)
         ocean.next_to(axes, DOWN, buff=1.75)
         
-        ocean_label = Text("Océan Arctique", font_size=28, color=BLUE_E)
+        ocean_label = cached_text("Océan Arctique", font_size=28, color=BLUE_E)
         ocean_label.next_to(ocean, UP, buff=0.2)
         
         self.play(
@@ -117,15 +129,16 @@ class BrightnessTemperatureEvolutionImproved(Scene):
             Write(ocean_label),
             run_time=1
         )
+        self.add_static(ocean, ocean_label)
         
         # Textes d'explication scientifique avec positionnement clair
-        phase_water = Text("Phase liquide: émissivité basse", font_size=22, color=WHITE)
+        phase_water = cached_text("Phase liquide: émissivité basse", font_size=22, color=WHITE)
         phase_water.next_to(ocean, DOWN, buff=0.2).align_to(ocean, LEFT).shift(RIGHT*1.5)
         
-        phase_transition = Text("Transition: formation de glace", font_size=22, color=WHITE)
+        phase_transition = cached_text("Transition: formation de glace", font_size=22, color=WHITE)
         phase_transition.next_to(phase_water, RIGHT, buff=1)
         
-        phase_ice = Text("Phase solide: émissivité élevée", font_size=22, color=WHITE)
+        phase_ice = cached_text("Phase solide: émissivité élevée", font_size=22, color=WHITE)
         phase_ice.next_to(phase_transition, RIGHT, buff=1)
         
         # Animation de la courbe de température physique
@@ -134,17 +147,22 @@ class BrightnessTemperatureEvolutionImproved(Scene):
             Write(temp_phys_label),
             run_time=1.5
         )
+        self.add_static(temp_phys_curve, temp_phys_label)
         self.wait(0.5)
         
         # Animation de la courbe d'émissivité
         self.play(
             Create(emissivity_curve),
             Write(emissivity_label),
+            Create(emissivity_h_curve),
+            Write(emissivity_h_label),
             run_time=1.5
         )
+        self.add_static(emissivity_curve, emissivity_label, emissivity_h_curve, emissivity_h_label)
         
         # Ajout du texte de la phase liquide
         self.play(Write(phase_water), run_time=1)
+        self.add_static(phase_water)
         self.wait(0.5)
         
         # Animation de la courbe de température de brillance
@@ -153,32 +171,33 @@ class BrightnessTemperatureEvolutionImproved(Scene):
             Write(tb_label),
             run_time=2
         )
+        self.add_static(tb_curve, tb_label)
         self.wait(1)
         
         # Visualisation de la formation de glace avec transition claire
-        ice_formation = Rectangle(width=0, height=1.2, fill_opacity=0.9, fill_color="#B3E5FC", stroke_width=0)
-        ice_formation.align_to(ocean, DOWN+LEFT)
+        ice_formation = FreezingSurface(ocean.width, ocean.height).move_to(ocean)
+        self.add(ice_formation)
         
         self.play(
-            GrowFromPoint(ice_formation, ice_formation.get_center(), rate_func=rate_functions.linear),
-            ice_formation.animate.stretch_to_fit_width(3),
+            AdvanceIceFront(ice_formation, 3),
             Write(phase_transition),
             run_time=2
         )
         self.wait(0.3)
         
         self.play(
-            ice_formation.animate.stretch_to_fit_width(9),
+            AdvanceIceFront(ice_formation, ocean.width),
             Write(phase_ice),
             run_time=3
         )
+        self.add_static(ice_formation, phase_transition, phase_ice)
         self.wait(1)
         
         # Formules scientifiques dans un cadre bien délimité et positionné clairement
         formula_box = Rectangle(width=6, height=3, fill_opacity=0.8, fill_color=BLACK, stroke_color=YELLOW, stroke_width=3)
         formula_box.to_edge(LEFT, buff=0.5).shift(UP*2.5)
         
-        formula_title = Text("Équations fondamentales", font_size=30, color=YELLOW)
+        formula_title = cached_text("Équations fondamentales", font_size=30, color=YELLOW)
         formula_title.next_to(formula_box.get_top(), DOWN, buff=0.2)
         
         tb_formula = MathTex(
@@ -200,27 +219,30 @@ class BrightnessTemperatureEvolutionImproved(Scene):
             Write(formula_title),
             run_time=1
         )
+        self.add_static(formula_box, formula_title)
         
         self.play(
             Write(tb_formula),
             run_time=1
         )
+        self.add_static(tb_formula)
         
         self.play(
             Write(explanations),
             run_time=1.5
         )
+        self.add_static(explanations)
         self.wait(1)
         
         # Boîte d'implications scientifiques bien positionnée
         implications_box = Rectangle(width=6, height=3, fill_opacity=0.8, fill_color=BLACK, stroke_color=BLUE, stroke_width=3)
         implications_box.to_edge(RIGHT, buff=0.5).shift(UP*2.5)
         
-        implications_title = Text("Conséquences", font_size=30, color=BLUE)
+        implications_title = cached_text("Conséquences", font_size=30, color=BLUE)
         implications_title.next_to(implications_box.get_top(), DOWN, buff=0.2)
         
         implications_bullet1 = MathTex(r"\bullet~", r"\text{Augmentation de}~T_B~\text{malgré une}~T_{phys}~\text{constante}", font_size=20)
-        implications_bullet2 = MathTex(r"\bullet~", r"\text{Émissivité:}~0.45\text{-}0.65~(\text{eau})~\rightarrow~0.92~(\text{glace})", font_size=20)
+        implications_bullet2 = MathTex(r"\bullet~", r"\text{Émissivité eau}~\rightarrow~\text{glace :}~V~0.73 \rightarrow 0.98,~H~0.35 \rightarrow 0.72", font_size=20)
         implications_bullet3 = MathTex(r"\bullet~", r"\text{Permettra la cartographie de l'étendue de glace}", font_size=20)
         
         implications_bullets = VGroup(implications_bullet1, implications_bullet2, implications_bullet3)
@@ -232,15 +254,17 @@ class BrightnessTemperatureEvolutionImproved(Scene):
             Write(implications_title),
             run_time=1
         )
+        self.add_static(implications_box, implications_title)
         
         self.play(
             Write(implications_bullets),
             run_time=2
         )
+        self.add_static(implications_bullets)
         self.wait(1)
         
         # Message final distinct et bien positionné
-        final_message = Text(
+        final_message = cached_text(
             "La température de brillance augmente significativement\n"
             "en raison de l'augmentation de l'émissivité lors\n"
             "de la formation de glace.",
@@ -1,7 +1,39 @@
 from manim import *
 import numpy as np
 
-class MicrowaveRemoteSensing(Scene):
+from physics.freezing import (
+    FREEZE_BREAKPOINTS, ICE_EMISSIVITY, WATER_EMISSIVITY,
+    emissivity, physical_temperature, brightness_temperature,
+)
+from physics.growth import IceGrowth, freeze_up_series
+from rendering.coverage import AccumulateCoverage, CoverageMap
+from rendering.emission import WaveEmitter
+from rendering.layers import LayeredScene
+from rendering.orbit import OrbitMotion
+from rendering.plotting import plot_piecewise
+from rendering.prefetch import prefetch_text
+from rendering.raster import AdvanceIceFront, FreezingSurface, RasterMap, StreamField
+from rendering.text import cached_text
+
+# Baisse de température physique plus marquée dans les scènes satellite
+MICROWAVE_COOLING = 0.2
+
+# Anneaux micro-onde émis par seconde pour une émissivité de 1
+MICROWAVE_RATE = 80
+
+# Jours d'orbite simulés pour la carte de couverture
+COVERAGE_DAYS = 3
+
+# Simulation du gel : grille (lignes, colonnes), durée et intervalle entre images (jours)
+FREEZE_UP_GRID = (80, 360)
+FREEZE_UP_DAYS = 10
+FREEZE_UP_INTERVAL = 0.05
+
+class MicrowaveRemoteSensing(LayeredScene):
+    def setup(self):
+        # Textes et formules préparés en arrière-plan pendant les premières animations
+        prefetch_text(self)
+
     def construct(self):
         # Couleurs personnalisées pour rendre l'animation plus professionnelle
         WATER_COLOR = "#0C2D48"
@@ -10,8 +42,8 @@ class MicrowaveRemoteSensing(Scene):
         WAVE_COLOR = "#FFD700"
         
         # Titre principal avec animation plus sophistiquée
-        title = Text("Télédétection Micro-onde en Arctique", font_size=48)
-        subtitle = Text("Principes physiques et applications", font_size=32, color=BLUE_C)
+        title = cached_text("Télédétection Micro-onde en Arctique", font_size=48)
+        subtitle = cached_text("Principes physiques et applications", font_size=32, color=BLUE_C)
         subtitle.next_to(title, DOWN)
         
         title_group = VGroup(title, subtitle)
@@ -27,7 +59,7 @@ class MicrowaveRemoteSensing(Scene):
         )
         
         # Introduction au concept de température de brillance
-        tb_def = Text("Température de Brillance (Tᴮ)", font_size=36, color=YELLOW_C)
+        tb_def = cached_text("Température de Brillance (Tᴮ)", font_size=36, color=YELLOW_C)
         tb_def.next_to(title_group, DOWN, buff=0.5)
         
         tb_equation = MathTex(
@@ -60,7 +92,7 @@ class MicrowaveRemoteSensing(Scene):
         )
         
         # Expliquer le concept d'émissivité
-        emissivity_title = Text("Émissivité (ε)", font_size=36, color=GREEN_C)
+        emissivity_title = cached_text("Émissivité (ε)", font_size=36, color=GREEN_C)
         emissivity_title.next_to(title_group, DOWN, buff=0.5)
         
         emissivity_def = BulletedList(
@@ -102,7 +134,7 @@ class MicrowaveRemoteSensing(Scene):
         ocean = Rectangle(width=10, height=1.5, fill_opacity=0.8, fill_color=WATER_COLOR, stroke_color=WHITE)
         ocean.to_edge(DOWN, buff=1)
         
-        ocean_label = Text("Océan Arctique", font_size=24, color=WHITE)
+        ocean_label = cached_text("Océan Arctique", font_size=24, color=WHITE)
         ocean_label.next_to(ocean, UP, buff=0.2)
         
         # Créer les axes pour les graphiques
@@ -119,41 +151,26 @@ class MicrowaveRemoteSensing(Scene):
         x_label = axes.get_x_axis_label("Temps (jours)", edge=DOWN, direction=DOWN)
         y_label = axes.get_y_axis_label("Valeur normalisée")
         
-        # Définir les fonctions pour les courbes
-        def emissivity_function(x):
-            if x < 3:
-                return 0.55  # Émissivité de l'eau
-            elif x < 6:
-                return 0.55 + (0.92 - 0.55) * (x - 3) / 3  # Transition
-            else:
-                return 0.92  # Émissivité de la glace
-        
-        def temp_physical(x):
-            # Température physique qui diminue légèrement pendant le gel
-            if x < 3:
-                return 1  # Température initiale
-            elif x < 6:
-                return 1 - 0.2 * (x - 3) / 3  # Diminution pendant la transition
-            else:
-                return 0.8  # Température stabilisée
-        
-        def temp_brightness(x):
-            # Température de brillance = émissivité * température physique
-            return emissivity_function(x) * temp_physical(x)
-        
-        # Tracer les courbes
-        emissivity_curve = axes.plot(emissivity_function, x_range=[0, 10], color=GREEN)
-        temp_phys_curve = axes.plot(temp_physical, x_range=[0, 10], color=BLUE)
-        tb_curve = axes.plot(temp_brightness, x_range=[0, 10], color=RED)
+        # Tracer les courbes (émissivité, température physique qui diminue
+        # pendant le gel, et Tᴮ = émissivité * température physique)
+        emissivity_curve = plot_piecewise(axes, emissivity, FREEZE_BREAKPOINTS, x_range=[0, 10], color=GREEN)
+        temp_phys_curve = plot_piecewise(
+            axes, lambda x: physical_temperature(x, cooling=MICROWAVE_COOLING),
+            FREEZE_BREAKPOINTS, x_range=[0, 10], color=BLUE
+        )
+        tb_curve = plot_piecewise(
+            axes, lambda x: brightness_temperature(x, cooling=MICROWAVE_COOLING),
+            FREEZE_BREAKPOINTS, x_range=[0, 10], degree=2, color=RED
+        )
         
         # Étiquettes pour les courbes
-        emissivity_label = Text("Émissivité (ε)", font_size=20, color=GREEN).next_to(axes, RIGHT, buff=0.2)
+        emissivity_label = cached_text("Émissivité (ε)", font_size=20, color=GREEN).next_to(axes, RIGHT, buff=0.2)
         emissivity_label.shift(UP*1)
         
-        temp_phys_label = Text("Température physique", font_size=20, color=BLUE).next_to(axes, RIGHT, buff=0.2)
+        temp_phys_label = cached_text("Température physique", font_size=20, color=BLUE).next_to(axes, RIGHT, buff=0.2)
         temp_phys_label.shift(UP*0.5)
         
-        tb_label = Text("Température de brillance (Tᴮ)", font_size=20, color=RED).next_to(axes, RIGHT, buff=0.2)
+        tb_label = cached_text("Température de brillance (Tᴮ)", font_size=20, color=RED).next_to(axes, RIGHT, buff=0.2)
         tb_label.shift(UP*0)
         
         # Animer l'apparition du système physique
@@ -183,57 +200,43 @@ class MicrowaveRemoteSensing(Scene):
         self.wait(1)
         
         # Animation des micro-ondes
-        def create_microwave(start, end, num_waves=4):
-            path = Line(start, end)
-            waves = []
-            for i in range(num_waves):
-                t = i / (num_waves - 1) if num_waves > 1 else 0.5
-                point = path.point_from_proportion(t)
-                wave = Circle(radius=0.1, color=WAVE_COLOR, fill_opacity=0, stroke_width=2)
-                wave.move_to(point)
-                waves.append(wave)
-            return VGroup(*waves)
-        
-        def animate_microwave_propagation(waves, direction, run_time=1.5):
-            animations = []
-            for wave in waves:
-                animations.append(
-                    wave.animate.scale(3).set_opacity(0).shift(direction)
-                )
-            self.play(*animations, run_time=run_time)
-        
         # Point de départ des micro-ondes (surface)
         surface_point = ocean.get_top() + UP*0.2
         
         # Créer et animer les micro-ondes à différents moments
         # 1. Eau de mer (émissivité faible)
-        microwaves_water = create_microwave(surface_point, satellite.get_center())
-        self.play(FadeIn(microwaves_water))
-        animate_microwave_propagation(microwaves_water, UP*2)
+        # Émission continue, d'autant plus dense que l'émissivité est forte
+        microwaves_water = WaveEmitter(
+            surface_point, satellite.get_center(),
+            rate=MICROWAVE_RATE * WATER_EMISSIVITY, spread=1.0, color=WAVE_COLOR
+        )
+        self.add(microwaves_water.start())
+        self.wait(2)
+        microwaves_water.stop()
+        self.wait(microwaves_water.lifetime)
+        self.remove(microwaves_water)
         
         # Animation du gel progressif
-        ice_formation = Rectangle(
-            width=0, height=1.5, 
-            fill_opacity=0.8, 
-            fill_color=ICE_COLOR,
-            stroke_width=0
-        )
-        ice_formation.align_to(ocean, DOWN+LEFT)
+        ice_formation = FreezingSurface(ocean.width, ocean.height, color=ICE_COLOR, opacity=0.8)
+        ice_formation.move_to(ocean)
+        self.add(ice_formation)
         
-        self.play(
-            GrowFromPoint(ice_formation, ice_formation.get_center(), rate_func=linear),
-            ice_formation.animate.stretch_to_fit_width(10),
-            run_time=5
-        )
+        self.play(AdvanceIceFront(ice_formation, ocean.width), run_time=5)
         
         # 2. Glace de mer (émissivité élevée)
-        microwaves_ice = create_microwave(surface_point, satellite.get_center(), num_waves=8)
-        self.play(FadeIn(microwaves_ice))
-        animate_microwave_propagation(microwaves_ice, UP*2)
+        microwaves_ice = WaveEmitter(
+            surface_point, satellite.get_center(),
+            rate=MICROWAVE_RATE * ICE_EMISSIVITY, spread=1.0, color=WAVE_COLOR
+        )
+        self.add(microwaves_ice.start())
+        self.wait(2)
+        microwaves_ice.stop()
+        self.wait(microwaves_ice.lifetime)
+        self.remove(microwaves_ice)
         
         # Annotations sur le graphique pour expliquer le phénomène
         explanation_box = VGroup(
-            Text("Phénomène observé :", font_size=28, color=YELLOW_C),
+            cached_text("Phénomène observé :", font_size=28, color=YELLOW_C),
             BulletedList(
                 "Émissivité de l'eau faible (0.45-0.65)",
                 "Émissivité de la glace élevée (≈ 0.92)",
@@ -248,7 +251,7 @@ class MicrowaveRemoteSensing(Scene):
         self.wait(1)
         
         # Applications pratiques
-        applications_title = Text("Applications en télédétection", font_size=32, color=YELLOW_C)
+        applications_title = cached_text("Applications en télédétection", font_size=32, color=YELLOW_C)
         applications_title.to_edge(RIGHT).shift(UP*0.5)
         
         applications = BulletedList(
@@ -272,7 +275,7 @@ class MicrowaveRemoteSensing(Scene):
         self.wait(1)
         
         # Fréquences utilisées en télédétection micro-onde
-        frequencies_title = Text("Fréquences courantes", font_size=28, color=YELLOW_C)
+        frequencies_title = cached_text("Fréquences courantes", font_size=28, color=YELLOW_C)
         frequencies_title.next_to(applications, DOWN, buff=0.5)
         
         frequencies = BulletedList(
@@ -296,7 +299,7 @@ class MicrowaveRemoteSensing(Scene):
         self.wait(2)
         
         # Conclusion finale
-        conclusion = Text(
+        conclusion = cached_text(
             "La télédétection micro-onde permet de surveiller les changements\n"
             "des surfaces glacées en Arctique même par temps nuageux ou la nuit.",
             font_size=30,
@@ -313,6 +316,9 @@ class MicrowaveRemoteSensing(Scene):
 
 
 class BrightnessTemperatureEvolution(Scene):
+    def setup(self):
+        prefetch_text(self)
+
     def construct(self):
         # Titre en français avec style amélioré
         title = Tex(r"\textbf{Évolution de la Température de Brillance}", font_size=48)
@@ -347,47 +353,32 @@ class BrightnessTemperatureEvolution(Scene):
         
         axes_labels = VGroup(x_label, y_label)
         
-        # Définition scientifique des fonctions pour les courbes
-        def physical_temperature(x):
-            # Température physique avec légère diminution pendant la transition
-            if x < 3:
-                return 1.0  # Eau à température initiale
-            elif x < 6:
-                return 1.0 - 0.1 * (x - 3) / 3  # Légère baisse pendant la transition
-            else:
-                return 0.9  # Eau gelée (légèrement plus froide)
-        
-        def emissivity(x):
-            # Émissivité qui change pendant la transition eau-glace
-            # Valeurs basées sur des mesures scientifiques
-            if x < 3:
-                return 0.55  # Émissivité de l'eau de mer (19-37 GHz)
-            elif x < 6:
-                return 0.55 + (0.92 - 0.55) * (x - 3) / 3  # Transition progressive
-            else:
-                return 0.92  # Émissivité de la nouvelle glace de mer
-        
-        def brightness_temperature(x):
-            # Température de brillance = émissivité * température physique
-            return emissivity(x) * physical_temperature(x)
-        
-        # Création des courbes avec style amélioré
-        temp_phys_curve = axes.plot(
-            physical_temperature,
+        # Courbes issues de la simulation du gel (moyennes sur la grille)
+        times, sim_emissivity, sim_temperature, sim_tb = freeze_up_series(
+            FREEZE_UP_DAYS, FREEZE_UP_INTERVAL, shape=FREEZE_UP_GRID
+        )
+        temp_phys_curve = plot_piecewise(
+            axes,
+            lambda x: np.interp(x, times, sim_temperature),
+            times,
             x_range=[0, 10],
             color=BLUE,
             stroke_width=3,
         )
         
-        emissivity_curve = axes.plot(
-            emissivity,
+        emissivity_curve = plot_piecewise(
+            axes,
+            lambda x: np.interp(x, times, sim_emissivity),
+            times,
             x_range=[0, 10],
             color=GREEN,
             stroke_width=3,
         )
         
-        tb_curve = axes.plot(
-            brightness_temperature,
+        tb_curve = plot_piecewise(
+            axes,
+            lambda x: np.interp(x, times, sim_tb),
+            times,
             x_range=[0, 10],
             color=RED,
             stroke_width=4,
@@ -459,20 +450,25 @@ class BrightnessTemperatureEvolution(Scene):
         )
         self.wait(1)
         
-        # Visualisation de la formation de glace
-        ice_formation = Rectangle(width=0, height=2, fill_opacity=0.9, fill_color="#B3E5FC", stroke_width=0)
-        ice_formation.align_to(ocean, DOWN+LEFT)
+        # Visualisation de la formation de glace : épaisseur simulée, image par image
+        ice_growth = IceGrowth(shape=FREEZE_UP_GRID)
+        ice_formation = RasterMap(
+            ice_growth.thickness, colors=["#0C2D48", "#4FA3D1", "#B3E5FC", WHITE], vmax=0.2, width=ocean.width
+        )
+        ice_formation.stretch_to_fit_height(ocean.height).move_to(ocean)
+        self.add(ice_formation)
         
+        ice_frames = (state.thickness for state in ice_growth.frames(FREEZE_UP_DAYS, FREEZE_UP_INTERVAL))
+        transition_frames = round(4 / FREEZE_UP_INTERVAL)
         self.play(
-            GrowFromPoint(ice_formation, ice_formation.get_center(), rate_func=rate_functions.linear),
-            ice_formation.animate.stretch_to_fit_width(3),
+            StreamField(ice_formation, ice_frames, transition_frames),
             Write(phase_transition),
             run_time=2
         )
         self.wait(0.3)
         
         self.play(
-            ice_formation.animate.stretch_to_fit_width(9),
+            StreamField(ice_formation, ice_frames, round(FREEZE_UP_DAYS / FREEZE_UP_INTERVAL) + 1 - transition_frames),
             Write(phase_ice),
             run_time=3
         )
@@ -561,10 +557,13 @@ class BrightnessTemperatureEvolution(Scene):
 
 
 class SatelliteMicroResonaTechnology(Scene):
+    def setup(self):
+        prefetch_text(self)
+
     def construct(self):
         # Titre avec animation élégante
-        title = Text("Télédétection Micro-onde par Satellite", font_size=48)
-        subtitle = Text("Technologie & Instrumentation", font_size=36, color=BLUE)
+        title = cached_text("Télédétection Micro-onde par Satellite", font_size=48)
+        subtitle = cached_text("Technologie & Instrumentation", font_size=36, color=BLUE)
         subtitle.next_to(title, DOWN)
         
         self.play(Write(title), run_time=1.5)
@@ -577,7 +576,7 @@ class SatelliteMicroResonaTechnology(Scene):
         )
         
         # Présentation des capteurs satellites
-        sensors_title = Text("Capteurs Satellites Principaux", font_size=36, color=YELLOW)
+        sensors_title = cached_text("Capteurs Satellites Principaux", font_size=36, color=YELLOW)
         sensors_title.next_to(subtitle, DOWN, buff=0.7)
         
         sensors_table = Table(
@@ -598,7 +597,7 @@ class SatelliteMicroResonaTechnology(Scene):
         self.wait(1.5)
         
         # Schéma de l'orbite polaire
-        orbit_title = Text("Orbite Polaire Héliosynchrone", font_size=30, color=GREEN)
+        orbit_title = cached_text("Orbite Polaire Héliosynchrone", font_size=30, color=GREEN)
         orbit_title.to_edge(LEFT, buff=1).shift(DOWN * 2)
         
         earth = Circle(radius=1.2, color=BLUE)
@@ -616,29 +615,18 @@ class SatelliteMicroResonaTechnology(Scene):
         self.play(Write(orbit_title), Create(earth), run_time=1.5)
         self.play(Create(orbit), run_time=1)
         
-        # Animation du satellite sur son orbite
-        satellite_path = ParametricFunction(
-            lambda t: earth.get_center() + np.array([
-                1.5 * np.cos(t),
-                1.6 * np.sin(t),
-                0
-            ]),
-            t_range=[0, 2*PI],
-            color=RED
-        )
-        
-        satellite.move_to(satellite_path.point_from_proportion(0))
+        # Animation du satellite sur son orbite (position calculée en forme fermée)
+        satellite.move_to(earth.get_center() + RIGHT * 1.5)
         self.add(satellite)
         
         self.play(
-            MoveAlongPath(satellite, satellite_path),
-            run_time=5,
-            rate_func=linear
+            OrbitMotion(satellite, earth.get_center(), 1.5, 1.6),
+            run_time=5
         )
         self.wait(1)
         
         # Explication du principe de fonctionnement des radiomètres
-        principle_title = Text("Principe du Radiomètre Micro-onde", font_size=30, color=YELLOW)
+        principle_title = cached_text("Principe du Radiomètre Micro-onde", font_size=30, color=YELLOW)
         principle_title.to_edge(RIGHT, buff=1).shift(DOWN * 2)
         
         principle_points = BulletedList(
@@ -666,8 +654,50 @@ class SatelliteMicroResonaTechnology(Scene):
             FadeOut(principle_points),
             run_time=1
         )
-        
-        advantages_title = Text("Avantages de la Télédétection Micro-onde", font_size=36, color=GREEN)
+
+        # Couverture cumulée : fauchées d'AMSR2 sur plusieurs jours d'orbite
+        coverage_title = cached_text("Couverture AMSR2 : fauchée de 1450 km", font_size=32, color=GREEN)
+        coverage_title.next_to(subtitle, DOWN, buff=0.5)
+
+        coverage = CoverageMap(COVERAGE_DAYS * 86400, sensor="AMSR2", width=10)
+        coverage.next_to(coverage_title, DOWN, buff=0.3)
+        coverage_frame = SurroundingRectangle(coverage, color=WHITE, buff=0, stroke_width=2)
+        ground_point = Dot(color=RED, radius=0.06).move_to(coverage.satellite_point(0))
+
+        day_label = cached_text("Jour", font_size=24)
+        day_counter = DecimalNumber(0, num_decimal_places=1, font_size=30)
+        day_counter.add_updater(lambda m: m.set_value(coverage.accumulator.time / 86400))
+        day_display = VGroup(day_label, day_counter).arrange(RIGHT, buff=0.2)
+        day_display.next_to(coverage, DOWN, buff=0.3)
+
+        self.play(Write(coverage_title), FadeIn(coverage), Create(coverage_frame), run_time=1.5)
+        self.add(ground_point, day_display)
+        self.play(
+            AccumulateCoverage(coverage, marker=ground_point),
+            run_time=COVERAGE_DAYS * 3
+        )
+        self.wait(1)
+
+        coverage_note = cached_text(
+            "Les pôles sont revus plusieurs fois par jour, l'équateur une fois",
+            font_size=24, color=YELLOW
+        )
+        coverage_note.next_to(day_display, DOWN, buff=0.2)
+        self.play(Write(coverage_note), run_time=1.5)
+        self.wait(1.5)
+
+        day_counter.clear_updaters()
+        self.play(
+            FadeOut(coverage_title),
+            FadeOut(coverage),
+            FadeOut(coverage_frame),
+            FadeOut(ground_point),
+            FadeOut(day_display),
+            FadeOut(coverage_note),
+            run_time=1
+        )
+
+        advantages_title = cached_text("Avantages de la Télédétection Micro-onde", font_size=36, color=GREEN)
         advantages_title.next_to(subtitle, DOWN, buff=0.7)
         
         advantages = VGroup(
@@ -694,7 +724,7 @@ class SatelliteMicroResonaTechnology(Scene):
         self.wait(1.5)
         
         # Algorithmes et produits dérivés
-        algorithms_title = Text("Algorithmes & Produits", font_size=36, color=BLUE)
+        algorithms_title = cached_text("Algorithmes & Produits", font_size=36, color=BLUE)
         algorithms_title.next_to(advantages, DOWN, buff=0.7)
         
         algorithms = BulletedList(
@@ -721,7 +751,7 @@ class SatelliteMicroResonaTechnology(Scene):
             run_time=1
         )
         
-        conclusion = Text(
+        conclusion = cached_text(
             "La télédétection micro-onde constitue un outil essentiel\n"
             "pour surveiller et comprendre les changements climatiques\n"
             "dans les régions polaires.",
@@ -0,0 +1,7 @@
+"""
+Modèles physiques partagés par les animations de télédétection micro-onde.
+
+Toutes les fonctions acceptent indifféremment un scalaire ou un tableau NumPy
+et sont vectorisées : un tracé ou un balayage de paramètres s'évalue en un
+seul appel au lieu d'un appel Python par échantillon.
+"""
@@ -0,0 +1,137 @@
+"""
+Transfert radiatif atmosphérique simplifié pour les canaux d'un radiomètre.
+
+La température de brillance au sommet de l'atmosphère combine l'émission de
+la surface, le rayonnement atmosphérique descendant réfléchi par la surface
+et le rayonnement montant de l'atmosphère :
+
+    Tᴮ = τ (ε Ts + (1 - ε) T↓) + T↑
+
+avec la transmittance oblique τ = exp(-τ₀ / cos θ), T↑ = Tatm (1 - τ) et
+T↓ = Tatm (1 - τ) + Tcosmique τ (atmosphère isotherme de température
+effective Tatm). L'opacité au zénith τ₀ additionne l'oxygène (aile de la
+bande à 60 GHz), la vapeur d'eau (raie à 22.235 GHz et continuum) et l'eau
+liquide des nuages (régime de Rayleigh).
+
+Les termes atmosphériques ne dépendent que des canaux, de l'angle et de
+l'état de l'atmosphère : ils sont calculés une fois puis mis en cache, et
+chaque image ne coûte plus que la combinaison ci-dessus, pour tous les
+canaux, angles et instants à la fois.
+"""
+
+import functools
+
+import numpy as np
+
+from .freezing import DEFAULT_COOLING, ice_fraction, physical_temperature
+from .fresnel import surface_emissivity
+
+# Canaux d'AMSR2 (GHz) et angle d'incidence (degrés)
+AMSR2_CHANNELS = (6.925, 7.3, 10.65, 18.7, 23.8, 36.5, 89.0)
+AMSR2_INCIDENCE = 55.0
+
+# Atmosphère arctique d'hiver : vapeur d'eau et eau nuageuse intégrées (kg/m²),
+# température effective de la couche émettrice (K)
+ARCTIC_VAPOR = 5.0
+ARCTIC_CLOUD = 0.05
+ARCTIC_TEMPERATURE = 250.0
+
+COSMIC_TEMPERATURE = 2.7  # K
+
+# Eau de mer au point de congélation (K) : température physique normalisée 1
+FREEZING_TEMPERATURE = 271.35
+
+# Raie de la vapeur d'eau (GHz) et coefficients d'opacité par kg/m²
+VAPOR_LINE = 22.235
+VAPOR_LINE_WIDTH = 4.0
+VAPOR_LINE_OPACITY = 0.005
+VAPOR_CONTINUUM_OPACITY = 0.0055  # à 89 GHz, en ν²
+
+# Oxygène : fond constant et aile de la bande à 60 GHz
+OXYGEN_BASE_OPACITY = 0.007
+OXYGEN_BAND_OPACITY = 0.3
+OXYGEN_BAND = 60.0
+OXYGEN_BAND_WIDTH = 10.0
+
+# Eau liquide : opacité par kg/m² ≈ coefficient · ν^exposant
+CLOUD_OPACITY = 0.00116
+CLOUD_EXPONENT = 1.9
+
+
+def zenith_opacity(frequency, vapor=ARCTIC_VAPOR, cloud=ARCTIC_CLOUD):
+    """Opacité au zénith (Np) à ``frequency`` GHz."""
+    nu = np.asarray(frequency, dtype=float)
+    oxygen = OXYGEN_BASE_OPACITY + OXYGEN_BAND_OPACITY * (nu / OXYGEN_BAND) ** 2 / (
+        ((nu - OXYGEN_BAND) / OXYGEN_BAND_WIDTH) ** 2 + 1
+    )
+    line = 1 / (((nu - VAPOR_LINE) / VAPOR_LINE_WIDTH) ** 2 + 1)
+    water_vapor = vapor * (VAPOR_LINE_OPACITY * line + VAPOR_CONTINUUM_OPACITY * (nu / 89.0) ** 2)
+    liquid = cloud * CLOUD_OPACITY * nu ** CLOUD_EXPONENT
+    return oxygen + water_vapor + liquid
+
+
+@functools.lru_cache(maxsize=64)
+def _atmospheric_terms(shape, frequency, angle, vapor, cloud, temperature):
+    nu = np.frombuffer(frequency).reshape(shape)
+    theta = np.radians(np.frombuffer(angle).reshape(shape))
+    transmittance = np.exp(-zenith_opacity(nu, vapor, cloud) / np.cos(theta))
+    upwelling = temperature * (1 - transmittance)
+    downwelling = upwelling + COSMIC_TEMPERATURE * transmittance
+    for term in (transmittance, upwelling, downwelling):
+        term.setflags(write=False)
+    return transmittance, upwelling, downwelling
+
+
+def atmospheric_terms(
+    frequency,
+    angle=AMSR2_INCIDENCE,
+    vapor=ARCTIC_VAPOR,
+    cloud=ARCTIC_CLOUD,
+    temperature=ARCTIC_TEMPERATURE,
+):
+    """
+    Transmittance τ, T↑ et T↓ (K) pour ``frequency`` (GHz) et ``angle``
+    (degrés) diffusés l'un sur l'autre ; mis en cache par canaux et état.
+    """
+    frequency, angle = np.broadcast_arrays(
+        np.asarray(frequency, dtype=float), np.asarray(angle, dtype=float)
+    )
+    return _atmospheric_terms(
+        frequency.shape,
+        np.ascontiguousarray(frequency).tobytes(),
+        np.ascontiguousarray(angle).tobytes(),
+        float(vapor),
+        float(cloud),
+        float(temperature),
+    )
+
+
+def top_of_atmosphere(emissivity, surface_temperature, transmittance, upwelling, downwelling):
+    """Tᴮ = τ (ε Ts + (1 - ε) T↓) + T↑, diffusé sur toutes les entrées."""
+    return transmittance * (
+        emissivity * surface_temperature + (1 - emissivity) * downwelling
+    ) + upwelling
+
+
+def freeze_brightness_temperature(
+    x,
+    frequency=AMSR2_CHANNELS,
+    polarization="V",
+    angle=AMSR2_INCIDENCE,
+    cooling=DEFAULT_COOLING,
+    **atmosphere,
+):
+    """
+    Tᴮ (K) au sommet de l'atmosphère pendant le gel, pour les instants ``x``
+    et les canaux ``frequency`` diffusés l'un sur l'autre (par exemple
+    ``x[:, None]`` et un tableau de canaux donnent une ligne par instant).
+    """
+    x = np.asarray(x, dtype=float)
+    frequency = np.asarray(frequency, dtype=float)
+    water = surface_emissivity("water", polarization, angle, frequency)
+    ice = surface_emissivity("new_ice", polarization, angle, frequency)
+    emissivity = water + (ice - water) * ice_fraction(x)
+    surface_temperature = FREEZING_TEMPERATURE * physical_temperature(x, cooling=cooling)
+    return top_of_atmosphere(
+        emissivity, surface_temperature, *atmospheric_terms(frequency, angle, **atmosphere)
+    )
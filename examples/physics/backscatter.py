@@ -0,0 +1,79 @@
+"""
+Coefficient de rétrodiffusion radar σ° d'un sol nu (modèle d'Oh et al., 1992).
+
+Le modèle semi-empirique d'Oh relie σ° à la rugosité normalisée ``ks``
+(k : nombre d'onde, s : écart type des hauteurs), à la permittivité du sol
+(via les réflectivités de Fresnel) et à l'angle d'incidence θ :
+
+    g    = 0.7 [1 - exp(-0.65 ks^1.8)]
+    √p   = 1 - (2θ/π)^(1 / 3Γ₀) exp(-ks)          p = σ°HH / σ°VV
+    q    = 0.23 √Γ₀ [1 - exp(-ks)]                 q = σ°HV / σ°VV
+    σ°VV = g cos³θ [Γ_V(θ) + Γ_H(θ)] / √p
+
+où Γ₀ est la réflectivité au nadir. Les calculs sont vectorisés sur toutes
+les entrées ; ``BACKSCATTER_TABLES`` en conserve une table (rugosité ×
+humidité × angle, en dB) par polarisation, interpolée par ``backscatter``.
+"""
+
+import numpy as np
+
+from .dielectric import soil_permittivity
+from .fresnel import fresnel_reflectivity
+from .lut import LookupAxis, LookupTable
+
+# Fréquence des radars en bande C (Sentinel-1, RADARSAT-2), en GHz
+RADAR_FREQUENCY = 5.405
+
+POLARIZATIONS = ("VV", "HH", "HV")
+
+# Plancher en dB (évite log10(0) pour une surface parfaitement lisse)
+MIN_BACKSCATTER_DB = -60.0
+
+
+def oh_backscatter(ks, permittivity, angle):
+    """σ° linéaires ``(VV, HH, HV)`` du modèle d'Oh ; angle en degrés."""
+    ks = np.asarray(ks, dtype=float)
+    permittivity = np.asarray(permittivity, dtype=complex)
+    theta = np.radians(np.asarray(angle, dtype=float))
+
+    nadir = np.abs((1 - np.sqrt(permittivity)) / (1 + np.sqrt(permittivity))) ** 2
+    reflectivity_h, reflectivity_v = fresnel_reflectivity(permittivity, angle)
+
+    g = 0.7 * (1 - np.exp(-0.65 * ks ** 1.8))
+    sqrt_p = 1 - (2 * theta / np.pi) ** (1 / (3 * nadir)) * np.exp(-ks)
+    q = 0.23 * np.sqrt(nadir) * (1 - np.exp(-ks))
+
+    vv = g * np.cos(theta) ** 3 * (reflectivity_v + reflectivity_h) / sqrt_p
+    return vv, sqrt_p ** 2 * vv, q * vv
+
+
+def to_db(values):
+    """Valeurs linéaires en décibels, bornées par ``MIN_BACKSCATTER_DB``."""
+    return np.maximum(10 * np.log10(np.maximum(values, 1e-30)), MIN_BACKSCATTER_DB)
+
+
+def backscatter_db(ks, moisture, angle, polarization="VV", frequency=RADAR_FREQUENCY):
+    """σ° (dB) d'un sol d'humidité volumique ``moisture`` (m³/m³), calcul direct."""
+    permittivity = soil_permittivity(moisture, frequency)
+    return to_db(oh_backscatter(ks, permittivity, angle)[POLARIZATIONS.index(polarization)])
+
+
+def _table(polarization):
+    return LookupTable(
+        f"oh_{polarization.lower()}",
+        lambda ks, moisture, angle: backscatter_db(ks, moisture, angle, polarization),
+        LookupAxis(0.05, 3.0, 60),
+        LookupAxis(0.01, 0.5, 50),
+        LookupAxis(10, 70, 61),
+        dtype=np.float32,
+    )
+
+
+# Rugosité ks × humidité (m³/m³) × angle (degrés), en bande C
+BACKSCATTER_TABLES = {polarization: _table(polarization) for polarization in POLARIZATIONS}
+
+
+def backscatter(ks, moisture, angle, polarization="VV"):
+    """σ° (dB) interpolé dans la table de la polarisation ; entrées diffusées entre elles."""
+    result = BACKSCATTER_TABLES[polarization](ks, moisture, angle)
+    return result.item() if np.ndim(result) == 0 else result
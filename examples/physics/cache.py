@@ -0,0 +1,218 @@
+"""
+Outils communs aux caches sur disque (tables de ``physics.lut``, géométrie
+des tracés, textes, index...).
+
+Les entrées sont adressées par leur contenu : la clé est une empreinte SHA-256
+de tout ce qui influence le résultat, de sorte qu'un cache n'a jamais besoin
+d'être invalidé à la main. Le répertoire racine vaut ``examples/.cache`` et
+peut être déplacé avec la variable d'environnement ``MANIM_EXAMPLES_CACHE``.
+
+Le module ne dépend que de NumPy : les modèles de ``physics`` l'utilisent
+sans importer manim, et les outils de ``rendering`` s'en servent aussi.
+"""
+
+import functools
+import hashlib
+import os
+import sys
+import sysconfig
+import tempfile
+import types
+from pathlib import Path
+
+import numpy as np
+
+from .paths import CACHE_ROOT, cache_dir  # noqa: F401  (réexportés)
+
+# Types dont la valeur (et non l'identité) entre dans l'empreinte d'une fonction
+_VALUE_TYPES = (bool, int, float, complex, str, bytes, type(None), np.generic)
+
+# Répertoires de la bibliothèque standard et des paquets installés : leurs
+# objets (fonctions NumPy, classes manim...) sont identifiés par leur nom
+_LIBRARY_PATHS = tuple(
+    Path(sysconfig.get_paths()[name]).resolve()
+    for name in ("stdlib", "platstdlib", "purelib", "platlib")
+)
+
+
+class FingerprintError(TypeError):
+    """Valeur dont le contenu ne peut pas entrer dans une empreinte."""
+
+
+def _is_library_file(path):
+    if path is None:
+        return True
+    path = Path(path).resolve()
+    return any(path.is_relative_to(root) for root in _LIBRARY_PATHS)
+
+
+def _is_library(value):
+    """Vrai pour un objet (ou module) de la bibliothèque standard ou d'un paquet installé."""
+    if not isinstance(value, types.ModuleType):
+        value = sys.modules.get(getattr(value, "__module__", None) or "")
+        if value is None:
+            return False
+    return _is_library_file(getattr(value, "__file__", None))
+
+
+def fingerprint(*parts):
+    """Empreinte hexadécimale stable d'une suite de valeurs (via ``repr``)."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(repr(part).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _hash_code(code, digest):
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode("utf-8"))
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _hash_code(const, digest)
+        else:
+            digest.update(repr(const).encode("utf-8"))
+
+
+def _code_names(code):
+    """Noms globaux et attributs lus par ``code`` et ses fonctions imbriquées."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def _library_name(value):
+    name = getattr(value, "__qualname__", None) or getattr(value, "__name__", None)
+    if name is None:
+        raise FingerprintError(f"Empreinte impossible pour un objet {type(value).__name__}")
+    return f"{getattr(value, '__module__', None) or type(value).__module__}.{name}"
+
+
+def _hash_value(value, digest, seen):
+    if isinstance(value, functools.partial):
+        _hash_value(value.func, digest, seen)
+        _hash_value((value.args, value.keywords), digest, seen)
+    elif isinstance(value, types.MethodType):
+        _hash_value(value.__func__, digest, seen)
+        _hash_value(value.__self__, digest, seen)
+    elif isinstance(value, types.FunctionType):
+        if _is_library_file(value.__code__.co_filename):
+            digest.update(_library_name(value).encode("utf-8"))
+        else:
+            _hash_function(value, digest, seen)
+    elif isinstance(value, np.ndarray):
+        digest.update(f"{value.dtype}{value.shape}".encode("utf-8"))
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, _VALUE_TYPES):
+        digest.update(repr(value).encode("utf-8"))
+    elif isinstance(value, (tuple, list, set, frozenset, dict)):
+        if id(value) in seen:
+            return
+        seen.add(id(value))
+        items = value.items() if isinstance(value, dict) else enumerate(value)
+        if isinstance(value, (set, frozenset, dict)):
+            items = sorted(items, key=lambda item: repr(item[0] if isinstance(value, dict) else item[1]))
+        digest.update(f"{type(value).__name__}{len(value)}".encode("utf-8"))
+        for key, item in items:
+            if isinstance(value, dict):
+                _hash_value(key, digest, seen)
+            _hash_value(item, digest, seen)
+    elif isinstance(value, types.ModuleType):
+        # Les attributs lus dans un module local sont suivis par _hash_function
+        digest.update(value.__name__.encode("utf-8"))
+    elif callable(getattr(value, "content_key", None)):
+        # Objets qui résument eux-mêmes leur contenu (``physics.lut.LookupTable``)
+        if id(value) in seen:
+            return
+        seen.add(id(value))
+        digest.update(str(value.content_key()).encode("utf-8"))
+    elif _is_library(value if isinstance(value, type) else type(value)):
+        # Fonctions natives, ufuncs et classes des bibliothèques
+        digest.update(_library_name(value).encode("utf-8"))
+    else:
+        raise FingerprintError(f"Empreinte impossible pour un objet {type(value).__name__}")
+
+
+def _hash_function(function, digest, seen):
+    if id(function) in seen:
+        return
+    seen.add(id(function))
+
+    code = function.__code__
+    _hash_code(code, digest)
+    _hash_value(function.__defaults__, digest, seen)
+    _hash_value(function.__kwdefaults__, digest, seen)
+
+    # Variables capturées (lambdas définies dans construct)
+    for cell in function.__closure__ or ():
+        try:
+            contents = cell.cell_contents
+        except ValueError:  # cellule pas encore initialisée
+            continue
+        _hash_value(contents, digest, seen)
+
+    # Globales utilisées (constantes, fonctions, tables, tableaux, modules
+    # locaux), pour qu'une modification du modèle invalide le cache
+    names = sorted(_code_names(code))
+    for name in names:
+        if name not in function.__globals__:
+            continue  # attribut ou fonction native (``len``, ``max``...)
+        value = function.__globals__[name]
+        digest.update(name.encode("utf-8"))
+        if isinstance(value, types.ModuleType) and not _is_library(value):
+            # ``bs.backscatter_db`` : attributs du module lus par la fonction
+            for attribute in names:
+                if hasattr(value, attribute):
+                    digest.update(attribute.encode("utf-8"))
+                    _hash_value(getattr(value, attribute), digest, seen)
+        else:
+            _hash_value(value, digest, seen)
+
+
+def function_fingerprint(function):
+    """
+    Empreinte du comportement d'une fonction Python : bytecode, constantes,
+    valeurs par défaut, variables capturées et globales qu'elle référence,
+    suivies récursivement (fonctions, dictionnaires, tableaux, tables,
+    attributs des modules locaux). Les objets des bibliothèques installées
+    sont identifiés par leur nom.
+
+    Lève ``FingerprintError`` si une valeur référencée n'a pas d'empreinte
+    fiable (objet local sans ``content_key``, par exemple) : l'appelant doit
+    alors se passer de cache plutôt que risquer un résultat périmé.
+    """
+    digest = hashlib.sha256()
+    _hash_value(function, digest, set())
+    return digest.hexdigest()
+
+
+def _atomic_write(path, suffix, write):
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=suffix)
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            write(tmp_file)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def save_array(path, array):
+    """Écrit un ``.npy`` de façon atomique (sûr avec des rendus en parallèle)."""
+    _atomic_write(path, ".npy.tmp", lambda tmp_file: np.save(tmp_file, np.ascontiguousarray(array)))
+
+
+def save_bytes(path, data):
+    """Écrit un fichier binaire de façon atomique."""
+    _atomic_write(path, ".tmp", lambda tmp_file: tmp_file.write(data))
+
+
+def load_array(path):
+    """Relit un ``.npy`` en mémoire mappée, ou ``None`` s'il est absent."""
+    try:
+        return np.load(path, mmap_mode="r")
+    except (FileNotFoundError, ValueError):
+        return None
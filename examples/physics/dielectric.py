@@ -0,0 +1,141 @@
+"""
+Permittivité complexe ``ε = ε' - jε''`` de l'eau de mer, de la glace de mer
+et du sol.
+
+- Eau de mer : relaxation de Debye et conductivité ionique de Klein et
+  Swift (1977), en fonction de la température (°C), de la salinité (‰) et
+  de la fréquence (GHz).
+- Glace de mer : volume de saumure de Frankenstein et Garner (1967) et
+  relations de Vant et al. (1978), indépendantes de la fréquence.
+- Sol : modèle semi-empirique de Dobson et al. (1985), en fonction de
+  l'humidité volumique (m³/m³) et de la fréquence, pour une texture donnée.
+
+Les formules sont vectorisées, mais les animations qui balaient salinité,
+température ou humidité à chaque image utilisent plutôt les tables
+``SEAWATER_TABLE``, ``SEA_ICE_TABLE`` et ``SOIL_TABLE`` (``physics.lut``) :
+calculées une fois, relues en mémoire mappée, puis simplement interpolées.
+"""
+
+import numpy as np
+
+from .lut import LookupAxis, LookupTable
+
+# Permittivité du vide (F/m)
+VACUUM_PERMITTIVITY = 8.854187817e-12
+
+# Permittivité optique de l'eau (douce ou salée)
+WATER_INFINITE = 4.9
+
+# Texture et densités du sol (loam) du modèle de Dobson
+SOIL_SAND = 0.4
+SOIL_CLAY = 0.2
+SOIL_BULK_DENSITY = 1.3   # g/cm³
+SOIL_SOLID_DENSITY = 2.66  # g/cm³
+SOIL_TEMPERATURE = 20.0   # °C
+DOBSON_ALPHA = 0.65
+
+# Humidité minimale du modèle de Dobson (le terme de conductivité diverge en 0)
+MIN_SOIL_MOISTURE = 0.01
+
+
+def _angular(frequency):
+    return 2 * np.pi * np.asarray(frequency, dtype=float) * 1e9
+
+
+def seawater_permittivity(temperature, salinity, frequency):
+    """Permittivité de l'eau de mer (Klein et Swift), diffusée sur les trois entrées."""
+    t = np.asarray(temperature, dtype=float)
+    s = np.asarray(salinity, dtype=float)
+    omega = _angular(frequency)
+
+    static = (87.134 - 1.949e-1 * t - 1.276e-2 * t ** 2 + 2.491e-4 * t ** 3) * (
+        1 + 1.613e-5 * t * s - 3.656e-3 * s + 3.210e-5 * s ** 2 - 4.232e-7 * s ** 3
+    )
+    relaxation = (1.768e-11 - 6.086e-13 * t + 1.104e-14 * t ** 2 - 8.111e-17 * t ** 3) * (
+        1 + 2.282e-5 * t * s - 7.638e-4 * s - 7.760e-6 * s ** 2 + 1.105e-8 * s ** 3
+    )
+
+    delta = 25.0 - t
+    phi = delta * (
+        2.033e-2 + 1.266e-4 * delta + 2.464e-6 * delta ** 2
+        - s * (1.849e-5 - 2.551e-7 * delta + 2.551e-8 * delta ** 2)
+    )
+    conductivity = s * (0.182521 - 1.46192e-3 * s + 2.09324e-5 * s ** 2 - 1.28205e-7 * s ** 3) * np.exp(-phi)
+
+    return (
+        WATER_INFINITE
+        + (static - WATER_INFINITE) / (1 + 1j * omega * relaxation)
+        - 1j * conductivity / (omega * VACUUM_PERMITTIVITY)
+    )
+
+
+def brine_volume(temperature, salinity):
+    """Fraction volumique de saumure (‰) d'une glace à ``temperature`` °C (< 0) et ``salinity`` ‰."""
+    t = np.minimum(np.asarray(temperature, dtype=float), -0.5)
+    return np.asarray(salinity, dtype=float) * (49.185 / np.abs(t) + 0.532)
+
+
+def sea_ice_permittivity(temperature, salinity):
+    """Permittivité de la glace de mer de première année (Vant et al.)."""
+    volume = brine_volume(temperature, salinity)
+    return (3.12 + 0.009 * volume) - 1j * (0.04 + 0.005 * volume)
+
+
+def free_water_permittivity(frequency, temperature=SOIL_TEMPERATURE):
+    """Permittivité de l'eau libre du sol (Debye, sans conductivité)."""
+    t = np.asarray(temperature, dtype=float)
+    static = 88.045 - 0.4147 * t + 6.295e-4 * t ** 2 + 1.075e-5 * t ** 3
+    relaxation = (1.1109e-10 - 3.824e-12 * t + 6.938e-14 * t ** 2 - 5.096e-16 * t ** 3) / (2 * np.pi)
+    return WATER_INFINITE + (static - WATER_INFINITE) / (1 + 1j * _angular(frequency) * relaxation)
+
+
+def soil_permittivity(
+    moisture,
+    frequency,
+    sand=SOIL_SAND,
+    clay=SOIL_CLAY,
+    bulk_density=SOIL_BULK_DENSITY,
+    temperature=SOIL_TEMPERATURE,
+):
+    """Permittivité d'un sol d'humidité volumique ``moisture`` (Dobson et al.)."""
+    mv = np.maximum(np.asarray(moisture, dtype=float), MIN_SOIL_MOISTURE)
+    beta_real = 1.2748 - 0.519 * sand - 0.152 * clay
+    beta_imag = 1.33797 - 0.603 * sand - 0.166 * clay
+    conductivity = 0.0467 + 0.2204 * bulk_density - 0.4111 * sand + 0.6614 * clay
+
+    water = free_water_permittivity(frequency, temperature)
+    water_imag = -water.imag + conductivity / (_angular(frequency) * VACUUM_PERMITTIVITY) * (
+        (SOIL_SOLID_DENSITY - bulk_density) / (SOIL_SOLID_DENSITY * mv)
+    )
+    solid = (1.01 + 0.44 * SOIL_SOLID_DENSITY) ** 2 - 0.062
+
+    alpha = DOBSON_ALPHA
+    real = (
+        1 + bulk_density / SOIL_SOLID_DENSITY * (solid ** alpha - 1)
+        + mv ** beta_real * water.real ** alpha - mv
+    ) ** (1 / alpha)
+    imag = (mv ** beta_imag * water_imag ** alpha) ** (1 / alpha)
+    return real - 1j * imag
+
+
+# Tables : température (°C) × salinité (‰) × fréquence (GHz) pour l'eau de mer,
+# température × salinité pour la glace, humidité × fréquence pour le sol
+SEAWATER_TABLE = LookupTable(
+    "seawater",
+    seawater_permittivity,
+    LookupAxis(-2, 30, 65),
+    LookupAxis(0, 40, 81),
+    LookupAxis(1, 100, 121, log=True),
+)
+SEA_ICE_TABLE = LookupTable(
+    "sea_ice",
+    sea_ice_permittivity,
+    LookupAxis(-30, -1, 59),
+    LookupAxis(0, 16, 65),
+)
+SOIL_TABLE = LookupTable(
+    "soil",
+    soil_permittivity,
+    LookupAxis(MIN_SOIL_MOISTURE, 0.5, 99),
+    LookupAxis(1, 20, 61, log=True),
+)
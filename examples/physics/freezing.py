@@ -0,0 +1,81 @@
+"""
+Évolution normalisée de l'émissivité, de la température physique et de la
+température de brillance pendant le gel de l'eau salée.
+
+La chronologie est celle utilisée dans toutes les scènes : eau libre jusqu'à
+x = 3, transition linéaire jusqu'à x = 6, puis nouvelle glace de mer.
+``physics.growth`` obtient une chronologie comparable par simulation.
+
+Par défaut, l'émissivité passe des valeurs typiques 0.55 à 0.92. Avec une
+polarisation (``"H"`` ou ``"V"``), les deux extrémités sont les émissivités
+de Fresnel de l'eau de mer et de la glace (``physics.fresnel``) à l'angle
+et à la fréquence demandés, et la transition est le mélange des deux
+surfaces dans l'empreinte du capteur, proportionnel à la fraction de glace.
+"""
+
+import numpy as np
+
+from .fresnel import DEFAULT_ANGLE, DEFAULT_FREQUENCY, surface_emissivity
+
+# Bornes de la transition eau -> glace (axe du temps des scènes, en jours)
+FREEZE_START = 3.0
+FREEZE_END = 6.0
+FREEZE_BREAKPOINTS = (FREEZE_START, FREEZE_END)
+
+# Émissivités typiques entre 19 et 37 GHz
+WATER_EMISSIVITY = 0.55  # Eau de mer
+ICE_EMISSIVITY = 0.92    # Nouvelle glace de mer
+
+# Baisse de la température physique normalisée pendant le gel
+DEFAULT_COOLING = 0.1
+
+
+def _as_output(values):
+    """Rend un scalaire Python pour une entrée scalaire, sinon le tableau."""
+    return values.item() if values.ndim == 0 else values
+
+
+def _freeze_ramp(x, before, after):
+    """Rampe constante / linéaire / constante entre FREEZE_START et FREEZE_END."""
+    x = np.asarray(x, dtype=float)
+    return np.interp(x, FREEZE_BREAKPOINTS, (before, after))
+
+
+def ice_fraction(x):
+    """Fraction de glace dans l'empreinte du capteur : 0 puis 1."""
+    return _as_output(_freeze_ramp(x, 0.0, 1.0))
+
+
+def _emissivity(x, polarization, angle, frequency):
+    if polarization is None:
+        water, ice = WATER_EMISSIVITY, ICE_EMISSIVITY
+    else:
+        water = surface_emissivity("water", polarization, angle, frequency)
+        ice = surface_emissivity("new_ice", polarization, angle, frequency)
+    return water + (ice - water) * _freeze_ramp(x, 0.0, 1.0)
+
+
+def emissivity(x, polarization=None, angle=DEFAULT_ANGLE, frequency=DEFAULT_FREQUENCY):
+    """
+    Émissivité : 0.55 (eau de mer) puis 0.92 (nouvelle glace), ou émissivités
+    de Fresnel en polarisation ``polarization`` (angle en degrés, fréquence
+    en GHz).
+    """
+    return _as_output(_emissivity(x, polarization, angle, frequency))
+
+
+def physical_temperature(x, cooling=DEFAULT_COOLING):
+    """
+    Température physique normalisée : 1 pour l'eau, puis ``1 - cooling``
+    une fois la glace formée (``cooling=0`` donne une température constante).
+    """
+    return _as_output(_freeze_ramp(x, 1.0, 1.0 - cooling))
+
+
+def brightness_temperature(
+    x, cooling=DEFAULT_COOLING, polarization=None, angle=DEFAULT_ANGLE, frequency=DEFAULT_FREQUENCY
+):
+    """Température de brillance : Tᴮ = ε · Tphys (ε comme pour ``emissivity``)."""
+    x = np.asarray(x, dtype=float)
+    tb = _emissivity(x, polarization, angle, frequency) * _freeze_ramp(x, 1.0, 1.0 - cooling)
+    return _as_output(tb)
@@ -0,0 +1,88 @@
+"""
+Émissivité de Fresnel d'une surface plane, en polarisations H et V.
+
+Pour une surface lisse de permittivité relative complexe ``ε = ε' - jε''``
+vue sous l'angle d'incidence θ, l'émissivité vaut ``e = 1 - |r|²`` où ``r``
+est le coefficient de réflexion de Fresnel :
+
+    r_H = (cos θ - √(ε - sin²θ)) / (cos θ + √(ε - sin²θ))
+    r_V = (ε cos θ - √(ε - sin²θ)) / (ε cos θ + √(ε - sin²θ))
+
+Toutes les fonctions suivent les règles de diffusion de NumPy : un tableau
+d'angles de forme ``(n, 1, 1)``, de fréquences ``(m, 1)`` et d'états de
+surface ``(k,)`` donne directement la grille ``(n, m, k)`` en une opération,
+sans boucle Python. Les angles sont en degrés et les fréquences en GHz.
+"""
+
+import numpy as np
+
+from .dielectric import SEA_ICE_TABLE, SEAWATER_TABLE
+
+# Eau de mer au point de congélation (°C, ‰)
+SEAWATER_TEMPERATURE = -1.8
+SEAWATER_SALINITY = 33.0
+
+# Nouvelle glace de mer, encore chaude et saline (°C, ‰)
+NEW_ICE_TEMPERATURE = -5.0
+NEW_ICE_SALINITY = 10.0
+
+# États de surface de la chronologie du gel
+SURFACES = ("water", "new_ice")
+
+POLARIZATIONS = ("H", "V")
+
+# Configuration d'AMSR2 utilisée par défaut : canal 36.5 GHz, incidence de 55°
+DEFAULT_FREQUENCY = 36.5
+DEFAULT_ANGLE = 55.0
+
+
+def surface_permittivity(frequency, surfaces=SURFACES):
+    """
+    Permittivités de chaque état de surface, de forme ``frequency.shape +
+    (len(surfaces),)`` (le dernier axe est celui des surfaces), interpolées
+    dans les tables de ``physics.dielectric``.
+    """
+    frequency = np.asarray(frequency, dtype=float)
+    models = {
+        "water": lambda f: SEAWATER_TABLE(SEAWATER_TEMPERATURE, SEAWATER_SALINITY, f),
+        "new_ice": lambda f: np.broadcast_to(
+            SEA_ICE_TABLE(NEW_ICE_TEMPERATURE, NEW_ICE_SALINITY), f.shape
+        ),
+    }
+    return np.stack([models[surface](frequency) for surface in surfaces], axis=-1)
+
+
+def fresnel_reflectivity(permittivity, angle):
+    """Réflectivités ``|r_H|²`` et ``|r_V|²`` (tableaux diffusés l'un sur l'autre)."""
+    permittivity = np.asarray(permittivity, dtype=complex)
+    theta = np.radians(np.asarray(angle, dtype=float))
+    cos_theta = np.cos(theta)
+    root = np.sqrt(permittivity - np.sin(theta) ** 2)
+    r_h = (cos_theta - root) / (cos_theta + root)
+    r_v = (permittivity * cos_theta - root) / (permittivity * cos_theta + root)
+    return np.abs(r_h) ** 2, np.abs(r_v) ** 2
+
+
+def fresnel_emissivity(permittivity, angle):
+    """Émissivités ``(e_H, e_V)`` d'une surface lisse de permittivité ``permittivity``."""
+    reflectivity_h, reflectivity_v = fresnel_reflectivity(permittivity, angle)
+    return 1.0 - reflectivity_h, 1.0 - reflectivity_v
+
+
+def emissivity_grid(angles, frequencies, surfaces=SURFACES):
+    """
+    Émissivités sur toute la grille angle × fréquence × surface, de forme
+    ``(2, len(angles), len(frequencies), len(surfaces))`` (H puis V).
+    """
+    angles = np.asarray(angles, dtype=float)
+    permittivity = surface_permittivity(np.asarray(frequencies, dtype=float), surfaces)
+    return np.stack(fresnel_emissivity(permittivity[None], angles[:, None, None]))
+
+
+def surface_emissivity(
+    surface, polarization="V", angle=DEFAULT_ANGLE, frequency=DEFAULT_FREQUENCY
+):
+    """Émissivité d'un état de surface de ``SURFACES`` dans une polarisation."""
+    permittivity = surface_permittivity(frequency, (surface,))[..., 0]
+    result = fresnel_emissivity(permittivity, angle)[POLARIZATIONS.index(polarization)]
+    return result.item() if result.ndim == 0 else result
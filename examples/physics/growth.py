@@ -0,0 +1,200 @@
+"""
+Croissance thermodynamique de la glace de mer sur une grille 2D (loi de
+Stefan avec échange turbulent à la surface).
+
+Chaque cellule de la grille est une colonne d'océan (couche de mélange de
+profondeur ``MIXED_LAYER_DEPTH``) sous une atmosphère froide. À chaque pas de
+temps, la chaleur perdue vers l'atmosphère vaut
+
+    Q = (Tw - Ta) / (h / k_glace + 1 / H)
+
+(conduction à travers la glace d'épaisseur h en série avec l'échange
+turbulent de coefficient H). Elle refroidit d'abord l'eau jusqu'au point de
+congélation, puis le reste forme de la glace : dh = Q dt / (ρ_glace L). Sans
+glace, on retrouve le refroidissement de l'eau libre ; avec une glace
+épaisse, la loi de Stefan h² ∝ degrés-jours de gel.
+
+L'eau est initialement un peu au-dessus du point de congélation, davantage
+vers la droite de la grille et avec des irrégularités lissées : le gel
+commence vers le troisième jour à gauche et gagne la droite en quelques
+jours, comme la transition x = 3 -> 6 de ``physics.freezing``.
+
+Tout l'état est mis à jour en place, pour toutes les cellules à la fois.
+``IceGrowth.frames`` le diffuse image par image par un générateur : une
+simulation longue et fine ne garde jamais en mémoire que le pas courant.
+"""
+
+import numpy as np
+
+from .freezing import ICE_EMISSIVITY, WATER_EMISSIVITY
+from .fresnel import DEFAULT_ANGLE, DEFAULT_FREQUENCY, surface_emissivity
+
+# Point de congélation de l'eau de mer (°C) et 0 °C en kelvins
+FREEZING_POINT = -1.8
+KELVIN = 273.15
+
+# Glace : conductivité (W/m/K), masse volumique (kg/m³), chaleur latente (J/kg)
+ICE_CONDUCTIVITY = 2.03
+ICE_DENSITY = 917.0
+LATENT_HEAT = 3.34e5
+
+# Couche de mélange : capacité calorifique volumique (J/m³/K) et profondeur (m)
+WATER_HEAT_CAPACITY = 4.1e6
+MIXED_LAYER_DEPTH = 20.0
+
+# Coefficient d'échange turbulent surface-atmosphère (W/m²/K)
+HEAT_TRANSFER = 20.0
+
+# Air arctique d'automne (°C)
+AIR_TEMPERATURE = -15.0
+
+# Excès initial de température de l'eau au-dessus du point de congélation,
+# du bord gauche au bord droit de la grille (K)
+WATER_EXCESS = (0.9, 1.5)
+
+# Épaisseur à laquelle la glace mince atteint 63 % de l'émissivité de la
+# glace épaisse (m)
+THIN_ICE_THICKNESS = 0.03
+
+# Pas de temps de l'intégration (s)
+STEP = 3600.0
+
+SECONDS_PER_DAY = 86400.0
+
+
+def _smooth_noise(rng, size, width):
+    """Bruit gaussien lissé sur ``width`` échantillons, d'écart-type ~1."""
+    noise = np.convolve(rng.normal(size=size + width - 1), np.ones(width), "valid")
+    return noise / np.sqrt(width)
+
+
+class IceGrowth:
+    """
+    État (eau, glace, surface) d'une grille de cellules en cours de gel.
+
+    Paramètres
+    ----------
+    shape
+        Forme ``(lignes, colonnes)`` de la grille.
+    air_temperature
+        Température de l'air (°C), scalaire ou tableau de forme ``shape``.
+    water_excess
+        Excès initial de température de l'eau (K), au bord gauche et au bord droit.
+    noise
+        Écart-type (K) des irrégularités de l'excès initial.
+    step
+        Pas de temps de l'intégration, en secondes.
+    seed
+        Graine des irrégularités.
+    """
+
+    def __init__(
+        self,
+        shape=(48, 360),
+        air_temperature=AIR_TEMPERATURE,
+        water_excess=WATER_EXCESS,
+        noise=0.08,
+        step=STEP,
+        seed=0,
+    ):
+        rows, cols = shape
+        rng = np.random.default_rng(seed)
+        excess = np.linspace(*water_excess, cols)[None, :] + noise * (
+            _smooth_noise(rng, rows, 5)[:, None] + _smooth_noise(rng, cols, 25)[None, :]
+        ) / np.sqrt(2)
+
+        self.step = step
+        self.time = 0.0  # jours
+        self.air_temperature = np.broadcast_to(np.asarray(air_temperature, dtype=float), shape)
+        self.water_temperature = FREEZING_POINT + np.maximum(excess, 0.0)
+        self.thickness = np.zeros(shape)
+        self.surface_temperature = self.water_temperature.copy()
+
+        # Tampons de travail réutilisés à chaque pas
+        self._heat = np.empty(shape)
+        self._cooling = np.empty(shape)
+
+    def _advance(self, dt):
+        heat, cooling = self._heat, self._cooling
+
+        # Chaleur perdue pendant dt (J/m²) à travers la glace et la couche limite
+        np.divide(self.thickness, ICE_CONDUCTIVITY, out=heat)
+        heat += 1 / HEAT_TRANSFER
+        np.subtract(self.water_temperature, self.air_temperature, out=cooling)
+        np.divide(cooling, heat, out=heat)
+        heat *= dt
+
+        # Surface : Ts = Ta + Q / (H dt)
+        np.divide(heat, HEAT_TRANSFER * dt, out=self.surface_temperature)
+        self.surface_temperature += self.air_temperature
+
+        # Refroidissement de l'eau jusqu'au point de congélation, puis glace
+        np.subtract(self.water_temperature, FREEZING_POINT, out=cooling)
+        cooling *= WATER_HEAT_CAPACITY * MIXED_LAYER_DEPTH
+        np.minimum(cooling, heat, out=cooling)
+        heat -= cooling
+        self.water_temperature -= cooling / (WATER_HEAT_CAPACITY * MIXED_LAYER_DEPTH)
+        self.thickness += heat / (ICE_DENSITY * LATENT_HEAT)
+
+    def advance_to(self, time):
+        """Intègre jusqu'à ``time`` jours par pas d'au plus ``step`` secondes."""
+        remaining = (time - self.time) * SECONDS_PER_DAY
+        while remaining > 1e-6:
+            dt = min(self.step, remaining)
+            self._advance(dt)
+            remaining -= dt
+        self.time = max(self.time, time)
+        return self
+
+    def frames(self, end, interval):
+        """
+        Générateur de l'état à t = 0, ``interval``, ... ``end`` jours.
+
+        Produit à chaque fois ce même objet, mis à jour en place : copier les
+        tableaux voulus s'ils doivent survivre à l'image suivante.
+        """
+        count = int(np.ceil((end - self.time) / interval - 1e-9))
+        start = self.time
+        yield self
+        for index in range(1, count + 1):
+            self.advance_to(min(start + index * interval, end))
+            yield self
+
+    def ice_fraction(self):
+        """Fraction apparente de glace vue par le radiomètre : 1 - exp(-h / h_mince)."""
+        return -np.expm1(-self.thickness / THIN_ICE_THICKNESS)
+
+    def effective_temperature(self):
+        """Température radiative (K) : eau libre, ou moyenne de la glace (surface et base)."""
+        ice = (self.surface_temperature + FREEZING_POINT) / 2
+        return KELVIN + np.where(self.thickness > 0, ice, self.water_temperature)
+
+    def emissivity(self, polarization=None, angle=DEFAULT_ANGLE, frequency=DEFAULT_FREQUENCY):
+        """Émissivité par cellule, comme ``physics.freezing.emissivity``."""
+        if polarization is None:
+            water, ice = WATER_EMISSIVITY, ICE_EMISSIVITY
+        else:
+            water = surface_emissivity("water", polarization, angle, frequency)
+            ice = surface_emissivity("new_ice", polarization, angle, frequency)
+        return water + (ice - water) * self.ice_fraction()
+
+    def brightness_temperature(self, polarization=None, angle=DEFAULT_ANGLE, frequency=DEFAULT_FREQUENCY):
+        """Tᴮ = ε · Teff (K) par cellule."""
+        return self.emissivity(polarization, angle, frequency) * self.effective_temperature()
+
+
+def freeze_up_series(end=10.0, interval=0.05, polarization=None, reference=KELVIN + FREEZING_POINT, **kwargs):
+    """
+    Moyennes sur la grille au fil du gel : ``(temps, émissivité, température
+    physique, Tᴮ)``, températures normalisées par ``reference`` (1 pour l'eau
+    au point de congélation, comme dans ``physics.freezing``). L'état est lu
+    image par image sans conserver les grilles.
+    """
+    model = IceGrowth(**kwargs)
+    series = []
+    for state in model.frames(end, interval):
+        epsilon = state.emissivity(polarization)
+        temperature = state.effective_temperature()
+        series.append((state.time, epsilon.mean(), temperature.mean(), (epsilon * temperature).mean()))
+    times, epsilon, temperature, tb = np.array(series).T
+    return times, epsilon, temperature / reference, tb / reference
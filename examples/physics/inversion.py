@@ -0,0 +1,91 @@
+"""
+Inversion de l'humidité du sol à partir de σ° observés (plusieurs
+polarisations), par recherche dans une table du modèle d'Oh.
+
+Le modèle direct (``physics.backscatter``) est évalué une seule fois sur la
+grille humidité × rugosité × angle ; chaque entrée de la table devient un
+point de l'espace des observations (σ° en dB de chaque polarisation, angle
+pondéré par ``ANGLE_WEIGHT``). Un arbre k-d (``scipy.spatial.cKDTree``,
+installé avec manim) indexe ces points : l'inversion d'une image entière se
+fait par requêtes groupées des ``neighbors`` plus proches voisins, dont
+l'humidité et la rugosité sont moyennées avec des poids inverses de la
+distance. Les images sont traitées par blocs de ``CHUNK_SIZE`` pixels, ce qui
+borne la mémoire de travail pour des millions de pixels.
+"""
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from .backscatter import backscatter_db
+
+# Axes de la table : humidité (m³/m³), rugosité ks, angle (degrés) — (début, fin, nombre)
+INVERSION_MOISTURE = (0.02, 0.45, 87)
+INVERSION_ROUGHNESS = (0.1, 2.0, 39)
+INVERSION_ANGLES = (20.0, 45.0, 26)
+INVERSION_POLARIZATIONS = ("VV", "HH")
+
+# Poids de l'angle dans l'espace des observations (dB par degré)
+ANGLE_WEIGHT = 1.0
+
+# Pixels traités par requête groupée
+CHUNK_SIZE = 1 << 18
+
+
+class MoistureInversion:
+    """
+    Table d'inversion σ° -> (humidité, rugosité) indexée par un arbre k-d.
+
+    Paramètres
+    ----------
+    moisture, roughness, angles
+        Axes ``(début, fin, nombre)`` de la table.
+    polarizations
+        Polarisations observées, dans l'ordre du dernier axe des images.
+    angle_weight
+        Poids de l'angle (dB par degré) dans la distance entre observations.
+    """
+
+    def __init__(
+        self,
+        moisture=INVERSION_MOISTURE,
+        roughness=INVERSION_ROUGHNESS,
+        angles=INVERSION_ANGLES,
+        polarizations=INVERSION_POLARIZATIONS,
+        angle_weight=ANGLE_WEIGHT,
+    ):
+        self.polarizations = tuple(polarizations)
+        self.angle_weight = angle_weight
+        mv, ks, theta = np.meshgrid(
+            np.linspace(*moisture), np.linspace(*roughness), np.linspace(*angles), indexing="ij"
+        )
+        self.moisture = mv.ravel()
+        self.roughness = ks.ravel()
+        sigma = [backscatter_db(self.roughness, self.moisture, theta.ravel(), polarization)
+                 for polarization in self.polarizations]
+        self.features = np.column_stack([*sigma, angle_weight * theta.ravel()])
+        self.tree = cKDTree(self.features)
+
+    def _queries(self, sigma, angle):
+        sigma = np.asarray(sigma, dtype=float)
+        angle = np.broadcast_to(np.asarray(angle, dtype=float), sigma.shape[:-1])
+        return np.concatenate([sigma, self.angle_weight * angle[..., None]], axis=-1)
+
+    def retrieve(self, sigma, angle, neighbors=4):
+        """
+        Humidité et rugosité ``(mv, ks)`` de chaque pixel : ``sigma`` de forme
+        ``(..., polarisations)`` en dB, ``angle`` (degrés) diffusé sur ``sigma[..., 0]``.
+        """
+        queries = self._queries(sigma, angle).reshape(-1, len(self.polarizations) + 1)
+        moisture = np.empty(len(queries))
+        roughness = np.empty(len(queries))
+        for start in range(0, len(queries), CHUNK_SIZE):
+            block = slice(start, start + CHUNK_SIZE)
+            distance, index = self.tree.query(queries[block], k=neighbors, workers=-1)
+            if neighbors == 1:
+                distance, index = distance[:, None], index[:, None]
+            weight = 1 / np.maximum(distance, 1e-6)
+            weight /= weight.sum(axis=1, keepdims=True)
+            moisture[block] = (weight * self.moisture[index]).sum(axis=1)
+            roughness[block] = (weight * self.roughness[index]).sum(axis=1)
+        shape = np.shape(sigma)[:-1]
+        return moisture.reshape(shape), roughness.reshape(shape)
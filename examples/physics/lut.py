@@ -0,0 +1,117 @@
+"""
+Tables de correspondance régulières, calculées une fois et relues en mémoire
+mappée.
+
+Un modèle coûteux mais vectorisé ``f(x1, ..., xd)`` est évalué une seule fois
+sur une grille régulière (linéaire ou logarithmique selon l'axe), écrite dans
+``.cache/lut/<nom>-<clé>.npy``. La clé est l'empreinte de la fonction (code,
+constantes, valeurs par défaut) et de la grille : modifier le modèle
+reconstruit la table, sinon elle est relue en mémoire mappée. Une évaluation
+ne coûte ensuite qu'une interpolation multilinéaire, pour des tableaux
+d'entrées de formes quelconques (diffusées entre elles).
+"""
+
+import itertools
+
+import numpy as np
+
+from .cache import cache_dir, fingerprint, function_fingerprint, load_array, save_array
+
+# À incrémenter si le format des tables change
+LUT_VERSION = 1
+
+
+class LookupAxis:
+    """Axe d'une table : ``count`` valeurs de ``start`` à ``stop`` (espacement logarithmique si ``log``)."""
+
+    def __init__(self, start, stop, count, log=False):
+        self.start = float(start)
+        self.stop = float(stop)
+        self.count = int(count)
+        self.log = log
+
+    def __repr__(self):
+        return f"LookupAxis({self.start}, {self.stop}, {self.count}, log={self.log})"
+
+    @property
+    def values(self):
+        if self.log:
+            return np.geomspace(self.start, self.stop, self.count)
+        return np.linspace(self.start, self.stop, self.count)
+
+    def position(self, x):
+        """Indice fractionnaire de ``x`` sur l'axe, borné aux extrémités."""
+        x = np.asarray(x, dtype=float)
+        if self.log:
+            x, start, stop = np.log(x), np.log(self.start), np.log(self.stop)
+        else:
+            start, stop = self.start, self.stop
+        return np.clip((x - start) / (stop - start) * (self.count - 1), 0, self.count - 1)
+
+
+class LookupTable:
+    """
+    Table de ``function`` sur le produit des axes ``axes``, interpolée
+    multilinéairement à l'appel. Les entrées hors de la grille sont ramenées
+    à ses bords.
+
+    Paramètres
+    ----------
+    name
+        Préfixe du fichier de cache.
+    function
+        Modèle vectorisé, appelé une fois avec une grille creuse
+        (``np.meshgrid(..., sparse=True)``).
+    axes
+        Un ``LookupAxis`` par argument de ``function``.
+    dtype
+        Type des valeurs stockées.
+    """
+
+    def __init__(self, name, function, *axes, dtype=np.complex64):
+        self.name = name
+        self.function = function
+        self.axes = axes
+        self.dtype = np.dtype(dtype)
+        self._table = None
+
+    def content_key(self):
+        """Empreinte du contenu de la table : modèle, axes et type des valeurs."""
+        return fingerprint(
+            LUT_VERSION, function_fingerprint(self.function), self.axes, self.dtype.str
+        )
+
+    @property
+    def path(self):
+        return cache_dir("lut") / f"{self.name}-{self.content_key()[:16]}.npy"
+
+    @property
+    def table(self):
+        """Valeurs sur la grille (tableau en mémoire mappée), construites au premier accès."""
+        if self._table is None:
+            path = self.path
+            table = load_array(path)
+            if table is None:
+                grids = np.meshgrid(*(axis.values for axis in self.axes), indexing="ij", sparse=True)
+                shape = tuple(axis.count for axis in self.axes)
+                table = np.broadcast_to(self.function(*grids), shape).astype(self.dtype)
+                save_array(path, table)
+            self._table = table
+        return self._table
+
+    def __call__(self, *coords):
+        table = self.table
+        positions = np.broadcast_arrays(
+            *(axis.position(x) for axis, x in zip(self.axes, coords))
+        )
+        lower = [np.minimum(position.astype(np.intp), axis.count - 2)
+                 for position, axis in zip(positions, self.axes)]
+        weights = [position - index for position, index in zip(positions, lower)]
+
+        result = 0.0
+        for corner in itertools.product((0, 1), repeat=len(self.axes)):
+            weight = 1.0
+            for offset, fraction in zip(corner, weights):
+                weight = weight * (fraction if offset else 1.0 - fraction)
+            result = result + weight * table[tuple(index + offset for index, offset in zip(lower, corner))]
+        return result
@@ -0,0 +1,62 @@
+"""
+Mouvement sur une orbite elliptique, en forme fermée.
+
+L'ellipse est décrite dans le repère de la scène par ``(a cos t, b sin t)``
+autour de son centre. Avec ``kepler=True``, ``t`` est l'anomalie excentrique
+et la vitesse suit la deuxième loi de Kepler (aires égales balayées depuis le
+foyer) : l'anomalie moyenne croît uniformément et l'équation de Kepler
+``M = E - e sin E`` est résolue par la méthode de Newton, pour tous les
+satellites à la fois.
+"""
+
+import numpy as np
+
+# Itérations de Newton : convergence à la précision machine pour e < 0.9
+KEPLER_ITERATIONS = 8
+
+
+def eccentricity(a, b):
+    """Excentricité d'une ellipse de demi-axes ``a`` et ``b`` (dans n'importe quel ordre)."""
+    a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+    return np.sqrt(1.0 - (np.minimum(a, b) / np.maximum(a, b)) ** 2)
+
+
+def periapsis_angle(a, b):
+    """Paramètre ``t`` du périgée : 0 si le grand axe est horizontal, π/2 sinon."""
+    return np.where(np.asarray(a) >= np.asarray(b), 0.0, np.pi / 2)
+
+
+def solve_kepler(mean_anomaly, e):
+    """Anomalie excentrique ``E`` telle que ``E - e sin E = M`` (vectorisé)."""
+    mean_anomaly = np.asarray(mean_anomaly, dtype=float)
+    anomaly = mean_anomaly + e * np.sin(mean_anomaly)
+    for _ in range(KEPLER_ITERATIONS):
+        anomaly -= (anomaly - e * np.sin(anomaly) - mean_anomaly) / (1.0 - e * np.cos(anomaly))
+    return anomaly
+
+
+def orbit_angle(start, turns, a, b, kepler=False):
+    """
+    Paramètre ``t`` sur l'ellipse après ``turns`` tours depuis ``start``.
+
+    Sans ``kepler``, ``t`` avance uniformément ; sinon c'est l'anomalie
+    moyenne qui avance uniformément.
+    """
+    start = np.asarray(start, dtype=float)
+    turns = np.asarray(turns, dtype=float)
+    if not kepler:
+        return start + 2 * np.pi * turns
+    e = eccentricity(a, b)
+    periapsis = periapsis_angle(a, b)
+    start_anomaly = start - periapsis
+    mean_anomaly = start_anomaly - e * np.sin(start_anomaly) + 2 * np.pi * turns
+    return solve_kepler(mean_anomaly, e) + periapsis
+
+
+def ellipse_positions(center, a, b, angle):
+    """Positions ``(n, 3)`` des points de paramètres ``angle`` sur l'ellipse."""
+    angle = np.atleast_1d(np.asarray(angle, dtype=float))
+    positions = np.zeros((angle.size, 3))
+    positions[:, 0] = a * np.cos(angle)
+    positions[:, 1] = b * np.sin(angle)
+    return positions + np.asarray(center, dtype=float)
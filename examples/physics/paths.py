@@ -0,0 +1,20 @@
+"""
+Emplacement des caches sur disque.
+
+Module volontairement sans dépendance (ni NumPy ni manim) : il est importé par
+les outils en ligne de commande qui doivent démarrer instantanément.
+"""
+
+import os
+from pathlib import Path
+
+CACHE_ROOT = Path(
+    os.environ.get("MANIM_EXAMPLES_CACHE", Path(__file__).resolve().parent.parent / ".cache")
+)
+
+
+def cache_dir(name):
+    """Répertoire du cache ``name``, créé au besoin."""
+    path = CACHE_ROOT / name
+    path.mkdir(parents=True, exist_ok=True)
+    return path
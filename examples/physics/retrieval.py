@@ -0,0 +1,135 @@
+"""
+Concentration de la glace de mer à partir de grilles de Tᴮ (NASA Team et
+Bootstrap).
+
+Les grilles d'entrée ont la forme ``(lignes, colonnes, canaux)`` dans l'ordre
+``SSMI_CHANNELS`` (grilles polaires stéréographiques quotidiennes, environ
+448 × 304 × 7 au nord). Elles sont traitées par blocs de lignes
+(``CHUNK_ROWS``), ce qui borne la mémoire de travail et permet de passer
+directement un tableau en mémoire mappée.
+
+- NASA Team : le rapport de polarisation PR(19) et le rapport de gradient
+  GR(37V/19V) sont indépendants de la température physique. En écrivant
+  chaque Tᴮ comme mélange linéaire des points de calage (eau libre, glace de
+  première année, glace pluriannuelle), PR et GR donnent deux équations
+  linéaires en (C_FY, C_MY), résolues pour tous les pixels à la fois.
+- Bootstrap : dans le plan (19V, 37V), la concentration est la position du
+  pixel sur le segment qui va du point de l'eau libre à la droite de la
+  glace consolidée.
+"""
+
+import numpy as np
+
+# Ordre des canaux des grilles d'entrée
+SSMI_CHANNELS = ("19V", "19H", "22V", "37V", "37H", "91V", "91H")
+
+# Points de calage arctiques (K) : eau libre, glace de première année, pluriannuelle
+TIE_POINTS = {
+    "OW": {"19V": 177.1, "19H": 100.8, "22V": 196.0, "37V": 201.7, "37H": 132.1, "91V": 243.2, "91H": 196.9},
+    "FY": {"19V": 258.2, "19H": 242.8, "22V": 253.1, "37V": 252.8, "37H": 235.0, "91V": 232.0, "91H": 221.0},
+    "MY": {"19V": 223.2, "19H": 203.9, "22V": 213.0, "37V": 186.3, "37H": 170.5, "91V": 178.0, "91H": 165.0},
+}
+
+# Filtres météo de NASA Team (nuages, vapeur d'eau au-dessus de l'eau libre)
+WEATHER_GR3719 = 0.05
+WEATHER_GR2219 = 0.045
+
+# Lignes traitées à la fois
+CHUNK_ROWS = 64
+
+
+def _channels(grid, names, channels=SSMI_CHANNELS):
+    return [grid[..., channels.index(name)].astype(np.float64) for name in names]
+
+
+def _ratio(a, b):
+    return (a - b) / (a + b)
+
+
+def nasa_team(grid, channels=SSMI_CHANNELS, weather_filter=True):
+    """Concentrations totale, de première année et pluriannuelle ``(C, C_FY, C_MY)``."""
+    v19, h19, v22, v37 = _channels(grid, ("19V", "19H", "22V", "37V"), channels)
+    pr, gr = _ratio(v19, h19), _ratio(v37, v19)
+
+    # Chaque contrainte s'écrit A + B C_FY + C C_MY = 0
+    def constraint(ratio, high, low):
+        ow = TIE_POINTS["OW"]
+        terms = [(ow[high] - ow[low]) - ratio * (ow[high] + ow[low])]
+        for ice in ("FY", "MY"):
+            d_high = TIE_POINTS[ice][high] - ow[high]
+            d_low = TIE_POINTS[ice][low] - ow[low]
+            terms.append((d_high - d_low) - ratio * (d_high + d_low))
+        return terms
+
+    a1, b1, c1 = constraint(pr, "19V", "19H")
+    a2, b2, c2 = constraint(gr, "37V", "19V")
+    determinant = b1 * c2 - b2 * c1
+    first_year = (c1 * a2 - c2 * a1) / determinant
+    multiyear = (b2 * a1 - b1 * a2) / determinant
+    total = first_year + multiyear
+
+    if weather_filter:
+        weather = (gr > WEATHER_GR3719) | (_ratio(v22, v19) > WEATHER_GR2219)
+        total = np.where(weather, 0.0, total)
+    return np.clip(total, 0, 1), np.clip(first_year, 0, 1), np.clip(multiyear, 0, 1)
+
+
+def bootstrap(grid, channels=SSMI_CHANNELS):
+    """Concentration totale par la méthode Bootstrap dans le plan (19V, 37V)."""
+    v19, v37 = _channels(grid, ("19V", "37V"), channels)
+    ow, fy, my = (TIE_POINTS[kind] for kind in ("OW", "FY", "MY"))
+    # Droite de la glace consolidée : 37V = intercept + slope · 19V
+    slope = (fy["37V"] - my["37V"]) / (fy["19V"] - my["19V"])
+    intercept = fy["37V"] - slope * fy["19V"]
+
+    d19, d37 = v19 - ow["19V"], v37 - ow["37V"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        reach = (intercept + slope * ow["19V"] - ow["37V"]) / (d37 - slope * d19)
+        concentration = np.where(reach > 0, 1 / reach, 0.0)
+    return np.clip(np.nan_to_num(concentration), 0, 1)
+
+
+def retrieve(grid, algorithm="nasa_team", channels=SSMI_CHANNELS, out=None):
+    """
+    Concentration totale ``(lignes, colonnes)`` en ``float32``, calculée par
+    blocs de ``CHUNK_ROWS`` lignes (``grid`` peut être en mémoire mappée).
+    """
+    if out is None:
+        out = np.empty(grid.shape[:2], dtype=np.float32)
+    for start in range(0, grid.shape[0], CHUNK_ROWS):
+        block = grid[start:start + CHUNK_ROWS]
+        if algorithm == "nasa_team":
+            out[start:start + CHUNK_ROWS] = nasa_team(block, channels)[0]
+        elif algorithm == "bootstrap":
+            out[start:start + CHUNK_ROWS] = bootstrap(block, channels)
+        else:
+            raise ValueError(f"Algorithme inconnu : {algorithm} (nasa_team ou bootstrap)")
+    return out
+
+
+def mix_tie_points(concentration, multiyear_fraction, channels=SSMI_CHANNELS):
+    """Tᴮ ``(..., canaux)`` d'un mélange eau libre / glace de première année / pluriannuelle."""
+    concentration = np.asarray(concentration, dtype=float)[..., None]
+    multiyear = np.asarray(multiyear_fraction, dtype=float)[..., None]
+    ow, fy, my = (np.array([TIE_POINTS[kind][name] for name in channels]) for kind in ("OW", "FY", "MY"))
+    return ow + concentration * ((1 - multiyear) * (fy - ow) + multiyear * (my - ow))
+
+
+def synthetic_freeze_up(day, shape=(448, 304), days=10, noise=1.5, seed=0):
+    """
+    Grille de Tᴮ synthétique ``shape + (7,)`` au jour ``day`` d'un englacement :
+    la banquise pluriannuelle centrale s'étend jusqu'à couvrir la grille en
+    ``days`` jours, avec une lisière de quelques pixels et un bruit
+    radiométrique gaussien de ``noise`` K.
+    """
+    rng = np.random.default_rng(seed)
+    rows, cols = shape
+    y, x = np.ogrid[-1:1:rows * 1j, -1:1:cols * 1j]
+    # Distance au pôle, déformée par une perturbation fixe de la lisière
+    angle = np.arctan2(y, x)
+    distance = np.hypot(x, y) * (1 + 0.12 * np.sin(3 * angle) + 0.06 * np.cos(5 * angle + 1))
+    edge = 0.35 + 1.1 * np.clip(day / days, 0, 1)
+    concentration = np.clip((edge - distance) / 0.08, 0, 1)
+    multiyear = np.clip((0.45 - distance) / 0.2, 0, 0.8)
+    grid = mix_tie_points(concentration, multiyear)
+    return grid + rng.normal(0, noise, grid.shape)
@@ -0,0 +1,169 @@
+"""
+Traces au sol, fauchées et couverture cumulée d'un radiomètre en orbite
+polaire héliosynchrone.
+
+L'orbite est circulaire ; sa précession nodale (J2) est celle qui garde le
+plan orbital fixe par rapport au Soleil. Les positions de tous les instants
+et de tous les points de la fauchée sont calculées en un seul passage
+vectorisé (par blocs pour borner la mémoire) puis réduites à une liste
+d'événements « la cellule c est observée pour la première fois de la
+révolution r à l'instant t ». ``CoverageAccumulator`` rejoue ces événements
+dans l'ordre : avancer d'une image ne coûte que les nouveaux événements,
+jamais un recalcul de la grille.
+"""
+
+import numpy as np
+
+EARTH_RADIUS = 6371.0          # km
+EARTH_MU = 398600.4418         # km³/s²
+EARTH_J2 = 1.08263e-3
+EARTH_ROTATION = 7.2921159e-5  # rad/s
+TROPICAL_YEAR = 365.2422 * 86400.0
+
+# Altitude de l'orbite et largeur de fauchée au sol (km)
+SENSORS = {
+    "AMSR2": {"altitude": 700.0, "swath": 1450.0},
+    "SSM/I": {"altitude": 833.0, "swath": 1400.0},
+}
+
+# Nombre d'instants traités à la fois par coverage_events
+CHUNK_SIZE = 4096
+
+
+def orbital_period(altitude):
+    """Période d'une orbite circulaire à ``altitude`` km, en secondes."""
+    radius = EARTH_RADIUS + altitude
+    return 2 * np.pi * np.sqrt(radius ** 3 / EARTH_MU)
+
+
+def sun_synchronous_inclination(altitude):
+    """Inclinaison (rad) pour laquelle la précession nodale suit le Soleil."""
+    radius = EARTH_RADIUS + altitude
+    mean_motion = 2 * np.pi / orbital_period(altitude)
+    precession = 2 * np.pi / TROPICAL_YEAR
+    return np.arccos(-precession / (1.5 * mean_motion * EARTH_J2 * (EARTH_RADIUS / radius) ** 2))
+
+
+def _orbit_frame(times, altitude, inclination, raan, anomaly):
+    """Position unitaire et normale du plan orbital (repère inertiel), ``(n, 3)`` chacune."""
+    radius = EARTH_RADIUS + altitude
+    mean_motion = 2 * np.pi / orbital_period(altitude)
+    node_rate = -1.5 * mean_motion * EARTH_J2 * (EARTH_RADIUS / radius) ** 2 * np.cos(inclination)
+
+    u = anomaly + mean_motion * times
+    node = raan + node_rate * times
+    cos_u, sin_u = np.cos(u), np.sin(u)
+    cos_n, sin_n = np.cos(node), np.sin(node)
+    cos_i, sin_i = np.cos(inclination), np.sin(inclination)
+    position = np.stack([
+        cos_n * cos_u - sin_n * sin_u * cos_i,
+        sin_n * cos_u + cos_n * sin_u * cos_i,
+        sin_u * sin_i,
+    ], axis=-1)
+    normal = np.stack([sin_n * sin_i, -cos_n * sin_i, np.full_like(u, cos_i)], axis=-1)
+    return position, normal
+
+
+def _to_lat_lon(vectors, times):
+    """Latitude et longitude (degrés) de vecteurs unitaires inertiels, Terre tournante."""
+    lat = np.degrees(np.arcsin(np.clip(vectors[..., 2], -1.0, 1.0)))
+    lon = np.degrees(np.arctan2(vectors[..., 1], vectors[..., 0]) - EARTH_ROTATION * times)
+    return lat, (lon + 180.0) % 360.0 - 180.0
+
+
+def ground_track(times, altitude, inclination=None, raan=0.0, anomaly=0.0):
+    """Latitude et longitude (degrés) du point sous-satellite aux instants ``times`` (s)."""
+    times = np.asarray(times, dtype=float)
+    if inclination is None:
+        inclination = sun_synchronous_inclination(altitude)
+    position, _ = _orbit_frame(times, altitude, inclination, raan, anomaly)
+    return _to_lat_lon(position, times)
+
+
+def swath_points(times, altitude, swath, cross_samples, inclination=None, raan=0.0, anomaly=0.0):
+    """
+    Points de la fauchée, perpendiculaires au plan orbital : latitudes et
+    longitudes de forme ``(len(times), cross_samples)``.
+    """
+    times = np.asarray(times, dtype=float)
+    if inclination is None:
+        inclination = sun_synchronous_inclination(altitude)
+    position, normal = _orbit_frame(times, altitude, inclination, raan, anomaly)
+    half_angle = swath / 2 / EARTH_RADIUS
+    offsets = np.linspace(-half_angle, half_angle, cross_samples)
+    # Grand cercle perpendiculaire à la trace : p cos δ + n sin δ
+    points = (position[:, None, :] * np.cos(offsets)[None, :, None]
+              + normal[:, None, :] * np.sin(offsets)[None, :, None])
+    return _to_lat_lon(points, times[:, None])
+
+
+def grid_shape(resolution):
+    """Nombre de lignes et de colonnes d'une grille latitude/longitude (degrés)."""
+    return int(round(180 / resolution)), int(round(360 / resolution))
+
+
+def grid_cells(lat, lon, resolution):
+    """Indice à plat (ligne 0 au pôle Nord) de la cellule contenant chaque point."""
+    rows, cols = grid_shape(resolution)
+    row = np.clip(((90.0 - lat) / resolution).astype(np.int64), 0, rows - 1)
+    col = ((lon + 180.0) / resolution).astype(np.int64) % cols
+    return row * cols + col
+
+
+def coverage_events(duration, sensor="AMSR2", resolution=1.0, raan=0.0, anomaly=0.0):
+    """
+    Première observation de chaque cellule à chaque révolution, sur
+    ``duration`` secondes : ``(instants, cellules)`` triés dans le temps.
+
+    L'échantillonnage (le long de la trace et en travers) vaut une demi
+    cellule, ce qui suffit pour ne laisser aucun trou dans la fauchée.
+    """
+    altitude, swath = SENSORS[sensor]["altitude"], SENSORS[sensor]["swath"]
+    period = orbital_period(altitude)
+    step = resolution * np.pi / 180 * EARTH_RADIUS / 2
+    ground_speed = 2 * np.pi * EARTH_RADIUS / period
+    times = np.arange(0.0, duration, step / ground_speed)
+    cross_samples = int(np.ceil(swath / step)) + 1
+    rows, cols = grid_shape(resolution)
+
+    keys = []
+    for start in range(0, len(times), CHUNK_SIZE):
+        chunk = times[start:start + CHUNK_SIZE]
+        lat, lon = swath_points(chunk, altitude, swath, cross_samples, raan=raan, anomaly=anomaly)
+        revolution = (chunk // period).astype(np.int64)[:, None]
+        keys.append((revolution * rows * cols + grid_cells(lat, lon, resolution)).ravel())
+    keys = np.concatenate(keys)
+
+    # Une seule observation par cellule et par révolution, dans l'ordre du temps
+    _, first = np.unique(keys, return_index=True)
+    first.sort()
+    sample_times = np.repeat(times, cross_samples)[first]
+    return sample_times, keys[first] % (rows * cols)
+
+
+class CoverageAccumulator:
+    """
+    Nombre de passages par cellule, rejoué dans le temps.
+
+    ``advance(t)`` ajoute les événements compris entre l'instant courant et
+    ``t`` et retourne les cellules modifiées : le coût est proportionnel au
+    nombre de nouveaux événements.
+    """
+
+    def __init__(self, times, cells, n_cells):
+        self.times = np.asarray(times)
+        self.cells = np.asarray(cells)
+        self.counts = np.zeros(n_cells, dtype=np.int32)
+        self.time = 0.0
+        self._next = 0
+
+    def advance(self, time):
+        stop = int(np.searchsorted(self.times, time, side="right"))
+        if stop <= self._next:
+            self.time = max(self.time, time)
+            return self.cells[:0]
+        new_cells = self.cells[self._next:stop]
+        np.add.at(self.counts, new_cells, 1)
+        self._next = stop
+        self.time = time
+        return new_cells
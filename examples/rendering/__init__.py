@@ -0,0 +1,3 @@
+"""
+Outils de rendu partagés par les animations (tracés, caches, composants).
+"""
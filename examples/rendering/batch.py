@@ -0,0 +1,190 @@
+"""
+Rendu en lot de toutes les scènes des exemples, en parallèle.
+
+Usage (depuis le dossier ``examples``) ::
+
+    python -m rendering.batch -q h -j 16
+    python -m rendering.batch -q l RadarBasics SoilMoistureEffect
+
+Les scènes sont découvertes dans ``examples/*.py`` (``rendering.scenes``,
+sans importer manim) puis réparties sur un
+``ProcessPoolExecutor``. Les plus longues sont lancées en premier (d'après les
+durées du rendu précédent, ou à défaut d'une estimation statique tirée des
+``run_time`` et ``self.wait`` de ``construct``) pour que la durée totale tende
+vers celle de la scène la plus longue. Les scènes composées
+(``SceneSequence``) sont rendues en dernier, à partir des vidéos déjà
+produites. Un résumé des durées est affiché et écrit dans
+``<media>/render_summary.json``.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from .scenes import EXAMPLES_DIR, discover_scenes
+
+# Mêmes lettres que l'option -q de manim
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+SUMMARY_NAME = "render_summary.json"
+
+
+def _load_history(summary_path):
+    try:
+        entries = json.loads(Path(summary_path).read_text(encoding="utf-8"))["scenes"]
+    except (FileNotFoundError, KeyError, ValueError):
+        return {}
+    return {
+        (entry["file"], entry["scene"]): entry["seconds"]
+        for entry in entries
+        if entry.get("status") == "ok"
+    }
+
+
+def schedule(scenes, history):
+    """Trie les scènes de la plus longue à la plus courte (durée attendue)."""
+    # Facteur entre durée d'animation estimée et temps de rendu mesuré
+    ratios = sorted(
+        history[scene["file"], scene["scene"]] / scene["estimate"]
+        for scene in scenes
+        if (scene["file"], scene["scene"]) in history and scene["estimate"] > 0
+    )
+    ratio = ratios[len(ratios) // 2] if ratios else 1.0
+
+    def expected(scene):
+        return history.get((scene["file"], scene["scene"]), scene["estimate"] * ratio)
+
+    return sorted(scenes, key=expected, reverse=True)
+
+
+def render_scene(file_name, scene_name, quality, media_dir):
+    """
+    Rend une scène dans le processus courant (exécuté par les workers).
+
+    manim n'est importé qu'ici : le processus principal reste léger.
+    """
+    if str(EXAMPLES_DIR) not in sys.path:
+        sys.path.insert(0, str(EXAMPLES_DIR))
+
+    from manim import tempconfig
+
+    from .composition import record_render
+    from .text import LEVELS, text_cache_stats
+
+    before = text_cache_stats()
+    start = time.perf_counter()
+    try:
+        module = importlib.import_module(Path(file_name).stem)
+        scene_class = getattr(module, scene_name)
+        with tempconfig({
+            "quality": QUALITIES[quality],
+            "input_file": str(EXAMPLES_DIR / file_name),
+            "media_dir": str(media_dir),
+            "preview": False,
+            "progress_bar": "none",
+            "verbosity": "WARNING",
+        }):
+            scene = scene_class()
+            scene.render()
+            # Rend la vidéo réutilisable par les scènes composées
+            record_render(scene)
+    except Exception:
+        return {"status": "error", "seconds": time.perf_counter() - start,
+                "error": traceback.format_exc()}
+    after = text_cache_stats()
+    return {"status": "ok", "seconds": time.perf_counter() - start,
+            "text_cache": {level: after[level] - before[level] for level in LEVELS}}
+
+
+def render_all(scenes, quality="h", workers=None, media_dir=EXAMPLES_DIR / "media"):
+    """Rend ``scenes`` en parallèle et écrit le résumé ; retourne ses entrées."""
+    media_dir = Path(media_dir).resolve()
+    summary_path = media_dir / SUMMARY_NAME
+    ordered = schedule(scenes, _load_history(summary_path))
+
+    results = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Les scènes composées réutilisent les vidéos des autres : elles passent
+        # en second, une fois toutes les sous-scènes écrites
+        for wave in (False, True):
+            futures = {
+                executor.submit(render_scene, scene["file"], scene["scene"], quality, media_dir): scene
+                for scene in ordered
+                if scene.get("composite", False) == wave
+            }
+            for future in as_completed(futures):
+                scene = futures[future]
+                result = {"file": scene["file"], "scene": scene["scene"], **future.result()}
+                results.append(result)
+                status = "ok" if result["status"] == "ok" else "ÉCHEC"
+                print(f"[{status:>5}] {scene['scene']} ({scene['file']}) : {result['seconds']:.1f} s",
+                      flush=True)
+    wall_time = time.perf_counter() - start
+
+    results.sort(key=lambda entry: entry["seconds"], reverse=True)
+    # Part des textes servis par le cache de rendering.text sur tout le lot
+    text_cache = {}
+    for entry in results:
+        for level, count in entry.get("text_cache", {}).items():
+            text_cache[level] = text_cache.get(level, 0) + count
+    requests = sum(text_cache.values())
+    hit_rate = (requests - text_cache.get("pango", 0)) / requests if requests else 0.0
+
+    media_dir.mkdir(parents=True, exist_ok=True)
+    summary_path.write_text(json.dumps({
+        "quality": quality,
+        "workers": workers or os.cpu_count(),
+        "wall_time": wall_time,
+        "text_cache": {**text_cache, "hit_rate": hit_rate},
+        "scenes": results,
+    }, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    print(f"\n{len(results)} scènes rendues en {wall_time:.1f} s (résumé : {summary_path})")
+    if requests:
+        print(f"Textes : {requests} demandes, {hit_rate:.0%} servies par le cache")
+    for entry in results:
+        print(f"  {entry['seconds']:8.1f} s  {entry['scene']}")
+        if entry["status"] != "ok":
+            print(entry["error"], file=sys.stderr)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rend toutes les scènes des exemples en parallèle.")
+    parser.add_argument("scenes", nargs="*",
+                        help="Noms des scènes à rendre (par défaut : toutes)")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="h",
+                        help="Qualité, comme l'option -q de manim (défaut : h)")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="Nombre de processus (défaut : nombre de cœurs)")
+    parser.add_argument("--media-dir", default=str(EXAMPLES_DIR / "media"),
+                        help="Dossier de sortie de manim (défaut : examples/media)")
+    args = parser.parse_args(argv)
+
+    scenes = discover_scenes()
+    if args.scenes:
+        unknown = set(args.scenes) - {scene["scene"] for scene in scenes}
+        if unknown:
+            parser.error(f"Scènes inconnues : {', '.join(sorted(unknown))}")
+        scenes = [scene for scene in scenes if scene["scene"] in args.scenes]
+
+    results = render_all(scenes, quality=args.quality, workers=args.workers,
+                         media_dir=args.media_dir)
+    return 0 if all(entry["status"] == "ok" for entry in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+Composition de scènes : une vidéo maîtresse obtenue en enchaînant des sous-scènes.
+
+Chaque sous-scène est rendue normalement, dans son propre fichier (le même
+que ``manim fichier.py SousScene``), puis les vidéos sont concaténées par
+copie de flux, sans ré-encoder ni re-rastériser la moindre image. Une
+sous-scène n'est rendue à nouveau que si son code a changé (source complète
+de son fichier et des modules locaux qu'il importe, ``physics`` et
+``rendering`` compris) : corriger une scène ne coûte que son propre rendu et
+une concaténation. Le rendu en lot
+(``rendering.batch``) enregistre aussi ses vidéos, qui sont donc réutilisées.
+"""
+
+import ast
+import importlib.util
+import inspect
+import sys
+from pathlib import Path
+
+from manim import Scene, __version__, config, logger, tempconfig
+from manim.utils.file_ops import open_media_file
+
+from physics.cache import cache_dir, fingerprint
+
+from .latex import precompile_tex
+
+
+def _imported_modules(module):
+    """Modules déjà chargés que ``module`` importe (à tout niveau de son source)."""
+    for node in ast.walk(ast.parse(inspect.getsource(module))):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                base = importlib.util.resolve_name("." * node.level + base, module.__package__)
+            # ``from paquet import sous_module`` importe aussi ``paquet.sous_module``
+            names = [base] + [f"{base}.{alias.name}" for alias in node.names]
+        else:
+            continue
+        for name in names:
+            if name in sys.modules:
+                yield sys.modules[name]
+
+
+def _local_sources(module):
+    """
+    Sources de ``module`` et, récursivement, des modules qu'il importe depuis
+    son propre répertoire (``physics``, ``rendering``...).
+    """
+    root = Path(module.__file__).resolve().parent
+    sources = {}
+    pending = [module]
+    while pending:
+        current = pending.pop()
+        path = getattr(current, "__file__", None)
+        if not path or current.__name__ in sources or not Path(path).resolve().is_relative_to(root):
+            continue
+        sources[current.__name__] = inspect.getsource(current)
+        pending.extend(_imported_modules(current))
+    return sorted(sources.items())
+
+
+def scene_fingerprint(scene_class):
+    """
+    Empreinte d'une scène : source complète de son module et des modules
+    locaux qu'il importe, et paramètres de rendu qui n'apparaissent pas dans
+    le chemin de la vidéo.
+    """
+    return fingerprint(
+        __version__,
+        _local_sources(inspect.getmodule(scene_class)),
+        str(config.background_color),
+    )
+
+
+def _movie_path(scene):
+    return Path(scene.renderer.file_writer.movie_file_path)
+
+
+def _record_path(movie):
+    return cache_dir("compositions") / f"{fingerprint(str(movie.resolve()))}.txt"
+
+
+def record_render(scene):
+    """Note que la vidéo de ``scene`` correspond à son code actuel."""
+    _record_path(_movie_path(scene)).write_text(scene_fingerprint(type(scene)), encoding="utf-8")
+
+
+def is_up_to_date(scene):
+    """Vrai si la vidéo de ``scene`` existe et a été rendue avec le code actuel."""
+    movie = _movie_path(scene)
+    record = _record_path(movie)
+    return (
+        not config["disable_caching"]
+        and movie.exists()
+        and record.exists()
+        and record.read_text(encoding="utf-8") == scene_fingerprint(type(scene))
+    )
+
+
+class SceneSequence(Scene):
+    """
+    Scène composée des scènes listées dans ``scenes``, jouées dans l'ordre.
+
+    Exemple ::
+
+        class Complete(SceneSequence):
+            scenes = [Introduction, Resultats, Conclusion]
+    """
+
+    scenes = ()
+
+    def render_part(self, scene_class):
+        """Rend ``scene_class`` si nécessaire et retourne le chemin de sa vidéo."""
+        # Les sous-scènes écrivent dans leur propre fichier, sans prévisualisation
+        with tempconfig({"output_file": "", "preview": False, "show_in_file_browser": False}):
+            scene = scene_class()
+            if is_up_to_date(scene):
+                logger.info(f"{scene_class.__name__} : vidéo à jour réutilisée")
+            else:
+                scene.render()
+                record_render(scene)
+            return str(_movie_path(scene))
+
+    def render(self, preview=False):
+        # Les formules de toutes les sous-scènes partagent une compilation LaTeX
+        precompile_tex(*self.scenes)
+        movies = [self.render_part(scene_class) for scene_class in self.scenes]
+
+        file_writer = self.renderer.file_writer
+        logger.info(f"Concaténation de {len(movies)} scènes (copie de flux)")
+        file_writer.combine_files(movies, Path(file_writer.movie_file_path))
+        file_writer.print_file_ready_message(file_writer.movie_file_path)
+
+        if preview:
+            config["preview"] = True
+        if config["preview"] or config["show_in_file_browser"]:
+            open_media_file(file_writer)
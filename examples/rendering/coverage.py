@@ -0,0 +1,125 @@
+"""
+Carte de couverture d'un radiomètre, remplie image par image.
+
+``CoverageMap`` est une image latitude/longitude (une cellule de la grille
+par pixel) dont les couleurs suivent le nombre de passages d'un
+``physics.swath.CoverageAccumulator``. Les événements de couverture de
+plusieurs jours d'orbite sont calculés une fois à la construction ; à chaque
+image, seuls les pixels des cellules nouvellement observées sont recolorés
+(``rendering.raster.RasterMap.update_cells``), sans reconstruire le raster.
+
+Exemple ::
+
+    coverage = CoverageMap(3 * 86400, sensor="AMSR2")
+    self.add(coverage)
+    self.play(AccumulateCoverage(coverage), run_time=8)
+"""
+
+import numpy as np
+from manim import (
+    BLUE, BLUE_E, GREEN, GREY_E, RED, YELLOW,
+    Animation, color_gradient, color_to_int_rgba, linear,
+)
+
+from physics.swath import (
+    SENSORS, CoverageAccumulator, coverage_events, grid_shape, ground_track,
+)
+
+from .raster import RasterMap
+
+
+def coverage_palette(max_passes, colors=(BLUE_E, BLUE, GREEN, YELLOW, RED), background=GREY_E):
+    """Couleurs RGBA (``uint8``) pour 0 à ``max_passes`` passages."""
+    ramp = color_gradient(colors, max_passes)
+    return np.array(
+        [color_to_int_rgba(background)] + [color_to_int_rgba(color) for color in ramp],
+        dtype=np.uint8,
+    )
+
+
+class CoverageMap(RasterMap):
+    """
+    Couverture cumulée sur ``duration`` secondes d'orbite, en projection
+    équirectangulaire (pôle Nord en haut).
+
+    Paramètres
+    ----------
+    duration
+        Durée simulée, en secondes.
+    sensor
+        Clé de ``physics.swath.SENSORS`` (altitude et largeur de fauchée).
+    resolution
+        Taille d'une cellule, en degrés.
+    max_passes
+        Nombre de passages à partir duquel la couleur n'évolue plus.
+    width
+        Largeur de la carte dans la scène.
+    """
+
+    def __init__(
+        self,
+        duration,
+        sensor="AMSR2",
+        resolution=1.0,
+        max_passes=8,
+        width=10.0,
+        raan=0.0,
+        **kwargs,
+    ):
+        self.duration = duration
+        self.sensor = sensor
+        self.raan = raan
+        self.max_passes = max_passes
+
+        rows, cols = grid_shape(resolution)
+        times, cells = coverage_events(duration, sensor, resolution, raan=raan)
+        self.accumulator = CoverageAccumulator(times, cells, rows * cols)
+
+        super().__init__(
+            np.zeros((rows, cols)),
+            palette=coverage_palette(max_passes),
+            vmax=max_passes,
+            width=width,
+            **kwargs,
+        )
+
+    def point(self, lat, lon):
+        """Position dans la scène du point (``lat``, ``lon``) en degrés."""
+        left, top = self.get_corner(np.array([-1, 1, 0]))[:2]
+        return np.array([
+            left + (lon + 180.0) / 360.0 * self.width,
+            top - (90.0 - lat) / 180.0 * self.height,
+            0.0,
+        ])
+
+    def satellite_point(self, time):
+        """Position dans la scène du point sous-satellite à l'instant ``time``."""
+        lat, lon = ground_track([time], SENSORS[self.sensor]["altitude"], raan=self.raan)
+        return self.point(lat[0], lon[0])
+
+    def advance_to(self, time):
+        """Ajoute les passages jusqu'à ``time`` et recolore les seules cellules touchées."""
+        cells = self.accumulator.advance(time)
+        if len(cells):
+            self.update_cells(cells, self.accumulator.counts[cells])
+        return self
+
+
+class AccumulateCoverage(Animation):
+    """
+    Fait défiler le temps d'une ``CoverageMap`` de son instant courant
+    jusqu'à ``end`` (sa durée par défaut). ``marker``, s'il est donné, suit
+    le point sous-satellite.
+    """
+
+    def __init__(self, coverage, end=None, marker=None, rate_func=linear, **kwargs):
+        self.start_time = coverage.accumulator.time
+        self.end_time = coverage.duration if end is None else end
+        self.marker = marker
+        super().__init__(coverage, rate_func=rate_func, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        time = self.start_time + self.rate_func(alpha) * (self.end_time - self.start_time)
+        self.mobject.advance_to(time)
+        if self.marker is not None:
+            self.marker.move_to(self.mobject.satellite_point(time))
@@ -0,0 +1,144 @@
+"""
+Émission continue de fronts d'onde micro-onde, stockée dans des tableaux NumPy.
+
+Un ``Circle`` et une animation ``.animate`` par front d'onde limitent
+l'émission à quelques anneaux. ``WaveEmitter`` conserve l'origine et l'âge
+de tous les anneaux dans deux tableaux ; à chaque image, positions, rayons et
+opacités en découlent en une seule opération vectorisée (forme fermée en
+fonction de l'âge, sans accumulation d'erreurs). Les anneaux sont dessinés
+par quelques chemins seulement : un par niveau d'opacité (``levels``), quel
+que soit le nombre d'anneaux.
+
+Exemple ::
+
+    waves = WaveEmitter(surface_point, satellite.get_center(), rate=50)
+    self.add(waves.start())
+    self.wait(2)
+    waves.stop()
+    self.wait(waves.lifetime)
+    self.remove(waves)
+"""
+
+import numpy as np
+from manim import YELLOW, VGroup, VMobject
+
+# Cercle unité en quatre arcs de Bézier cubiques (16 points)
+_KAPPA = 4 * (np.sqrt(2) - 1) / 3
+_UNIT_CIRCLE = np.array([
+    [1, 0], [1, _KAPPA], [_KAPPA, 1], [0, 1],
+    [0, 1], [-_KAPPA, 1], [-1, _KAPPA], [-1, 0],
+    [-1, 0], [-1, -_KAPPA], [-_KAPPA, -1], [0, -1],
+    [0, -1], [_KAPPA, -1], [1, -_KAPPA], [1, 0],
+], dtype=float)
+_UNIT_CIRCLE = np.column_stack([_UNIT_CIRCLE, np.zeros(len(_UNIT_CIRCLE))])
+
+
+def ring_points(centers, radii):
+    """Points de Bézier de ``len(radii)`` cercles, en un seul tableau ``(16 n, 3)``."""
+    return (radii[:, None, None] * _UNIT_CIRCLE[None] + centers[:, None, :]).reshape(-1, 3)
+
+
+class WaveEmitter(VGroup):
+    """
+    Anneaux émis en continu de ``start`` vers ``end``.
+
+    Paramètres
+    ----------
+    start, end
+        Point d'émission (surface) et point d'arrivée (capteur).
+    rate
+        Nombre d'anneaux émis par seconde.
+    lifetime
+        Durée du trajet d'un anneau, en secondes ; l'anneau s'efface
+        progressivement pendant ce temps.
+    start_radius, end_radius
+        Rayon à l'émission et à l'arrivée.
+    spread
+        Largeur de la zone d'émission autour de ``start`` (tirage uniforme).
+    levels
+        Nombre de niveaux d'opacité, donc de chemins dessinés.
+    """
+
+    def __init__(
+        self,
+        start,
+        end,
+        rate=40.0,
+        lifetime=1.5,
+        start_radius=0.1,
+        end_radius=0.3,
+        spread=0.0,
+        color=YELLOW,
+        stroke_width=2,
+        levels=8,
+        seed=0,
+        **kwargs,
+    ):
+        self.start_point = np.array(start, dtype=float)
+        self.end_point = np.array(end, dtype=float)
+        self.rate = rate
+        self.lifetime = lifetime
+        self.start_radius = start_radius
+        self.end_radius = end_radius
+        self.spread = spread
+        self.levels = levels
+        self.rng = np.random.default_rng(seed)
+
+        self.origins = np.zeros((0, 3))
+        self.ages = np.zeros(0)
+        self.emitting = False
+        self._pending = 0.0
+
+        super().__init__(
+            *(
+                VMobject(stroke_color=color, stroke_width=stroke_width,
+                         stroke_opacity=(level + 0.5) / levels, fill_opacity=0)
+                for level in range(levels)
+            ),
+            **kwargs,
+        )
+
+    def start(self):
+        """Lance l'émission (mise à jour à chaque image) ; retourne l'émetteur."""
+        self.emitting = True
+        if not self.has_time_based_updater():
+            self.add_updater(lambda emitter, dt: emitter.advance(dt))
+        return self
+
+    def stop(self):
+        """Arrête l'émission ; les anneaux déjà émis terminent leur trajet."""
+        self.emitting = False
+        return self
+
+    def emit(self, count, ages=None):
+        """Ajoute ``count`` anneaux à la source (d'âges ``ages``, nuls par défaut)."""
+        origins = np.repeat(self.start_point[None], count, axis=0)
+        if self.spread:
+            origins[:, 0] += self.rng.uniform(-self.spread / 2, self.spread / 2, count)
+        self.origins = np.concatenate([self.origins, origins])
+        self.ages = np.concatenate([self.ages, np.zeros(count) if ages is None else ages])
+
+    def advance(self, dt):
+        """Avance tous les anneaux de ``dt`` secondes et met à jour le dessin."""
+        self.ages += dt
+        if self.emitting and dt > 0:
+            self._pending += self.rate * dt
+            count = int(self._pending)
+            self._pending -= count
+            # Âges répartis sur l'intervalle pour une émission régulière
+            self.emit(count, ages=(np.arange(count)[::-1] + 0.5) / self.rate)
+
+        alive = self.ages < self.lifetime
+        self.origins = self.origins[alive]
+        self.ages = self.ages[alive]
+        self._redraw()
+        return self
+
+    def _redraw(self):
+        progress = self.ages / self.lifetime
+        centers = self.origins + progress[:, None] * (self.end_point - self.start_point)
+        radii = self.start_radius + (self.end_radius - self.start_radius) * progress
+        level = np.minimum(((1 - progress) * self.levels).astype(int), self.levels - 1)
+        for index, path in enumerate(self.submobjects):
+            selected = level == index
+            path.set_points(ring_points(centers[selected], radii[selected]))
@@ -0,0 +1,271 @@
+"""
+Compilation groupée des formules LaTeX d'une ou plusieurs scènes.
+
+Sans précaution, chaque ``MathTex``/``Tex`` lance son propre ``latex`` puis
+son propre ``dvisvgm`` (et un de plus par morceau d'un ``MathTex`` à
+plusieurs arguments). ``precompile_tex`` fait une passe préalable :
+
+1. les appels ``MathTex(...)``, ``Tex(...)``, ``BulletedList(...)``,
+   ``get_x_axis_label("...")``... dont les arguments sont littéraux sont
+   relevés dans le source des scènes (``ast``) ;
+2. ils sont instanciés une fois « à blanc » pour enregistrer les expressions
+   exactes que manim demandera (morceaux, environnement, gabarit) ;
+3. les expressions absentes du cache de manim sont compilées dans un seul
+   document, une page par expression, converties en un seul appel à
+   ``dvisvgm`` puis renommées selon le nom haché qu'attend manim.
+
+Lors du ``construct``, chaque formule trouve donc son SVG dans
+``media/Tex`` et aucun processus LaTeX n'est lancé. Les appels non littéraux
+(f-strings, listes construites) sont simplement compilés par manim comme
+avant ; en cas d'erreur dans le document groupé, manim recompile chaque
+formule séparément et signale précisément celle qui est fautive.
+"""
+
+import ast
+import inspect
+import os
+import re
+import subprocess
+import textwrap
+import threading
+from pathlib import Path
+
+from manim import BulletedList, MathTex, SingleStringMathTex, Tex, Title, config, logger
+from manim.mobject.text import tex_mobject
+from manim.utils.tex_file_writing import (
+    generate_tex_file,
+    tex_compilation_command,
+    tex_hash,
+)
+
+# Constructeurs dont on peut rejouer l'appel
+TEX_CLASSES = {
+    "MathTex": MathTex,
+    "Tex": Tex,
+    "SingleStringMathTex": SingleStringMathTex,
+    "BulletedList": BulletedList,
+    "Title": Title,
+}
+
+# Méthodes des axes qui transforment une chaîne en MathTex
+AXIS_LABEL_METHODS = {"get_x_axis_label", "get_y_axis_label"}
+
+# Paramètres qui changent le code LaTeX produit (les autres, comme la couleur
+# ou la taille, n'agissent que sur le SVG déjà compilé)
+TEX_KEYWORDS = {"arg_separator", "tex_environment", "substrings_to_isolate"}
+
+# Sérialise les compilations : un document groupé et une compilation de manim
+# ne doivent pas se croiser dans ``media/Tex`` (voir ``rendering.prefetch``)
+TEX_LOCK = threading.RLock()
+
+# Fichiers intermédiaires d'un document groupé, supprimés après conversion
+_BATCH_SUFFIXES = (".aux", ".log", ".dvi", ".xdv", ".pdf")
+
+# SVG minimal renvoyé pendant l'enregistrement, pour que la construction aille
+# jusqu'au découpage en morceaux
+_PLACEHOLDER_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10" viewBox="0 0 10 10">'
+    '<path d="M0 0H10V10H0Z"/></svg>'
+)
+
+
+def _literal(node):
+    try:
+        return True, ast.literal_eval(node)
+    except ValueError:
+        return False, None
+
+
+def _call_arguments(node):
+    """``(args, kwargs)`` littéraux d'un appel, ou ``None`` s'il dépend du contexte."""
+    args = []
+    for arg in node.args:
+        ok, value = _literal(arg)
+        if not ok:
+            return None
+        args.append(value)
+
+    kwargs = {}
+    for keyword in node.keywords:
+        if keyword.arg == "tex_to_color_map" and isinstance(keyword.value, ast.Dict):
+            # Seules les clés découpent la formule ; les couleurs n'importent pas
+            ok, keys = _literal(ast.List(elts=keyword.value.keys, ctx=ast.Load()))
+            if not ok:
+                return None
+            kwargs.setdefault("substrings_to_isolate", []).extend(keys)
+        elif keyword.arg in TEX_KEYWORDS:
+            ok, value = _literal(keyword.value)
+            if not ok:
+                return None
+            kwargs[keyword.arg] = value
+        elif keyword.arg is None or keyword.arg == "tex_template":
+            return None
+    return args, kwargs
+
+
+def collect_tex_calls(scene_class):
+    """
+    Appels LaTeX littéraux du source de ``scene_class``, sous la forme
+    ``(constructeur, args, kwargs)``.
+    """
+    tree = ast.parse(textwrap.dedent(inspect.getsource(scene_class)))
+    calls = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        if isinstance(func, ast.Name) and func.id in TEX_CLASSES:
+            arguments = _call_arguments(node)
+            if arguments is not None:
+                calls.append((TEX_CLASSES[func.id], *arguments))
+        elif (
+            isinstance(func, ast.Attribute)
+            and func.attr in AXIS_LABEL_METHODS
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+            and isinstance(node.args[0].value, str)
+        ):
+            calls.append((MathTex, [node.args[0].value], {}))
+    return calls
+
+
+def record_tex_expressions(calls):
+    """
+    Instancie ``calls`` sans compiler et retourne les triplets
+    ``(expression, environnement, gabarit)`` transmis à ``tex_to_svg_file``.
+    """
+    placeholder = Path(config.get_dir("tex_dir")) / "placeholder.svg"
+    placeholder.parent.mkdir(parents=True, exist_ok=True)
+    if not placeholder.exists():
+        placeholder.write_text(_PLACEHOLDER_SVG, encoding="utf-8")
+
+    recorded = []
+
+    def record(expression, environment=None, tex_template=None):
+        recorded.append((expression, environment, tex_template or config["tex_template"]))
+        return placeholder
+
+    original = tex_mobject.tex_to_svg_file
+    tex_mobject.tex_to_svg_file = record
+    try:
+        for constructor, args, kwargs in calls:
+            try:
+                constructor(*args, **kwargs)
+            except Exception:
+                # Les expressions déjà enregistrées restent valables
+                continue
+    finally:
+        tex_mobject.tex_to_svg_file = original
+    return recorded
+
+
+def _batch_document(template, pages):
+    """
+    Document de plusieurs pages à partir du gabarit de manim. La classe
+    ``standalone`` (une seule page rognée) est remplacée par ``article`` :
+    le rognage est de toute façon refait par ``dvisvgm``.
+    """
+    head, tail = template.body.split(template.placeholder_text, 1)
+    head = re.sub(r"\\documentclass(\[[^\]]*\])?\{standalone\}", r"\\documentclass{article}", head, count=1)
+    head = head.replace("\\begin{document}", "\\pagestyle{empty}\n\\begin{document}", 1)
+    return head + "\n\\newpage\n".join(pages) + tail
+
+
+def _page_code(template, expression, environment):
+    """Corps de la page d'une expression (code complet privé de l'en-tête et de la fin)."""
+    if environment is not None:
+        texcode = template.get_texcode_for_expression_in_env(expression, environment)
+    else:
+        texcode = template.get_texcode_for_expression(expression)
+    head, tail = template.body.split(template.placeholder_text, 1)
+    return texcode[len(head):len(texcode) - len(tail)]
+
+
+def compile_batch(template, entries):
+    """
+    Compile ``entries`` (``[(expression, environnement, svg attendu)]``) en un
+    seul document et place chaque page à l'emplacement attendu par manim.
+
+    Si le document ne compile pas, il est coupé en deux et chaque moitié est
+    recompilée : une formule erronée ne coûte que quelques passes de plus et
+    reste seule, pour que manim la compile et affiche son erreur.
+
+    Retourne le nombre de SVG produits.
+    """
+    with TEX_LOCK:
+        return _compile_batch(template, entries)
+
+
+def _compile_batch(template, entries):
+    tex_dir = Path(config.get_dir("tex_dir"))
+    pages = [_page_code(template, expression, environment) for expression, environment, _ in entries]
+    document = _batch_document(template, pages)
+    batch_file = tex_dir / f"batch_{tex_hash(document)}.tex"
+    batch_file.write_text(document, encoding="utf-8")
+
+    output_file = batch_file.with_suffix(template.output_format)
+    command = tex_compilation_command(template.tex_compiler, template.output_format, batch_file, tex_dir)
+    if os.system(command) != 0 or not output_file.exists():
+        if len(entries) == 1:
+            return 0
+        middle = len(entries) // 2
+        return _compile_batch(template, entries[:middle]) + _compile_batch(template, entries[middle:])
+
+    # Une seule conversion pour toutes les pages : <batch>-<page>.svg
+    subprocess.run(
+        ["dvisvgm", *(["--pdf"] if template.output_format == ".pdf" else []),
+         "-p", "1-", str(output_file), "-n", "-v", "0",
+         "-o", str(tex_dir / f"{batch_file.stem}-%p.svg")],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False,
+    )
+    page_files = {}
+    for path in tex_dir.glob(f"{batch_file.stem}-*.svg"):
+        page_files[int(path.stem.rsplit("-", 1)[1])] = path
+    if not config["no_latex_cleanup"]:
+        for suffix in _BATCH_SUFFIXES:
+            batch_file.with_suffix(suffix).unlink(missing_ok=True)
+
+    if len(page_files) != len(entries):
+        # Une expression sans contenu visible ou un saut de page imprévu
+        # décale les pages : on laisse manim compiler ces formules
+        logger.warning(f"{len(page_files)} pages pour {len(entries)} formules : compilation séparée")
+        for path in page_files.values():
+            path.unlink()
+        return 0
+
+    for page, (_, _, svg_file) in enumerate(entries, start=1):
+        os.replace(page_files[page], svg_file)
+    return len(entries)
+
+
+def missing_tex(calls):
+    """
+    Formules de ``calls`` absentes du cache de manim, groupées par gabarit :
+    ``[(gabarit, [(expression, environnement, svg attendu)])]``.
+    """
+    batches = {}
+    for expression, environment, template in record_tex_expressions(calls):
+        if not expression.strip():
+            continue
+        svg_file = generate_tex_file(expression, environment, template).with_suffix(".svg")
+        if svg_file.exists():
+            continue
+        key = (template.tex_compiler, template.output_format, template.body)
+        entries = batches.setdefault(key, (template, {}))[1]
+        entries.setdefault(svg_file, (expression, environment, svg_file))
+    return [(template, list(entries.values())) for template, entries in batches.values()]
+
+
+def precompile_tex(*scene_classes):
+    """
+    Compile d'avance, en un document par gabarit, toutes les formules
+    littérales des scènes données (classes ou instances).
+    """
+    calls = []
+    for scene_class in scene_classes:
+        calls.extend(collect_tex_calls(scene_class if isinstance(scene_class, type) else type(scene_class)))
+
+    compiled = sum(compile_batch(template, entries) for template, entries in missing_tex(calls))
+    if compiled:
+        logger.info(f"{compiled} formules LaTeX compilées en un seul document")
+    return compiled
@@ -0,0 +1,356 @@
+"""
+Rendu en couches : les mobjects statiques sont rastérisés une seule fois.
+
+Dans une ``Scene``, manim ne met de côté les mobjects immobiles que pour la
+durée d'un ``self.play`` (et seulement ceux placés sous le premier mobject
+animé) : les axes, cadres et étiquettes d'une longue scène sont rastérisés de
+nouveau à chaque animation et à chaque image des ``wait`` avec updaters.
+
+``LayeredScene`` ajoute une couche statique persistante. Les mobjects
+déclarés par ``add_static`` sont dessinés une fois, dans l'ordre de la scène,
+sur le fond de la caméra (``LayeredCamera``) ; ce tampon RGBA sert ensuite de
+fond à chaque image, et seuls les autres mobjects (la couche dynamique) sont
+rastérisés par-dessus. La couche statique est donc toujours sous la couche
+dynamique.
+
+La couche n'est redessinée que si son contenu change : une empreinte des
+points, couleurs et épaisseurs des mobjects statiques (et du cadrage de la
+caméra) est comparée à chaque image. Un mobject statique animé par
+``self.play`` (ou muni d'un updater) quitte automatiquement la couche
+statique, tout comme un mobject retiré de la scène.
+
+La couche dynamique est rendue par rectangles sales : la caméra garde l'image
+précédente et une empreinte (apparence, boîte englobante en pixels, mobject
+dessiné juste avant) de chaque mobject dynamique. Seules les boîtes des
+mobjects modifiés, ajoutés ou retirés (ancienne et nouvelle position) sont
+recopiées depuis le fond, puis les mobjects qui les touchent y sont
+rastérisés avec un masque cairo ; le reste de l'image précédente est conservé
+tel quel. Les images et nuages de points, que cairo ne masque pas, sont
+redessinés en entier avec leur boîte. L'image est redessinée complètement
+quand le fond ou le cadrage change, ou quand les rectangles sales couvrent
+plus de ``DIRTY_AREA_LIMIT`` de l'image (une vague qui s'étend sur tout
+l'écran, par exemple).
+
+Exemple ::
+
+    class MaScene(LayeredScene):
+        def construct(self):
+            self.play(Create(axes))
+            self.add_static(axes)         # ne sera plus rastérisé à chaque image
+            self.play(Create(curve))
+"""
+
+import functools
+import hashlib
+import math
+
+import numpy as np
+from manim import Camera, Scene, VMobject
+from manim.utils.family import extract_mobject_family_members
+
+# Attributs qui déterminent l'apparence d'un mobject (absents = ignorés)
+_APPEARANCE_ATTRIBUTES = (
+    "points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas",
+    "stroke_width", "background_stroke_width", "z_index", "pixel_array",
+)
+
+# Marge (pixels) ajoutée aux boîtes englobantes pour l'anticrénelage
+DIRTY_MARGIN = 2
+
+# Débord maximal d'un trait au-delà de ses points, en épaisseurs de trait (onglets cairo)
+STROKE_EXTENT = 5
+
+# Au-delà de cette fraction de l'image, elle est redessinée entièrement
+DIRTY_AREA_LIMIT = 0.5
+
+# Nombre maximal de rectangles sales (au-delà, ils sont réunis en un seul)
+DIRTY_RECTANGLE_LIMIT = 16
+
+
+def _hash_appearance(digest, mobject):
+    digest.update(id(mobject).to_bytes(8, "little"))
+    for name in _APPEARANCE_ATTRIBUTES:
+        value = getattr(mobject, name, None)
+        if isinstance(value, np.ndarray):
+            digest.update(np.ascontiguousarray(value))
+        elif value is not None:
+            digest.update(repr(value).encode())
+
+
+def _framing(camera):
+    return (camera.pixel_array.shape, tuple(camera.frame_center), camera.frame_width, camera.frame_height)
+
+
+def _layer_fingerprint(camera, family):
+    """Empreinte du cadrage et de l'apparence des mobjects ``family``."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(_framing(camera)).encode())
+    for mobject in family:
+        _hash_appearance(digest, mobject)
+    return digest.digest()
+
+
+def _member_fingerprint(mobject, predecessor):
+    """Empreinte d'un mobject et de sa place dans l'ordre de dessin."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(id(predecessor).to_bytes(8, "little"))
+    _hash_appearance(digest, mobject)
+    return digest.digest()
+
+
+def _intersects(box, other):
+    return box[0] < other[2] and other[0] < box[2] and box[1] < other[3] and other[1] < box[3]
+
+
+def _union(box, other):
+    return (min(box[0], other[0]), min(box[1], other[1]), max(box[2], other[2]), max(box[3], other[3]))
+
+
+def _merge_boxes(boxes):
+    """Réunit les boîtes ``(x0, y0, x1, y1)`` qui se chevauchent."""
+    merged = []
+    for box in boxes:
+        index = 0
+        while index < len(merged):
+            if _intersects(box, merged[index]):
+                box = _union(box, merged.pop(index))
+                index = 0
+            else:
+                index += 1
+        merged.append(box)
+    if len(merged) > DIRTY_RECTANGLE_LIMIT:
+        merged = [functools.reduce(_union, merged)]
+    return merged
+
+
+def _clippable(mobject):
+    # Seuls les VMobjects sans image de fond passent par le contexte cairo
+    return isinstance(mobject, VMobject) and getattr(mobject, "background_image", None) is None
+
+
+class LayeredCamera(Camera):
+    """
+    Caméra dont le fond contient la couche statique déjà rastérisée.
+
+    ``static_mobjects`` est la liste ordonnée des mobjects statiques ; leurs
+    familles sont exclues de ``capture_mobjects``. Avec ``dirty_rectangles``,
+    la couche dynamique n'est rastérisée que dans les rectangles sales.
+    """
+
+    def __init__(self, *args, dirty_rectangles=True, **kwargs):
+        self.static_mobjects = []
+        self._static_ids = frozenset()
+        self._layer_key = None
+        self.dirty_rectangles = dirty_rectangles
+        self._frame_base = None
+        self._drawn_base = None
+        self._drawn_framing = None
+        self._drawn_members = None
+        super().__init__(*args, **kwargs)
+
+    def init_background(self):
+        # Nouveau fond (couleur, image) : la couche statique est à refaire
+        super().init_background()
+        self._base_background = self.background
+        self._layer_key = None
+
+    def set_static(self, mobjects):
+        """Remplace la liste des mobjects statiques (dans l'ordre de dessin)."""
+        self.static_mobjects = list(mobjects)
+
+    def _refresh_static_layer(self):
+        """Redessine la couche statique si son contenu a changé ; vrai s'il l'a été."""
+        family = extract_mobject_family_members(
+            self.static_mobjects, use_z_index=self.use_z_index, only_those_with_points=True
+        )
+        key = _layer_fingerprint(self, family)
+        if key == self._layer_key:
+            return False
+        self._layer_key = key
+        self._static_ids = frozenset(
+            id(mobject) for mobject in extract_mobject_family_members(self.static_mobjects)
+        )
+        self.set_pixel_array(self._base_background)
+        super().capture_mobjects(family, include_submobjects=False)
+        self.background = self.pixel_array.copy()
+        return True
+
+    def reset(self):
+        return self.set_frame_to_background(self.background)
+
+    def set_frame_to_background(self, background):
+        # En mode rectangles sales, le fond n'est recopié que là où il le faut
+        self._frame_base = background
+        if not self.dirty_rectangles or getattr(self, "pixel_array", None) is None:
+            super().set_frame_to_background(background)
+        return self
+
+    def _pixel_box(self, mobject):
+        """Boîte ``(x0, y0, x1, y1)`` en pixels couverte par ``mobject`` (None si vide)."""
+        points = mobject.points
+        if len(points) == 0:
+            return None
+        height, width = self.pixel_array.shape[:2]
+        scale_x = width / self.frame_width
+        scale_y = height / self.frame_height
+        stroke = max(getattr(mobject, "stroke_width", 0) or 0, getattr(mobject, "background_stroke_width", 0) or 0)
+        margin = DIRTY_MARGIN + STROKE_EXTENT * self.cairo_line_width_multiple * float(np.max(stroke)) * scale_x
+        low = points.min(axis=0) - self.frame_center
+        high = points.max(axis=0) - self.frame_center
+        x0 = max(math.floor(width / 2 + low[0] * scale_x - margin), 0)
+        x1 = min(math.ceil(width / 2 + high[0] * scale_x + margin), width)
+        y0 = max(math.floor(height / 2 - high[1] * scale_y - margin), 0)
+        y1 = min(math.ceil(height / 2 - low[1] * scale_y + margin), height)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return (x0, y0, x1, y1)
+
+    def _dirty_boxes(self, members, previous):
+        """Boîtes (ancienne et nouvelle) des mobjects modifiés, ajoutés ou retirés."""
+        boxes = []
+        for ident, (key, box) in members.items():
+            old = previous.get(ident)
+            if old is None:
+                boxes.append(box)
+            elif old[0] != key:
+                boxes += [old[1], box]
+        boxes += [box for ident, (key, box) in previous.items() if ident not in members]
+        return [box for box in boxes if box is not None]
+
+    def _capture_dirty(self, mobjects):
+        """Rastérise ``mobjects`` dans les seuls rectangles sales de l'image précédente."""
+        base = self._frame_base
+        framing = _framing(self)
+        members = {}
+        predecessor = None
+        for mobject in mobjects:
+            members[id(mobject)] = (_member_fingerprint(mobject, predecessor), self._pixel_box(mobject))
+            predecessor = mobject
+        previous = self._drawn_members
+        self._drawn_members = members
+        redraw = (
+            previous is None
+            or base is not self._drawn_base
+            or framing != self._drawn_framing
+            or np.shape(base) != self.pixel_array.shape
+        )
+        self._drawn_base = base
+        self._drawn_framing = framing
+        if not redraw:
+            # Images et nuages de points touchés : redessinés (et donc effacés) en entier
+            pending = [members[id(mobject)][1] for mobject in mobjects if not _clippable(mobject)]
+            pending = [box for box in pending if box is not None]
+            boxes = self._dirty_boxes(members, previous)
+            while True:
+                rectangles = _merge_boxes(boxes)
+                touched = [box for box in pending if any(_intersects(box, rect) for rect in rectangles)]
+                if not touched:
+                    break
+                pending = [box for box in pending if box not in touched]
+                boxes = rectangles + touched
+            area = sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in rectangles)
+            redraw = area > DIRTY_AREA_LIMIT * self.pixel_array.shape[0] * self.pixel_array.shape[1]
+        if redraw:
+            self.set_pixel_array(base)
+            super().capture_mobjects(mobjects, include_submobjects=False)
+            return
+        if not rectangles:
+            return
+        for x0, y0, x1, y1 in rectangles:
+            self.pixel_array[y0:y1, x0:x1] = base[y0:y1, x0:x1]
+        visible = [
+            mobject for mobject in mobjects
+            if members[id(mobject)][1] is not None
+            and any(_intersects(members[id(mobject)][1], rect) for rect in rectangles)
+        ]
+        # Masque cairo : réunion des rectangles, en coordonnées pixels
+        ctx = self.get_cairo_context(self.pixel_array)
+        ctx.save()
+        matrix = ctx.get_matrix()
+        ctx.identity_matrix()
+        ctx.new_path()
+        for x0, y0, x1, y1 in rectangles:
+            ctx.rectangle(x0, y0, x1 - x0, y1 - y0)
+        ctx.clip()
+        ctx.set_matrix(matrix)
+        try:
+            super().capture_mobjects(visible, include_submobjects=False)
+        finally:
+            ctx.restore()
+
+    def capture_mobjects(self, mobjects, include_submobjects=True, excluded_mobjects=None):
+        if self._refresh_static_layer():
+            # L'image courante partait de l'ancien fond
+            self.reset()
+        if include_submobjects:
+            mobjects = extract_mobject_family_members(
+                mobjects, use_z_index=self.use_z_index, only_those_with_points=True
+            )
+        excluded = set(self._static_ids)
+        if excluded_mobjects:
+            excluded.update(id(mobject) for mobject in extract_mobject_family_members(excluded_mobjects))
+        dynamic = [mobject for mobject in mobjects if id(mobject) not in excluded]
+        if self.dirty_rectangles:
+            self._capture_dirty(dynamic)
+        else:
+            super().capture_mobjects(dynamic, include_submobjects=False)
+
+
+class LayeredScene(Scene):
+    """
+    ``Scene`` avec une couche statique persistante (voir ``add_static``) et
+    un rendu par rectangles sales de la couche dynamique. Ne s'applique qu'au
+    rendu Cairo.
+    """
+
+    def __init__(self, *args, camera_class=LayeredCamera, **kwargs):
+        # ``static_mobjects`` est déjà utilisé par Scene pour la durée d'un play
+        self.static_layer = []
+        super().__init__(*args, camera_class=camera_class, **kwargs)
+
+    def _scene_order(self):
+        return {id(mobject): index for index, mobject in enumerate(self.get_mobject_family_members())}
+
+    def _sync_static(self):
+        # Ordre de dessin : celui de la scène ; les mobjects retirés sont oubliés
+        order = self._scene_order()
+        self.static_layer = sorted(
+            (mobject for mobject in self.static_layer if id(mobject) in order),
+            key=lambda mobject: order[id(mobject)],
+        )
+        if isinstance(self.camera, LayeredCamera):
+            self.camera.set_static(self.static_layer)
+
+    def add_static(self, *mobjects):
+        """Ajoute ``mobjects`` (si besoin) à la scène et à la couche statique."""
+        order = self._scene_order()
+        self.add(*[mobject for mobject in mobjects if id(mobject) not in order])
+        known = {id(mobject) for mobject in self.static_layer}
+        self.static_layer += [mobject for mobject in mobjects if id(mobject) not in known]
+        self._sync_static()
+        return self
+
+    def release_static(self, *mobjects):
+        """Rend ``mobjects`` à la couche dynamique."""
+        released = {id(mobject) for mobject in mobjects}
+        self.static_layer = [mobject for mobject in self.static_layer if id(mobject) not in released]
+        self._sync_static()
+        return self
+
+    def remove(self, *mobjects):
+        super().remove(*mobjects)
+        self.release_static(*mobjects)
+        return self
+
+    def get_moving_and_static_mobjects(self, animations):
+        # Un mobject statique animé ou muni d'un updater repasse dans la couche dynamique
+        animated = {
+            id(mobject)
+            for animation in animations
+            for mobject in animation.mobject.get_family()
+        }
+        self.release_static(*[
+            mobject for mobject in self.static_layer
+            if any(id(member) in animated or member.updaters for member in mobject.get_family())
+        ])
+        return super().get_moving_and_static_mobjects(animations)
@@ -0,0 +1,87 @@
+"""
+Animation de satellites sur orbite elliptique, sans chemin de Bézier.
+
+``MoveAlongPath`` sur un ``ParametricFunction`` appelle
+``point_from_proportion`` à chaque image, donc parcourt les courbes de Bézier
+du chemin et leurs longueurs. ``OrbitMotion`` évalue directement la position
+en forme fermée (``physics.orbits``), éventuellement à vitesse képlérienne et
+sur plusieurs tours. Pour une constellation, ``Constellation`` regroupe tous
+les satellites dans un seul ``VMobject`` dont les points sont recalculés en
+une opération NumPy à partir du tableau des positions.
+"""
+
+import numpy as np
+from manim import RED, Animation, VMobject, linear
+
+from physics.orbits import ellipse_positions, orbit_angle
+
+
+class Constellation(VMobject):
+    """
+    ``count`` copies de la forme ``shape`` dans un seul ``VMobject``.
+
+    Paramètres
+    ----------
+    shape
+        Mobject vectoriel modèle (ex. ``Triangle().scale(0.1)``), centré ou non.
+    count
+        Nombre de satellites.
+    """
+
+    def __init__(self, shape, count, color=RED, fill_opacity=1, **kwargs):
+        super().__init__(color=color, fill_opacity=fill_opacity, **kwargs)
+        self.shape_points = shape.points - shape.get_center()
+        self.count = count
+        self.set_positions(np.zeros((count, 3)))
+
+    def set_positions(self, positions):
+        """Place chaque satellite sur la ligne correspondante de ``positions``."""
+        self.positions = np.asarray(positions, dtype=float)
+        self.set_points((self.shape_points[None] + self.positions[:, None]).reshape(-1, 3))
+        return self
+
+
+class OrbitMotion(Animation):
+    """
+    Fait parcourir à un satellite (mobject quelconque) ou à une
+    ``Constellation`` l'ellipse ``centre + (a cos t, b sin t)``.
+
+    ``a``, ``b``, ``start``, ``turns`` et ``center`` sont diffusés sur les
+    satellites : une valeur commune ou un tableau d'une valeur par satellite.
+    ``turns`` est le nombre de tours pendant l'animation (négatif pour le
+    sens horaire) et ``start`` le paramètre ``t`` de départ.
+    """
+
+    def __init__(
+        self,
+        mobject,
+        center,
+        a,
+        b,
+        start=0.0,
+        turns=1.0,
+        kepler=False,
+        rate_func=linear,
+        **kwargs,
+    ):
+        self.center = np.asarray(center, dtype=float)
+        self.a = np.asarray(a, dtype=float)
+        self.b = np.asarray(b, dtype=float)
+        self.start = np.asarray(start, dtype=float)
+        self.turns = np.asarray(turns, dtype=float)
+        self.kepler = kepler
+        super().__init__(mobject, rate_func=rate_func, **kwargs)
+
+    def positions(self, alpha):
+        """Positions ``(n, 3)`` de tous les satellites à l'instant ``alpha``."""
+        angle = orbit_angle(self.start, self.turns * alpha, self.a, self.b, kepler=self.kepler)
+        if isinstance(self.mobject, Constellation):
+            angle = np.broadcast_to(angle, (self.mobject.count,))
+        return ellipse_positions(self.center, self.a, self.b, angle)
+
+    def interpolate_mobject(self, alpha):
+        positions = self.positions(self.rate_func(alpha))
+        if isinstance(self.mobject, Constellation):
+            self.mobject.set_positions(positions)
+        else:
+            self.mobject.move_to(positions[0])
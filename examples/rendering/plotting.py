@@ -0,0 +1,212 @@
+"""
+Tracé des courbes : sommets exacts des modèles par morceaux et cache de géométrie.
+
+``axes.plot`` échantillonne uniformément la fonction (une centaine de points
+sur [0, 10]) puis lisse le tout en courbes de Bézier. Pour les modèles de gel,
+qui sont linéaires par morceaux (ou produits de deux rampes linéaires), les
+seuls sommets réels sont les bornes du tracé et les points de rupture : on
+construit directement le ``VMobject`` à partir de ces sommets.
+
+Pour les autres modèles, ``cached_plot`` conserve sur disque les points
+échantillonnés par ``axes.plot`` afin de ne pas les recalculer à chaque rendu.
+``plot_family`` trace toute une famille de courbes à partir d'un seul appel
+vectorisé du modèle. ``profile_curve`` réduit un profil échantillonné très
+finement (surfaces rugueuses de ``physics.roughness``) à un budget de points
+avant d'en faire une ligne brisée.
+"""
+
+import numpy as np
+from manim import LinearBase, VGroup, VMobject
+
+from physics.cache import (
+    FingerprintError, cache_dir, fingerprint, function_fingerprint, load_array, save_array,
+)
+
+
+def _vertices(axes, breakpoints, x_range):
+    """Abscisses des sommets : bornes du tracé et ruptures comprises entre elles."""
+    if x_range is None:
+        x_range = axes.x_range
+    x_min, x_max = float(x_range[0]), float(x_range[1])
+    inner = sorted(b for b in breakpoints if x_min < b < x_max)
+    return np.array([x_min, *inner, x_max])
+
+
+def _to_points(axes, function, xs):
+    """Convertit les abscisses en points de la scène, tableau (N, 3)."""
+    ys = np.broadcast_to(np.asarray(function(xs), dtype=float), xs.shape)
+    return np.asarray(axes.coords_to_point(xs, ys)).T
+
+
+def plot_piecewise(axes, function, breakpoints, x_range=None, degree=1, **kwargs):
+    """
+    Trace ``function`` sur ``axes`` en n'utilisant que ses sommets réels.
+
+    Paramètres
+    ----------
+    axes
+        Le système d'axes (``Axes``) sur lequel tracer la courbe.
+    function
+        Fonction vectorisée (accepte un tableau NumPy d'abscisses).
+    breakpoints
+        Abscisses des points de rupture du modèle, par ex. ``FREEZE_BREAKPOINTS``.
+    x_range
+        ``[x_min, x_max]`` du tracé ; par défaut l'étendue de l'axe des x.
+    degree
+        1 pour un modèle linéaire par morceaux (segments droits), 2 pour un
+        produit de deux rampes linéaires comme Tᴮ = ε · Tphys : chaque morceau
+        est alors une parabole, représentée exactement par une courbe de Bézier.
+    kwargs
+        Style transmis au ``VMobject`` (``color``, ``stroke_width``...).
+    """
+    xs = _vertices(axes, breakpoints, x_range)
+    curve = VMobject(**kwargs)
+
+    if degree == 1:
+        curve.set_points_as_corners(_to_points(axes, function, xs))
+    elif degree == 2:
+        start = _to_points(axes, function, xs[:-1])
+        end = _to_points(axes, function, xs[1:])
+        middle = _to_points(axes, function, (xs[:-1] + xs[1:]) / 2)
+        # Point de contrôle de la Bézier quadratique passant par le milieu,
+        # puis élévation au degré 3 (format des courbes de manim)
+        control = 2 * middle - (start + end) / 2
+        handle1 = start + 2 / 3 * (control - start)
+        handle2 = end + 2 / 3 * (control - end)
+        curve.set_points(np.stack([start, handle1, handle2, end], axis=1).reshape(-1, 3))
+    else:
+        raise ValueError(f"Degré non supporté : {degree} (1 ou 2 attendu)")
+
+    # Même attribut que axes.plot, utilisé par axes.input_to_graph_point
+    curve.underlying_function = function
+    return curve
+
+
+# Nombre de sommets par défaut d'un profil tracé
+PROFILE_POINT_BUDGET = 400
+
+
+def decimate(ys, budget=PROFILE_POINT_BUDGET):
+    """
+    Indices croissants d'au plus ``budget`` points de ``ys`` : le minimum et
+    le maximum dans chacun des ``(budget - 2) // 2`` paquets consécutifs,
+    plus les deux extrémités. Les pics et les creux sont donc conservés.
+    """
+    count = len(ys)
+    if count <= budget:
+        return np.arange(count)
+    buckets = max(1, (budget - 2) // 2)
+    size = -(-count // buckets)
+    blocks = np.pad(np.asarray(ys, dtype=float), (0, buckets * size - count), mode="edge")
+    blocks = blocks.reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    indices = np.concatenate([
+        [0, count - 1], offsets + blocks.argmin(axis=1), offsets + blocks.argmax(axis=1),
+    ])
+    return np.unique(np.minimum(indices, count - 1))
+
+
+def profile_curve(xs, ys, budget=PROFILE_POINT_BUDGET, **kwargs):
+    """Ligne brisée de la scène par les points ``(xs, ys)``, réduits à ``budget`` sommets."""
+    kept = decimate(ys, budget)
+    points = np.column_stack([np.asarray(xs, dtype=float)[kept], np.asarray(ys, dtype=float)[kept], np.zeros(len(kept))])
+    return VMobject(**kwargs).set_points_as_corners(points)
+
+
+# Paramètres de axes.plot qui modifient la géométrie (et donc la clé du cache) ;
+# les autres (color, stroke_width...) ne sont que du style
+_GEOMETRY_KWARGS = ("use_smoothing", "discontinuities", "dt")
+
+# À incrémenter si le format des fichiers du cache change
+_PLOT_CACHE_VERSION = 1
+
+
+def _data_frame(axes):
+    """Origine et vecteurs unitaires (x, y) des axes dans la scène."""
+    origin = np.asarray(axes.coords_to_point(0, 0), dtype=float)
+    unit_x = np.asarray(axes.coords_to_point(1, 0), dtype=float) - origin
+    unit_y = np.asarray(axes.coords_to_point(0, 1), dtype=float) - origin
+    return origin, np.column_stack([unit_x, unit_y])
+
+
+def _plot_cache_key(axes, function, x_range, geometry):
+    # Même résolution de l'échantillonnage que axes.plot
+    t_range = np.array(axes.x_range, dtype=float)
+    if x_range is not None:
+        t_range[: len(x_range)] = x_range
+    if x_range is None or len(x_range) < 3:
+        t_range[2] /= axes.num_sampled_graph_points_per_tick
+    return fingerprint(
+        _PLOT_CACHE_VERSION,
+        function_fingerprint(function),
+        tuple(t_range.tolist()),
+        sorted(geometry.items()),
+        type(axes.x_axis.scaling).__name__,
+        type(axes.y_axis.scaling).__name__,
+    )
+
+
+def cached_plot(axes, function, x_range=None, use_vectorized=False, **kwargs):
+    """
+    Équivalent de ``axes.plot`` dont les points de Bézier sont mis en cache
+    sur disque (``.cache/plots/<clé>.npy``, relus en mémoire mappée).
+
+    La clé combine l'empreinte de ``function`` (bytecode, constantes, valeurs
+    capturées, globales suivies récursivement ; sans empreinte possible, la
+    courbe est tracée par ``axes.plot`` sans cache), l'intervalle échantillonné, les paramètres géométriques et
+    la configuration des axes. Les points sont stockés en coordonnées des
+    axes : le lissage de manim étant affine, déplacer ou redimensionner les
+    axes (``to_edge``, ``x_length``...) réutilise la même entrée.
+    """
+    geometry = {key: kwargs.pop(key) for key in _GEOMETRY_KWARGS if key in kwargs}
+
+    if not (
+        isinstance(axes.x_axis.scaling, LinearBase)
+        and isinstance(axes.y_axis.scaling, LinearBase)
+    ):
+        # Axes logarithmiques : la transformation n'est pas affine
+        return axes.plot(function, x_range, use_vectorized=use_vectorized, **geometry, **kwargs)
+
+    try:
+        key = _plot_cache_key(axes, function, x_range, geometry)
+    except FingerprintError:
+        # La fonction dépend d'un objet sans empreinte : pas de cache plutôt
+        # qu'une courbe périmée
+        return axes.plot(function, x_range, use_vectorized=use_vectorized, **geometry, **kwargs)
+
+    origin, frame = _data_frame(axes)
+    path = cache_dir("plots") / f"{key}.npy"
+    data_points = load_array(path)
+
+    if data_points is None:
+        graph = axes.plot(function, x_range, use_vectorized=use_vectorized, **geometry)
+        data_points = np.linalg.lstsq(frame, (graph.points - origin).T, rcond=None)[0].T
+        save_array(path, data_points)
+
+    curve = VMobject(**kwargs)
+    curve.set_points(origin + np.asarray(data_points) @ frame.T)
+    curve.underlying_function = function
+    return curve
+
+
+def plot_family(axes, function, parameters, x_range=None, samples=100, **kwargs):
+    """
+    Famille de courbes ``function(x, p)``, une par valeur de ``parameters``.
+
+    ``function`` est appelée une seule fois sur la grille paramètres ×
+    abscisses (``x`` de forme ``(1, samples)``, ``p`` de forme ``(n, 1)``) :
+    avec un modèle tabulé (``physics.lut``), des dizaines de courbes se
+    recalculent à chaque image. Retourne un ``VGroup`` d'une ligne brisée
+    par paramètre, dans l'ordre de ``parameters``.
+    """
+    if x_range is None:
+        x_range = axes.x_range
+    xs = np.linspace(float(x_range[0]), float(x_range[1]), samples)
+    values = np.asarray(parameters, dtype=float)
+    ys = np.asarray(function(xs[None, :], values[:, None]), dtype=float)
+    ys = np.broadcast_to(ys, (len(values), samples))
+    points = np.asarray(axes.coords_to_point(np.broadcast_to(xs, ys.shape).ravel(), ys.ravel())).T
+    return VGroup(*(
+        VMobject(**kwargs).set_points_as_corners(curve)
+        for curve in points.reshape(len(values), samples, 3)
+    ))
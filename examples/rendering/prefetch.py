@@ -0,0 +1,174 @@
+"""
+Préparation des textes d'une scène en arrière-plan pendant le rendu.
+
+Dans les ``construct`` des exemples, chaque ``Text``/``MathTex`` est créé
+juste avant le ``self.play`` qui l'utilise : le rendu attend LaTeX ou Pango,
+puis LaTeX ou Pango attendent le rendu. ``prefetch_text`` relève dès le
+``setup`` les appels dont les arguments sont des littéraux ou des constantes
+du module (``color=BLUE``, ``font_size=36``...) et les exécute dans un
+``ThreadPoolExecutor``, dans l'ordre du source, pendant que les premières
+animations sont rastérisées et encodées :
+
+- les formules LaTeX sont compilées en un seul document
+  (``rendering.latex``) ;
+- chaque texte est construit une fois : le SVG de Pango est écrit dans
+  ``media/texts`` et le mobject analysé entre dans le cache de SVG de manim ;
+  les appels à ``cached_text`` remplissent directement le cache de
+  ``rendering.text``.
+
+Quand ``construct`` atteint l'appel, il reçoit une copie du mobject déjà
+prêt ; si le travail est encore en cours, il n'attend que lui. Les appels qui
+dépendent de variables locales sont créés normalement.
+"""
+
+import ast
+import functools
+import inspect
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from manim import MarkupText, MathTex, Text, logger
+from manim.mobject.svg.svg_mobject import SVGMobject
+from manim.mobject.text import tex_mobject
+from manim.utils.tex_file_writing import generate_tex_file
+
+from .latex import AXIS_LABEL_METHODS, TEX_CLASSES, TEX_LOCK, compile_batch, missing_tex
+from .text import cached_text
+
+PANGO_CLASSES = {"Text": Text, "MarkupText": MarkupText}
+
+# Fabriques de textes : leur propre cache sert de point de remise
+TEXT_FACTORIES = {"cached_text": cached_text}
+
+# Noeuds autorisés dans un argument évalué d'avance : constantes, noms du
+# module et opérations arithmétiques simples (ex. ``UP * 0.2``)
+_SAFE_NODES = (
+    ast.Constant, ast.Name, ast.Load, ast.Attribute, ast.UnaryOp, ast.UAdd, ast.USub,
+    ast.BinOp, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.List, ast.Tuple, ast.Dict,
+)
+
+# Pango et l'analyse des SVG de manim (fichier temporaire ``<nom>_.svg``) ne
+# supportent pas deux appels simultanés
+_SVG_LOCK = threading.RLock()
+
+# SVG LaTeX en cours de compilation en arrière-plan -> Future (retirés une
+# fois la compilation terminée, le SVG étant alors sur disque)
+_PENDING_TEX = {}
+_PENDING_LOCK = threading.Lock()
+
+_installed = False
+
+
+def _evaluate(node, namespace):
+    if not all(isinstance(child, _SAFE_NODES) for child in ast.walk(node)):
+        return False, None
+    names = {child.id for child in ast.walk(node) if isinstance(child, ast.Name)}
+    if not names <= namespace.keys():
+        return False, None
+    try:
+        return True, eval(compile(ast.Expression(node), "<prefetch>", "eval"), namespace)
+    except Exception:
+        return False, None
+
+
+def collect_text_calls(scene_class):
+    """
+    Appels ``Text``/``MarkupText``/``MathTex``/``Tex``... de ``scene_class``
+    évaluables sans exécuter la scène, dans l'ordre du source.
+    """
+    namespace = vars(inspect.getmodule(scene_class))
+    constructors = {**PANGO_CLASSES, **TEX_CLASSES, **TEXT_FACTORIES}
+    tree = ast.parse(textwrap.dedent(inspect.getsource(scene_class)))
+
+    calls = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        if (isinstance(node.func, ast.Attribute) and node.func.attr in AXIS_LABEL_METHODS
+                and node.args and isinstance(node.args[0], ast.Constant)
+                and isinstance(node.args[0].value, str)):
+            calls.append((node.lineno, MathTex, [node.args[0].value], {}))
+            continue
+        if not (isinstance(node.func, ast.Name) and node.func.id in constructors):
+            continue
+        values = [_evaluate(arg, namespace) for arg in node.args]
+        keywords = {kw.arg: _evaluate(kw.value, namespace) for kw in node.keywords}
+        if None in keywords or not all(ok for ok, _ in [*values, *keywords.values()]):
+            continue
+        args = [value for _, value in values]
+        kwargs = {name: value for name, (_, value) in keywords.items()}
+        calls.append((node.lineno, constructors[node.func.id], args, kwargs))
+    calls.sort(key=lambda call: call[0])
+    return [call[1:] for call in calls]
+
+
+def _locked(method):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with _SVG_LOCK:
+            return method(*args, **kwargs)
+    return wrapper
+
+
+def _tex_to_svg_file(original, expression, environment=None, tex_template=None):
+    svg_file = generate_tex_file(expression, environment, tex_template).with_suffix(".svg")
+    with _PENDING_LOCK:
+        pending = _PENDING_TEX.get(svg_file)
+    if pending is not None:
+        pending.result()
+    if svg_file.exists():
+        return svg_file
+    with TEX_LOCK:
+        return original(expression, environment, tex_template)
+
+
+def _forget_pending(svg_files, future):
+    with _PENDING_LOCK:
+        for svg_file in svg_files:
+            if _PENDING_TEX.get(svg_file) is future:
+                del _PENDING_TEX[svg_file]
+
+
+def _install():
+    """Rend la création de textes sûre entre threads (une seule fois)."""
+    global _installed
+    if _installed:
+        return
+    tex_mobject.tex_to_svg_file = functools.partial(_tex_to_svg_file, tex_mobject.tex_to_svg_file)
+    SVGMobject.init_svg_mobject = _locked(SVGMobject.init_svg_mobject)
+    for text_class in PANGO_CLASSES.values():
+        text_class._text2svg = _locked(text_class._text2svg)
+    _installed = True
+
+
+def _build(constructor, args, kwargs):
+    try:
+        constructor(*args, **kwargs)
+    except Exception as error:
+        # construct() refera l'appel et signalera l'erreur à sa place
+        logger.debug(f"Préchargement de {constructor.__name__}{tuple(args)} abandonné : {error}")
+
+
+def prefetch_text(scene, workers=2):
+    """
+    Lance en arrière-plan la préparation des textes de ``scene`` (classe ou
+    instance) et retourne immédiatement l'exécuteur utilisé.
+    """
+    _install()
+    scene_class = scene if isinstance(scene, type) else type(scene)
+    calls = collect_text_calls(scene_class)
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prefetch")
+    tex_calls = [call for call in calls if call[0] in TEX_CLASSES.values()]
+    for template, entries in missing_tex(tex_calls):
+        future = executor.submit(compile_batch, template, entries)
+        svg_files = [svg_file for _, _, svg_file in entries]
+        with _PENDING_LOCK:
+            _PENDING_TEX.update(dict.fromkeys(svg_files, future))
+        future.add_done_callback(functools.partial(_forget_pending, svg_files))
+    for constructor, args, kwargs in calls:
+        executor.submit(_build, constructor, args, kwargs)
+    # Les tâches soumises s'exécutent jusqu'au bout ; rien n'attend ici
+    executor.shutdown(wait=False)
+    return executor
@@ -0,0 +1,235 @@
+"""
+Cartes raster animées : un champ NumPy 2D affiché comme ``ImageMobject``.
+
+``RasterMap`` convertit un champ (Tᴮ, concentration, nombre de passages...)
+en indices d'une palette RGBA précalculée (``colormap``, mise en cache par
+liste de couleurs), puis en pixels. Toutes les mises à jour se font en place
+dans des tampons alloués une fois à la construction : ``update_field``
+compare les nouveaux indices aux précédents et ne réécrit que les pixels qui
+changent ; ``update_cells`` ne touche que les cellules indiquées. Une saison
+de cartes quotidiennes ne crée donc ni nouveau mobject ni nouveaux tableaux
+de la taille de l'image à chaque image.
+
+``FreezingSurface`` s'en sert pour le gel d'une surface d'eau : un front de
+glace irrégulier avance de gauche à droite (``AdvanceIceFront``), par-dessus
+le rectangle de l'océan. ``StreamField`` fait défiler les champs produits
+par un générateur (une simulation, par exemple), un par image, sans les
+conserver.
+
+Exemple ::
+
+    ice = RasterMap(np.zeros((300, 450)), colors=["#0C2D48", WHITE], width=9)
+    self.add(ice)
+    self.play(UpdateFromAlphaFunc(ice, lambda m, a: m.update_field(season[int(a * 179)])))
+
+    ice = FreezingSurface(ocean.width, ocean.height).move_to(ocean)
+    self.add(ice)
+    self.play(AdvanceIceFront(ice, 3), run_time=2)
+"""
+
+import functools
+
+import numpy as np
+from manim import (
+    RESAMPLING_ALGORITHMS, WHITE, Animation, ImageMobject, color_gradient, color_to_int_rgba, linear,
+)
+
+# Niveaux de couleur des palettes continues
+COLORMAP_LEVELS = 256
+
+# Couleur de la glace de mer et pixels par unité de scène des surfaces gelées
+ICE_COLOR = "#B3E5FC"
+FREEZING_RESOLUTION = 40
+
+
+@functools.lru_cache(maxsize=32)
+def _colormap(colors, levels):
+    palette = np.array([color_to_int_rgba(color) for color in color_gradient(list(colors), levels)], dtype=np.uint8)
+    palette.setflags(write=False)
+    return palette
+
+
+def colormap(colors, levels=COLORMAP_LEVELS):
+    """Palette RGBA ``(levels, 4)`` en ``uint8`` interpolant ``colors`` (mise en cache)."""
+    return _colormap(tuple(str(color) for color in colors), levels)
+
+
+class RasterMap(ImageMobject):
+    """
+    Image d'un champ 2D (ligne 0 en haut), colorée par une palette.
+
+    Paramètres
+    ----------
+    field
+        Champ initial ``(lignes, colonnes)`` ; sa forme est celle de l'image.
+    colors
+        Couleurs interpolées de ``vmin`` à ``vmax`` (palette continue).
+    palette
+        Palette RGBA ``(n, 4)`` explicite, à la place de ``colors``.
+    vmin, vmax
+        Valeurs associées à la première et à la dernière couleur.
+    width, height
+        Taille dans la scène (une seule des deux suffit).
+    """
+
+    def __init__(
+        self,
+        field,
+        colors=("#0C2D48", WHITE),
+        palette=None,
+        vmin=0.0,
+        vmax=1.0,
+        width=None,
+        height=None,
+        **kwargs,
+    ):
+        field = np.asarray(field)
+        self.palette = colormap(colors) if palette is None else np.asarray(palette, dtype=np.uint8)
+        self.vmin = float(vmin)
+        self.vmax = float(vmax)
+
+        # Tampons réutilisés à chaque mise à jour
+        self._scaled = np.empty(field.shape, dtype=np.float32)
+        self._indices = np.empty(field.shape, dtype=np.intp)
+        self._previous = np.empty(field.shape, dtype=np.intp)
+        self._changed = np.empty(field.shape, dtype=bool)
+        self._indices[...] = self._levels(field, self._scaled)
+
+        super().__init__(self.palette[self._indices], **kwargs)
+        self.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"])
+        if width is not None:
+            self.width = width
+        elif height is not None:
+            self.height = height
+
+    def _levels(self, values, out=None):
+        """Niveaux de palette de ``values``, décalés de 0.5 (la troncature arrondit)."""
+        out = np.subtract(values, self.vmin, out=out, dtype=np.float32, casting="unsafe")
+        out *= (len(self.palette) - 1) / (self.vmax - self.vmin)
+        np.clip(out, 0, len(self.palette) - 1, out=out)
+        out += 0.5
+        return out
+
+    @property
+    def _pixels(self):
+        return self.pixel_array.reshape(-1, 4)
+
+    def update_field(self, field):
+        """Affiche ``field`` (même forme) en ne réécrivant que les pixels modifiés."""
+        self._previous, self._indices = self._indices, self._previous
+        self._indices[...] = self._levels(field, self._scaled)
+        np.not_equal(self._indices, self._previous, out=self._changed)
+        changed = np.flatnonzero(self._changed)
+        if changed.size:
+            self._pixels[changed] = self.palette[self._indices.ravel()[changed]]
+        return self
+
+    def update_cells(self, cells, values):
+        """Met à jour les seules cellules ``cells`` (indices à plat) avec ``values``."""
+        indices = self._levels(values).astype(np.intp)
+        self._indices.ravel()[cells] = indices
+        self._pixels[cells] = self.palette[indices]
+        return self
+
+
+class FreezingSurface(RasterMap):
+    """
+    Surface d'eau qui gèle de gauche à droite : transparente devant le front
+    de glace, couleur ``color`` (opacité ``opacity``) derrière. Le front est
+    irrégulier (bruit gaussien lissé d'une ligne à l'autre) et passe de
+    l'eau à la glace sur ``transition`` unités de scène.
+
+    Paramètres
+    ----------
+    width, height
+        Taille de la surface dans la scène.
+    color, opacity
+        Couleur et opacité de la glace.
+    roughness
+        Amplitude des irrégularités du front, en unités de scène.
+    transition
+        Largeur de la zone de glace en formation, en unités de scène.
+    resolution
+        Pixels par unité de scène.
+    seed
+        Graine du tracé du front.
+    """
+
+    def __init__(
+        self,
+        width,
+        height,
+        color=ICE_COLOR,
+        opacity=0.9,
+        roughness=0.25,
+        transition=0.3,
+        resolution=FREEZING_RESOLUTION,
+        seed=0,
+        **kwargs,
+    ):
+        rows = max(1, round(height * resolution))
+        cols = max(1, round(width * resolution))
+        self.transition = transition
+        self.front = 0.0
+
+        # Distance de chaque pixel au bord gauche, retardée par le tracé du front
+        walk = np.convolve(np.random.default_rng(seed).normal(size=rows + 8), np.ones(9) / 9, "valid")
+        walk -= walk.min()
+        walk *= roughness / max(walk.max(), 1e-9)
+        # (comprimée pour que le front atteigne le bord droit à ``front = width``)
+        x = (np.arange(cols) + 0.5) / cols * (width - roughness - transition)
+        self._distance = (x[None, :] + walk[:, None]).astype(np.float32)
+        self._field = np.zeros((rows, cols), dtype=np.float32)
+
+        palette = colormap([color, color]).copy()
+        palette[:, 3] = np.linspace(0, 255 * opacity, len(palette))
+        super().__init__(self._field, palette=palette, width=width, **kwargs)
+        self.stretch_to_fit_height(height)
+
+    def set_front(self, front):
+        """Place le front de glace à ``front`` unités du bord gauche (gel total à ``width``)."""
+        self.front = front
+        np.subtract(front, self._distance, out=self._field)
+        self._field /= self.transition
+        return self.update_field(self._field)
+
+
+class AdvanceIceFront(Animation):
+    """Avance le front d'une ``FreezingSurface`` de sa position courante jusqu'à ``front``."""
+
+    def __init__(self, surface, front, rate_func=linear, **kwargs):
+        self.start_front = surface.front
+        self.end_front = front
+        super().__init__(surface, rate_func=rate_func, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        front = self.start_front + self.rate_func(alpha) * (self.end_front - self.start_front)
+        self.mobject.set_front(front)
+
+
+class StreamField(Animation):
+    """
+    Affiche sur une ``RasterMap`` les ``count`` champs suivants de l'itérateur
+    ``fields`` (par exemple un générateur de simulation), au fil de l'animation.
+    Les champs sont lus à la demande : aucun n'est conservé.
+    """
+
+    def __init__(self, raster, fields, count, rate_func=linear, **kwargs):
+        self.fields = iter(fields)
+        self.count = count
+        self.shown = 0
+        super().__init__(raster, rate_func=rate_func, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        target = round(self.rate_func(alpha) * self.count)
+        latest = None
+        while self.shown < target:
+            field = next(self.fields, None)
+            if field is None:
+                # Itérateur épuisé : on garde le dernier champ affiché
+                self.shown = self.count
+            else:
+                latest = field
+                self.shown += 1
+        if latest is not None:
+            self.mobject.update_field(latest)
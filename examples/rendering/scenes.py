@@ -0,0 +1,182 @@
+"""
+Index des scènes des exemples, construit sans importer manim.
+
+Usage (depuis le dossier ``examples``) ::
+
+    python -m rendering.scenes                          # toutes les scènes
+    python -m rendering.scenes soil_moisture_radar.py   # un seul fichier
+    python -m rendering.scenes --names temperature_brillance.py
+    python -m rendering.scenes --json
+
+Les fichiers ``examples/*.py`` sont analysés avec ``ast`` : on obtient les
+sous-classes de ``Scene``, leur docstring et l'empreinte de leur source en
+quelques millisecondes, là où ``manim`` met plusieurs secondes à s'importer.
+L'index est conservé dans ``.cache/scenes/index.json`` et un fichier n'est
+réanalysé que si sa taille ou sa date de modification a changé.
+
+Ce module ne dépend que de la bibliothèque standard ; les workers de rendu
+n'importent manim qu'au moment de rendre une scène.
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from physics.paths import cache_dir
+
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent
+
+# Classes de base (manim, puis ``rendering``) qui font d'une classe une scène
+SCENE_BASES = {
+    "Scene",
+    "MovingCameraScene",
+    "ThreeDScene",
+    "ZoomedScene",
+    "VectorScene",
+    "LinearTransformationScene",
+    "LayeredScene",
+}
+
+# Scènes composées (rendering.composition) : rendues après leurs sous-scènes
+COMPOSITE_BASES = {"SceneSequence"}
+
+# À incrémenter si le contenu des entrées de l'index change
+INDEX_VERSION = 2
+INDEX_NAME = "index.json"
+
+
+def _literal_seconds(node, default=1.0):
+    try:
+        value = ast.literal_eval(node)
+    except ValueError:
+        return default
+    return float(value) if isinstance(value, (int, float)) else default
+
+
+def estimate_duration(class_node):
+    """Durée approximative de la scène : somme des ``run_time`` et des ``wait``."""
+    total = 0.0
+    for node in ast.walk(class_node):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)):
+            continue
+        if node.func.attr == "play":
+            run_time = next((kw.value for kw in node.keywords if kw.arg == "run_time"), None)
+            total += 1.0 if run_time is None else _literal_seconds(run_time)
+        elif node.func.attr == "wait":
+            total += _literal_seconds(node.args[0]) if node.args else 1.0
+    return total
+
+
+def _base_names(class_node):
+    return {base.id for base in class_node.bases if isinstance(base, ast.Name)}
+
+
+def parse_scenes(path):
+    """
+    Analyse un fichier et retourne ses scènes, chacune décrite par
+    ``{"file", "scene", "doc", "sha256", "estimate", "composite"}``.
+    """
+    path = Path(path)
+    source = path.read_text(encoding="utf-8")
+    tree = ast.parse(source, filename=str(path))
+    classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+
+    # Une classe qui hérite d'une scène du même fichier est aussi une scène
+    scene_names = set()
+    changed = True
+    while changed:
+        changed = False
+        for node in classes:
+            bases = _base_names(node)
+            if node.name not in scene_names and bases & (SCENE_BASES | COMPOSITE_BASES | scene_names):
+                scene_names.add(node.name)
+                changed = True
+
+    scenes = []
+    for node in classes:
+        if node.name not in scene_names:
+            continue
+        segment = ast.get_source_segment(source, node)
+        scenes.append({
+            "file": path.name,
+            "scene": node.name,
+            "doc": " ".join((ast.get_docstring(node) or "").split()),
+            "sha256": hashlib.sha256(segment.encode("utf-8")).hexdigest(),
+            "estimate": estimate_duration(node),
+            "composite": bool(_base_names(node) & COMPOSITE_BASES),
+        })
+    return scenes
+
+
+def _load_index(index_path):
+    try:
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+    return index.get("files", {}) if index.get("version") == INDEX_VERSION else {}
+
+
+def discover_scenes(examples_dir=EXAMPLES_DIR, files=None, use_cache=True):
+    """
+    Liste les scènes de ``examples_dir/*.py`` (ou des seuls ``files``).
+
+    Les entrées de l'index sur disque sont réutilisées tant que la taille et
+    la date de modification du fichier n'ont pas changé.
+    """
+    paths = sorted(Path(examples_dir).glob("*.py"))
+    if files:
+        wanted = {Path(name).name for name in files}
+        paths = [path for path in paths if path.name in wanted]
+
+    index_path = cache_dir("scenes") / INDEX_NAME if use_cache else None
+    cached = _load_index(index_path) if use_cache else {}
+    entries = {}
+    scenes = []
+    for path in paths:
+        stat = path.stat()
+        entry = cached.get(path.name)
+        if not (entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size):
+            entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "scenes": parse_scenes(path)}
+        entries[path.name] = entry
+        scenes.extend(entry["scenes"])
+
+    if use_cache and entries != {name: cached.get(name) for name in entries}:
+        # Conserve les fichiers non demandés pour ne pas vider l'index
+        merged = {**cached, **entries}
+        index_path.write_text(
+            json.dumps({"version": INDEX_VERSION, "files": merged}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+    return scenes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Liste les scènes des exemples sans importer manim.")
+    parser.add_argument("files", nargs="*", help="Fichiers à inspecter (par défaut : tous)")
+    parser.add_argument("--names", action="store_true", help="N'affiche que les noms des scènes")
+    parser.add_argument("--json", action="store_true", help="Sortie JSON complète")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore l'index sur disque")
+    args = parser.parse_args(argv)
+
+    scenes = discover_scenes(files=args.files, use_cache=not args.no_cache)
+    if args.json:
+        print(json.dumps(scenes, indent=2, ensure_ascii=False))
+    elif args.names:
+        print("\n".join(scene["scene"] for scene in scenes))
+    else:
+        current_file = None
+        for scene in scenes:
+            if scene["file"] != current_file:
+                current_file = scene["file"]
+                print(f"{current_file}:")
+            doc = scene["doc"]
+            doc = doc if len(doc) <= 70 else doc[:69] + "…"
+            print(f"  {scene['scene']:<40} {scene['sha256'][:12]}  {doc}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
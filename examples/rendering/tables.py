@@ -0,0 +1,135 @@
+"""
+Tableau compact : une grille et des textes en quelques mobjects seulement.
+
+Les tableaux construits « à la main » créent un ``Rectangle`` et un ``Text``
+par cellule : 6×4 cellules donnent 48 mobjects (et des centaines de glyphes),
+que ``Create`` et chaque image parcourent un par un. ``GridTable`` produit :
+
+- ``grid`` : toutes les lignes de la grille dans un seul ``VMobject`` ;
+- ``header`` : le fond de la ligne d'en-tête ;
+- ``labels`` : tous les textes dans un seul ``VMobject``.
+
+Les textes sont mis en forme par un seul appel à Pango (une ligne par
+cellule, via ``cached_text``), puis chaque cellule est centrée en déplaçant
+ses points d'un décalage calculé pour toutes les cellules à la fois.
+"""
+
+import numpy as np
+from manim import WHITE, Rectangle, VGroup, VMobject
+
+from .text import cached_text
+
+# Paramètres des points de contrôle d'un segment de droite en Bézier cubique
+_LINE_T = np.array([0.0, 1 / 3, 2 / 3, 1.0])
+
+
+def _segments(starts, ends):
+    """Points d'un ``VMobject`` formé des segments ``starts[i] -> ends[i]``."""
+    points = starts[:, None, :] + _LINE_T[None, :, None] * (ends - starts)[:, None, :]
+    return points.reshape(-1, 3)
+
+
+def _cell_points(cells, font_size):
+    """Points des glyphes de chaque cellule (tableaux ``(n, 3)``, éventuellement vides)."""
+    # Sans ligatures, Text a exactement un sous-mobject par caractère, ce qui
+    # permet de redécouper le texte en cellules
+    text = cached_text("\n".join(cells), font_size=font_size, disable_ligatures=True)
+    chars = text.submobjects
+    if len(chars) != sum(len(cell) for cell in cells) + len(cells) - 1:
+        # Découpage incertain : une mise en forme par cellule
+        return [
+            _glyph_points(cached_text(cell, font_size=font_size).submobjects, cell.replace(" ", ""))
+            if cell.strip() else np.zeros((0, 3))
+            for cell in cells
+        ]
+
+    result = []
+    start = 0
+    for cell in cells:
+        result.append(_glyph_points(chars[start:start + len(cell)], cell))
+        start += len(cell) + 1
+    return result
+
+
+def _glyph_points(glyphs, characters):
+    arrays = [glyph.points for glyph, char in zip(glyphs, characters)
+              if not char.isspace() and len(glyph.points)]
+    return np.concatenate(arrays) if arrays else np.zeros((0, 3))
+
+
+class GridTable(VGroup):
+    """
+    Tableau de textes centré sur l'origine, ligne 0 en en-tête.
+
+    Paramètres
+    ----------
+    rows
+        Liste de lignes, chacune une liste de chaînes (même nombre de colonnes).
+    cell_width, cell_height
+        Dimensions d'une cellule.
+    font_size
+        Taille des textes.
+    header_opacity
+        Opacité du fond de la ligne d'en-tête (0 pour aucun fond).
+    """
+
+    def __init__(
+        self,
+        rows,
+        cell_width=2.0,
+        cell_height=0.5,
+        font_size=18,
+        header_opacity=0.1,
+        stroke_width=2,
+        line_color=WHITE,
+        text_color=WHITE,
+        **kwargs,
+    ):
+        n_rows, n_cols = len(rows), len(rows[0])
+        width, height = n_cols * cell_width, n_rows * cell_height
+
+        # Grille : n_rows + 1 horizontales et n_cols + 1 verticales
+        ys = height / 2 - cell_height * np.arange(n_rows + 1)
+        xs = -width / 2 + cell_width * np.arange(n_cols + 1)
+        starts = np.concatenate([
+            np.column_stack([np.full_like(ys, -width / 2), ys, np.zeros_like(ys)]),
+            np.column_stack([xs, np.full_like(xs, height / 2), np.zeros_like(xs)]),
+        ])
+        ends = np.concatenate([
+            np.column_stack([np.full_like(ys, width / 2), ys, np.zeros_like(ys)]),
+            np.column_stack([xs, np.full_like(xs, -height / 2), np.zeros_like(xs)]),
+        ])
+        self.grid = VMobject(stroke_color=line_color, stroke_width=stroke_width)
+        self.grid.set_points(_segments(starts, ends))
+
+        self.header = Rectangle(
+            width=width,
+            height=cell_height,
+            stroke_width=0,
+            fill_color=line_color,
+            fill_opacity=header_opacity,
+        ).move_to([0, (height - cell_height) / 2, 0])
+
+        # Centres des cellules, ligne par ligne
+        centers_x = (xs[:-1] + xs[1:]) / 2
+        centers_y = (ys[:-1] + ys[1:]) / 2
+        grid_x, grid_y = np.meshgrid(centers_x, centers_y)
+        self.cell_centers = np.stack([grid_x, grid_y, np.zeros_like(grid_x)], axis=-1)
+
+        # Textes : décalage de chaque cellule vers son centre, appliqué en bloc
+        cells = [str(value) for row in rows for value in row]
+        points = _cell_points(cells, font_size)
+        filled = [index for index, array in enumerate(points) if len(array)]
+        self.labels = VMobject(fill_color=text_color, fill_opacity=1, stroke_width=0)
+        if filled:
+            lengths = np.array([len(points[index]) for index in filled])
+            centers = np.array([
+                (points[index].min(axis=0) + points[index].max(axis=0)) / 2 for index in filled
+            ])
+            offsets = self.cell_centers.reshape(-1, 3)[filled] - centers
+            self.labels.set_points(
+                np.concatenate([points[index] for index in filled])
+                + np.repeat(offsets, lengths, axis=0)
+            )
+
+        super().__init__(self.header, self.grid, self.labels, **kwargs)
@@ -0,0 +1,114 @@
+"""
+Fabrique de ``Text`` avec cache partagé entre scènes, fichiers et rendus.
+
+Les mêmes libellés reviennent dans toutes les scènes (« Océan Arctique »,
+« Température de brillance (Tᴮ) », titres et sous-titres à taille fixe).
+Construire un ``Text`` coûte un appel à Pango, l'analyse du SVG produit puis
+une fermeture des contours point par point en Python : plusieurs dizaines de
+millisecondes par libellé. ``cached_text`` accepte les mêmes arguments que
+``Text`` et sert le résultat depuis, dans l'ordre :
+
+1. la mémoire du processus (les scènes rendues à la suite par un même
+   worker de ``rendering.batch`` partagent leurs textes) ;
+2. le disque, ``.cache/text/<clé>.pickle`` (d'un rendu ou d'un worker à
+   l'autre) ;
+3. à défaut, un vrai ``Text`` construit par manim, puis mémorisé.
+
+La clé couvre la chaîne et tous les arguments (police, taille, graisse,
+couleur, ``t2c``...) ainsi que la version de manim et le moteur de rendu.
+Chaque appel retourne une copie indépendante. ``text_cache_stats`` donne le
+nombre de réponses de chaque niveau et le taux de succès du cache.
+"""
+
+import atexit
+import pickle
+import threading
+from collections import Counter
+
+from manim import Text, __version__, config, logger
+
+from physics.cache import cache_dir, fingerprint, save_bytes
+
+# À incrémenter si le contenu des entrées du cache change
+TEXT_CACHE_VERSION = 1
+
+# Niveaux de réponse comptés par text_cache_stats
+LEVELS = ("memory", "disk", "pango")
+
+_prototypes = {}
+_key_locks = {}
+_lock = threading.Lock()
+_stats = Counter()
+
+
+def _key(text, kwargs):
+    return fingerprint(
+        TEXT_CACHE_VERSION,
+        __version__,
+        str(config.renderer),
+        text,
+        sorted((name, repr(value)) for name, value in kwargs.items()),
+    )
+
+
+def _key_lock(key):
+    # Un préchargement (rendering.prefetch) et construct() peuvent demander
+    # le même texte en même temps : le second attend le premier
+    with _lock:
+        return _key_locks.setdefault(key, threading.Lock())
+
+
+def _load(path):
+    try:
+        return pickle.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception as error:
+        logger.debug(f"Entrée de cache de texte illisible {path} : {error}")
+        return None
+
+
+def _store(path, mobject):
+    try:
+        save_bytes(path, pickle.dumps(mobject, protocol=pickle.HIGHEST_PROTOCOL))
+    except (pickle.PicklingError, AttributeError, TypeError) as error:
+        logger.debug(f"Texte non mis en cache {mobject!r} : {error}")
+
+
+def cached_text(text, **kwargs):
+    """``Text(text, **kwargs)``, servi depuis le cache si possible."""
+    key = _key(text, kwargs)
+    with _key_lock(key):
+        prototype = _prototypes.get(key)
+        if prototype is not None:
+            level = "memory"
+        else:
+            path = cache_dir("text") / f"{key}.pickle"
+            prototype = _load(path)
+            level = "disk"
+            if prototype is None:
+                prototype = Text(text, **kwargs)
+                level = "pango"
+                _store(path, prototype)
+            _prototypes[key] = prototype
+        _stats[level] += 1
+    return prototype.copy()
+
+
+def text_cache_stats():
+    """Compteurs par niveau (``memory``, ``disk``, ``pango``) et taux de succès."""
+    stats = {level: _stats[level] for level in LEVELS}
+    total = sum(stats.values())
+    stats["requests"] = total
+    stats["hit_rate"] = (stats["memory"] + stats["disk"]) / total if total else 0.0
+    return stats
+
+
+@atexit.register
+def _report():
+    stats = text_cache_stats()
+    if stats["requests"]:
+        logger.info(
+            f"Cache de textes : {stats['requests']} demandes, {stats['hit_rate']:.0%} servies "
+            f"(mémoire {stats['memory']}, disque {stats['disk']}, Pango {stats['pango']})"
+        )
@@ -1,13 +1,25 @@
 from manim import *
 
+from physics.freezing import (
+    FREEZE_BREAKPOINTS, emissivity, physical_temperature, brightness_temperature
+)
+from rendering.plotting import plot_piecewise
+from rendering.prefetch import prefetch_text
+from rendering.raster import AdvanceIceFront, FreezingSurface
+from rendering.text import cached_text
+
 class SimpleRadarBasics(Scene):
     """
     Version simplifiée de la scène RadarBasics pour éviter les problèmes de LaTeX
     """
+    def setup(self):
+        # Textes et formules préparés en arrière-plan pendant les premières animations
+        prefetch_text(self)
+
     def construct(self):
         # Titre
-        title = Text("Principes de la télédétection radar", font_size=42)
-        subtitle = Text("Mesure de l'humidité du sol", font_size=32, color=BLUE)
+        title = cached_text("Principes de la télédétection radar", font_size=42)
+        subtitle = cached_text("Mesure de l'humidité du sol", font_size=32, color=BLUE)
         subtitle.next_to(title, DOWN)
         
         # Animation du titre
@@ -23,7 +35,7 @@ class SimpleRadarBasics(Scene):
         )
         
         # Principe de base du radar
-        radar_principle = Text("Comment fonctionne un radar?", font_size=32, color=YELLOW)
+        radar_principle = cached_text("Comment fonctionne un radar?", font_size=32, color=YELLOW)
         radar_principle.next_to(subtitle, DOWN, buff=0.7)
         
         # Animation du principe radar
@@ -47,10 +59,10 @@ class SimpleRadarBasics(Scene):
         radar_wave_back = DashedLine(ground.point_from_proportion(0.7), radar.get_center(), color=RED)
         
         # Ajouter des étiquettes
-        emitted_label = Text("Signal émis", font_size=20, color=YELLOW)
+        emitted_label = cached_text("Signal émis", font_size=20, color=YELLOW)
         emitted_label.next_to(radar_wave_out.get_center(), UP+RIGHT, buff=0.3)
         
-        reflected_label = Text("Signal rétrodiffusé", font_size=20, color=RED)
+        reflected_label = cached_text("Signal rétrodiffusé", font_size=20, color=RED)
         reflected_label.next_to(radar_wave_back.get_center(), UP+LEFT, buff=0.3)
         
         # Animation du schéma radar
@@ -72,13 +84,13 @@ class SimpleRadarBasics(Scene):
         self.wait(1)
         
         # Introduction au coefficient de rétrodiffusion
-        backscatter_title = Text("Coefficient de rétrodiffusion (σ°)", font_size=28, color=GREEN)
+        backscatter_title = cached_text("Coefficient de rétrodiffusion (σ°)", font_size=28, color=GREEN)
         backscatter_title.to_edge(RIGHT).shift(UP * 1.5 + LEFT * 3)
         
         # Utilisation de Text au lieu de BulletedList (qui utilise LaTeX)
-        bullet1 = Text("• Mesure l'intensité du signal retourné vers le capteur", font_size=22)
-        bullet2 = Text("• Exprimé en décibels (dB)", font_size=22)
-        bullet3 = Text("• Dépend des propriétés de la surface", font_size=22)
+        bullet1 = cached_text("• Mesure l'intensité du signal retourné vers le capteur", font_size=22)
+        bullet2 = cached_text("• Exprimé en décibels (dB)", font_size=22)
+        bullet3 = cached_text("• Dépend des propriétés de la surface", font_size=22)
         
         bullets = VGroup(bullet1, bullet2, bullet3).arrange(DOWN, aligned_edge=LEFT, buff=0.2)
         bullets.next_to(backscatter_title, DOWN, aligned_edge=LEFT, buff=0.3)
@@ -89,13 +101,13 @@ class SimpleRadarBasics(Scene):
         self.wait(1.5)
         
         # Formule du coefficient de rétrodiffusion (simplifiée)
-        formula = Text("σ° ∝ Ks · εr", font_size=32)
+        formula = cached_text("σ° ∝ Ks · εr", font_size=32)
         formula.next_to(bullets, DOWN, buff=0.5)
         
         formula_explanation = VGroup(
-            Text("Où:", font_size=22),
-            Text("Ks = facteur de rugosité", font_size=22),
-            Text("εr = permittivité relative (liée à l'humidité)", font_size=22)
+            cached_text("Où:", font_size=22),
+            cached_text("Ks = facteur de rugosité", font_size=22),
+            cached_text("εr = permittivité relative (liée à l'humidité)", font_size=22)
         ).arrange(DOWN, aligned_edge=LEFT)
         formula_explanation.next_to(formula, DOWN, buff=0.3)
         
@@ -105,7 +117,7 @@ class SimpleRadarBasics(Scene):
         self.wait(2)
         
         # Conclusion
-        conclusion = Text(
+        conclusion = cached_text(
             "La télédétection radar permet de mesurer l'humidité du sol\n"
             "en utilisant les propriétés de rétrodiffusion des surfaces.",
             font_size=28,
@@ -122,13 +134,16 @@ class SimpleBrightnessTemperature(Scene):
     Version simplifiée de l'animation sur la température de brillance
     sans les éléments qui causent des erreurs
     """
+    def setup(self):
+        prefetch_text(self)
+
     def construct(self):
         # Configuration de la scène avec fond noir
         self.camera.background_color = BLACK
         
         # Titre avec style amélioré
-        title = Text("Évolution de la Température de Brillance", font_size=48, color=WHITE)
-        subtitle = Text("Pendant le gel de l'eau salée en Arctique", font_size=36, color=BLUE_B)
+        title = cached_text("Évolution de la Température de Brillance", font_size=48, color=WHITE)
+        subtitle = cached_text("Pendant le gel de l'eau salée en Arctique", font_size=36, color=BLUE_B)
         
         title_group = VGroup(title, subtitle).arrange(DOWN, buff=0.3)
         
@@ -157,66 +172,49 @@ class SimpleBrightnessTemperature(Scene):
         ).shift(DOWN*0.5)
         
         # Étiquettes d'axes plus lisibles
-        x_label = Text("Temps (jours)", font_size=24, color=WHITE)
+        x_label = cached_text("Temps (jours)", font_size=24, color=WHITE)
         x_label.next_to(axes, DOWN)
         
-        y_label = Text("Valeur normalisée", font_size=24, color=WHITE)
+        y_label = cached_text("Valeur normalisée", font_size=24, color=WHITE)
         y_label.next_to(axes, LEFT).rotate(PI/2)
         
-        # Définition des fonctions pour les courbes
-        def physical_temperature(x):
-            # Température physique avec légère diminution pendant la transition
-            if x < 3:
-                return 1.0  # Eau à température initiale
-            elif x < 6:
-                return 1.0 - 0.1 * (x - 3) / 3  # Légère baisse pendant la transition
-            else:
-                return 0.9  # Eau gelée (légèrement plus froide)
-        
-        def emissivity(x):
-            # Émissivité qui change pendant la transition eau-glace
-            # Valeurs basées sur des mesures scientifiques
-            if x < 3:
-                return 0.55  # Émissivité de l'eau de mer (19-37 GHz)
-            elif x < 6:
-                return 0.55 + (0.92 - 0.55) * (x - 3) / 3  # Transition progressive
-            else:
-                return 0.92  # Émissivité de la nouvelle glace de mer
-        
-        def brightness_temperature(x):
-            # Température de brillance = émissivité * température physique
-            return emissivity(x) * physical_temperature(x)
-        
         # Création des courbes avec épaisseur et couleurs distinctes
-        temp_phys_curve = axes.plot(
+        temp_phys_curve = plot_piecewise(
+            axes,
             physical_temperature,
+            FREEZE_BREAKPOINTS,
             x_range=[0, 10],
             color=BLUE_C,
             stroke_width=4,
         )
         
-        emissivity_curve = axes.plot(
+        emissivity_curve = plot_piecewise(
+            axes,
             emissivity,
+            FREEZE_BREAKPOINTS,
             x_range=[0, 10],
             color=GREEN_D,
             stroke_width=4,
         )
         
-        tb_curve = axes.plot(
+        tb_curve = plot_piecewise(
+            axes,
             brightness_temperature,
+            FREEZE_BREAKPOINTS,
             x_range=[0, 10],
+            degree=2,
             color=RED_C,
             stroke_width=4,
         )
         
         # Placement plus clair des étiquettes de courbes
-        temp_phys_label = Text("Température physique", font_size=28, color=BLUE_C)
+        temp_phys_label = cached_text("Température physique", font_size=28, color=BLUE_C)
         temp_phys_label.to_edge(RIGHT).shift(UP*1.5 + LEFT*3)
         
-        emissivity_label = Text("Émissivité (ε)", font_size=28, color=GREEN_D)
+        emissivity_label = cached_text("Émissivité (ε)", font_size=28, color=GREEN_D)
         emissivity_label.to_edge(RIGHT).shift(UP*0.5 + LEFT*5)
         
-        tb_label = Text("Température de brillance (Tᴮ)", font_size=28, color=RED_C)
+        tb_label = cached_text("Température de brillance (Tᴮ)", font_size=28, color=RED_C)
         tb_label.to_edge(RIGHT).shift(DOWN*0.5 + LEFT*2.5)
         
         # Animation progressive
@@ -227,7 +225,7 @@ class SimpleBrightnessTemperature(Scene):
         ocean = Rectangle(width=9, height=1.2, fill_opacity=0.8, fill_color="#0C2D48", stroke_color=BLUE_E)
         ocean.next_to(axes, DOWN, buff=1.75)
         
-        ocean_label = Text("Océan Arctique", font_size=28, color=BLUE_E)
+        ocean_label = cached_text("Océan Arctique", font_size=28, color=BLUE_E)
         ocean_label.next_to(ocean, UP, buff=0.2)
         
         self.play(
@@ -260,23 +258,19 @@ class SimpleBrightnessTemperature(Scene):
         self.wait(1)
         
         # Visualisation de la formation de glace avec transition claire
-        ice_formation = Rectangle(width=0, height=1.2, fill_opacity=0.9, fill_color="#B3E5FC", stroke_width=0)
-        ice_formation.align_to(ocean, DOWN+LEFT)
+        ice_formation = FreezingSurface(ocean.width, ocean.height).move_to(ocean)
+        self.add(ice_formation)
         
-        self.play(
-            GrowFromPoint(ice_formation, ice_formation.get_center(), rate_func=rate_functions.linear),
-            ice_formation.animate.stretch_to_fit_width(9),
-            run_time=3
-        )
+        self.play(AdvanceIceFront(ice_formation, ocean.width), run_time=3)
         
         # Formules dans un cadre
         formula_box = Rectangle(width=6, height=2.5, fill_opacity=0.8, fill_color=BLACK, stroke_color=YELLOW, stroke_width=3)
         formula_box.to_edge(LEFT, buff=0.5).shift(UP*2.5)
         
-        formula_title = Text("Équation fondamentale", font_size=30, color=YELLOW)
+        formula_title = cached_text("Équation fondamentale", font_size=30, color=YELLOW)
         formula_title.next_to(formula_box.get_top(), DOWN, buff=0.2)
         
-        formula = Text("Tᴮ(θ, ν) = ε(θ, ν) · Tphys", font_size=30)
+        formula = cached_text("Tᴮ(θ, ν) = ε(θ, ν) · Tphys", font_size=30)
         formula.next_to(formula_title, DOWN, buff=0.3)
         
         self.play(
@@ -291,7 +285,7 @@ class SimpleBrightnessTemperature(Scene):
         )
         
         # Message final
-        final_message = Text(
+        final_message = cached_text(
             "La température de brillance augmente significativement\n"
             "en raison de l'augmentation de l'émissivité lors\n"
             "de la formation de glace.",
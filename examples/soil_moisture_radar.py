@@ -1,6 +1,21 @@
 from manim import *
 import numpy as np
 
+from physics.backscatter import RADAR_FREQUENCY, backscatter, backscatter_db, to_db
+from physics.dielectric import SOIL_TABLE
+from physics.fresnel import fresnel_emissivity
+from physics.inversion import INVERSION_POLARIZATIONS, MoistureInversion
+from physics.roughness import rms_height, rough_profile
+from physics.speckle import (
+    FILTER_WINDOW, add_speckle, lee_filter, mean_intensity, multilook_filter, soil_moisture_field,
+)
+from rendering.composition import SceneSequence
+from rendering.layers import LayeredScene
+from rendering.plotting import cached_plot, plot_family, profile_curve
+from rendering.prefetch import prefetch_text
+from rendering.raster import RasterMap
+from rendering.text import cached_text
+
 """
 Animation sur l'humidité du sol avec radar
 Cette animation vise à expliquer la relation entre la rugosité du sol, l'humidité et
@@ -10,18 +25,50 @@ le coefficient de rétrodiffusion radar, ainsi que l'influence de l'angle d'inci
 # Définition des constantes et paramètres
 LOW_ROUGHNESS_Ks = 0.4
 HIGH_ROUGHNESS_Ks = 1.2
-DRY_SOIL_DIELECTRIC = 4
-WET_SOIL_DIELECTRIC = 20
+
+# Humidité volumique (m³/m³) des sols sec et humide ; la fréquence du radar
+# (bande C) est celle du modèle de rétrodiffusion, RADAR_FREQUENCY
+DRY_SOIL_MOISTURE = 0.05
+WET_SOIL_MOISTURE = 0.35
+REFERENCE_SOIL_MOISTURE = 0.2
+
+# Image radar simulée : taille (pixels), rugosité, angle d'incidence (degrés),
+# plage d'affichage (dB), nombre maximal de vues, fenêtre maximale du filtre
+SAR_IMAGE_SIZE = 1024
+SAR_ROUGHNESS_Ks = 0.8
+SAR_INCIDENCE = 35
+SAR_DB_RANGE = (-25, 0)
+SAR_MAX_LOOKS = 16
+SAR_MAX_WINDOW = 15
+SAR_SEED = 0
+
+# Inversion : taille de l'image (pixels), vues cumulées, fenêtre de moyenne,
+# couleurs du sol sec au sol humide
+RETRIEVAL_IMAGE_SIZE = 512
+RETRIEVAL_MAX_LOOKS = 256
+RETRIEVAL_WINDOW = 5
+MOISTURE_COLORS = ["#8B5A2B", "#D9C27A", "#4FA3D1", "#0C2D48"]
+
+# Profils de surface : longueur de sol représentée (cm), échantillons,
+# largeur dans la scène et exagération verticale des hauteurs
+SURFACE_LENGTH = 60.0
+SURFACE_SAMPLES = 2 ** 16
+SURFACE_WIDTH = 3.0
+SURFACE_HEIGHT_EXAGGERATION = 2.5
 
 
 class RadarBasics(Scene):
     """
     Cette classe présente les concepts de base de la télédétection radar
     """
+    def setup(self):
+        # Textes et formules préparés en arrière-plan pendant les premières animations
+        prefetch_text(self)
+
     def construct(self):
         # Titre
-        title = Text("Principes de la télédétection radar", font_size=42)
-        subtitle = Text("Mesure de l'humidité du sol", font_size=32, color=BLUE)
+        title = cached_text("Principes de la télédétection radar", font_size=42)
+        subtitle = cached_text("Mesure de l'humidité du sol", font_size=32, color=BLUE)
         subtitle.next_to(title, DOWN)
         
         # Animation du titre
@@ -37,7 +84,7 @@ class RadarBasics(Scene):
         )
         
         # Principe de base du radar
-        radar_principle = Text("Comment fonctionne un radar?", font_size=32, color=YELLOW)
+        radar_principle = cached_text("Comment fonctionne un radar?", font_size=32, color=YELLOW)
         radar_principle.next_to(subtitle, DOWN, buff=0.7)
         
         # Animation du principe radar
@@ -61,10 +108,10 @@ class RadarBasics(Scene):
         radar_wave_back = DashedLine(ground.point_from_proportion(0.7), radar.get_center(), color=RED)
         
         # Ajouter des étiquettes
-        emitted_label = Text("Signal émis", font_size=20, color=YELLOW)
+        emitted_label = cached_text("Signal émis", font_size=20, color=YELLOW)
         emitted_label.next_to(radar_wave_out.get_center(), UP+RIGHT, buff=0.3)
         
-        reflected_label = Text("Signal rétrodiffusé", font_size=20, color=RED)
+        reflected_label = cached_text("Signal rétrodiffusé", font_size=20, color=RED)
         reflected_label.next_to(radar_wave_back.get_center(), UP+LEFT, buff=0.3)
         
         # Animation du schéma radar
@@ -86,7 +133,7 @@ class RadarBasics(Scene):
         self.wait(1)
         
         # Introduction au coefficient de rétrodiffusion
-        backscatter_title = Text("Coefficient de rétrodiffusion (σ°)", font_size=28, color=GREEN)
+        backscatter_title = cached_text("Coefficient de rétrodiffusion (σ°)", font_size=28, color=GREEN)
         backscatter_title.to_edge(RIGHT).shift(UP * 1.5 + LEFT * 3)
         
         backscatter_def = BulletedList(
@@ -112,7 +159,7 @@ class RadarBasics(Scene):
         formula.next_to(backscatter_def, DOWN, buff=0.5)
         
         formula_explanation = VGroup(
-            Text("Où:", font_size=22),
+            cached_text("Où:", font_size=22),
             MathTex(r"K_{s}", r"= \text{facteur de rugosité}", font_size=22),
             MathTex(r"\varepsilon_r", r"= \text{permittivité relative (liée à l'humidité)}", font_size=22)
         ).arrange(DOWN, aligned_edge=LEFT)
@@ -132,20 +179,114 @@ class RadarBasics(Scene):
         )
 
 
+class SarSpeckleFiltering(Scene):
+    """
+    Image radar simulée d'un champ d'humidité : chatoiement multiplicatif
+    selon le nombre de vues, puis filtrage de Lee (avant / après)
+    """
+    def setup(self):
+        prefetch_text(self)
+
+    def construct(self):
+        # Titre
+        title = cached_text("Image radar : chatoiement et filtrage", font_size=36)
+        self.play(Write(title), run_time=1.5)
+        self.play(title.animate.scale(0.8).to_edge(UP), run_time=1)
+        
+        # σ° moyen de chaque pixel (modèle d'Oh) sur un champ d'humidité corrélé
+        moisture = soil_moisture_field((SAR_IMAGE_SIZE, SAR_IMAGE_SIZE))
+        intensity = mean_intensity(moisture, SAR_ROUGHNESS_Ks, SAR_INCIDENCE)
+        
+        def raw_image(looks):
+            return add_speckle(intensity, looks, seed=SAR_SEED)
+        
+        looks = ValueTracker(1)
+        window = ValueTracker(FILTER_WINDOW)
+        raw = raw_image(1)
+        
+        images = Group(*[
+            RasterMap(to_db(image), colors=[BLACK, WHITE], vmin=SAR_DB_RANGE[0], vmax=SAR_DB_RANGE[1], height=4.5)
+            for image in (raw, lee_filter(raw, 1, FILTER_WINDOW))
+        ])
+        images.arrange(RIGHT, buff=1).next_to(title, DOWN, buff=0.7)
+        raw_map, filtered_map = images
+        
+        frames = VGroup(*[SurroundingRectangle(image, color=WHITE, buff=0, stroke_width=2) for image in images])
+        image_labels = VGroup(
+            cached_text("Intensité brute", font_size=24, color=YELLOW),
+            cached_text("Filtre de Lee", font_size=24, color=YELLOW),
+        )
+        for label, image in zip(image_labels, images):
+            label.next_to(image, UP, buff=0.15)
+        
+        # Les images ne sont recalculées que si le nombre de vues ou la fenêtre change
+        state = {"looks": 1, "window": FILTER_WINDOW, "raw": raw}
+        
+        def refresh(group):
+            current_looks = int(round(looks.get_value()))
+            current_window = int(window.get_value()) | 1  # fenêtre impaire
+            if current_looks != state["looks"]:
+                state["raw"] = raw_image(current_looks)
+                raw_map.update_field(to_db(state["raw"]))
+            elif current_window == state["window"]:
+                return
+            state["looks"], state["window"] = current_looks, current_window
+            filtered_map.update_field(to_db(lee_filter(state["raw"], current_looks, current_window)))
+        
+        settings = VGroup(
+            cached_text("Vues :", font_size=24),
+            Integer(1, font_size=28, color=YELLOW).add_updater(lambda m: m.set_value(state["looks"])),
+            cached_text("Fenêtre :", font_size=24),
+            Integer(FILTER_WINDOW, font_size=28, color=YELLOW).add_updater(lambda m: m.set_value(state["window"])),
+        ).arrange(RIGHT, buff=0.25)
+        settings.next_to(images, DOWN, buff=0.4)
+        
+        self.play(FadeIn(images), Create(frames), Write(image_labels), run_time=1.5)
+        self.play(FadeIn(settings), run_time=0.5)
+        self.wait(1)
+        
+        # Plus de vues : chatoiement moins fort (coefficient de variation 1/√L)
+        images.add_updater(refresh)
+        self.play(looks.animate.set_value(SAR_MAX_LOOKS), run_time=4, rate_func=linear)
+        self.play(looks.animate.set_value(1), run_time=1.5)
+        self.wait(0.5)
+        
+        # Fenêtre plus grande : zones homogènes plus lisses, contours conservés
+        self.play(window.animate.set_value(SAR_MAX_WINDOW), run_time=3, rate_func=linear)
+        images.clear_updaters()
+        
+        explanation = cached_text(
+            "Le filtre de Lee lisse le chatoiement et conserve les contours du champ d'humidité",
+            font_size=22
+        )
+        explanation.to_edge(DOWN, buff=0.4)
+        self.play(Write(explanation), run_time=1.5)
+        self.wait(2)
+        
+        # Transition vers la prochaine scène
+        self.play(
+            *[FadeOut(mob) for mob in self.mobjects],
+            run_time=1.5
+        )
+
+
 class SoilRoughnessEffect(Scene):
     """
     Cette classe illustre l'effet de la rugosité du sol sur le coefficient de rétrodiffusion
     """
+    def setup(self):
+        prefetch_text(self)
+
     def construct(self):
         # Titre
-        title = Text("1.1 Sensibilité du signal radar à la rugosité du sol", font_size=36)
+        title = cached_text("1.1 Sensibilité du signal radar à la rugosité du sol", font_size=36)
         self.play(Write(title), run_time=1.5)
         self.play(title.animate.scale(0.8).to_edge(UP), run_time=1)
         
         # Définir les axes pour le graphique de rugosité vs coefficient de rétrodiffusion
         axes = Axes(
             x_range=[0, 1.5, 0.5],
-            y_range=[-20, 0, 5],
+            y_range=[-30, 0, 5],
             axis_config={"include_tip": True, "include_numbers": True},
             x_length=6,
             y_length=4
@@ -157,28 +298,25 @@ class SoilRoughnessEffect(Scene):
         y_label = axes.get_y_axis_label(r"Coefficient de rétrodiffusion ($\sigma^{\circ}$) en dB", edge=LEFT, direction=LEFT)
         y_label.scale(0.8)
         
-        # Fonction de coefficient de rétrodiffusion vs rugosité pour une humidité constante
+        # Coefficient de rétrodiffusion vs rugosité pour une humidité constante
+        # (modèle d'Oh, bande C, polarisation VV)
         # Pour angle d'incidence 20°
         def backscatter_vs_roughness_20deg(x):
-            # Simulation simplifiée basée sur les données fournies
-            base = -15  # valeur de base en dB
-            return base + 10 * np.log10(x * 2.5)
+            return backscatter_db(x, REFERENCE_SOIL_MOISTURE, 20)
         
         # Pour angle d'incidence 40°
         def backscatter_vs_roughness_40deg(x):
-            # Simulation simplifiée basée sur les données fournies
-            base = -18  # valeur de base en dB
-            return base + 10 * np.log10(x * 3.0)
+            return backscatter_db(x, REFERENCE_SOIL_MOISTURE, 40)
         
         # Créer les courbes
-        curve_20deg = axes.plot(backscatter_vs_roughness_20deg, color=RED, x_range=[0.1, 1.3])
-        curve_40deg = axes.plot(backscatter_vs_roughness_40deg, color=BLUE, x_range=[0.1, 1.3])
+        curve_20deg = cached_plot(axes, backscatter_vs_roughness_20deg, x_range=[0.1, 1.3], use_vectorized=True, color=RED)
+        curve_40deg = cached_plot(axes, backscatter_vs_roughness_40deg, x_range=[0.1, 1.3], use_vectorized=True, color=BLUE)
         
         # Ajouter des étiquettes aux courbes
-        curve_label_20deg = Text("Angle d'incidence 20°", font_size=20, color=RED)
+        curve_label_20deg = cached_text("Angle d'incidence 20°", font_size=20, color=RED)
         curve_label_20deg.next_to(curve_20deg.point_from_proportion(0.9), UP)
         
-        curve_label_40deg = Text("Angle d'incidence 40°", font_size=20, color=BLUE)
+        curve_label_40deg = cached_text("Angle d'incidence 40°", font_size=20, color=BLUE)
         curve_label_40deg.next_to(curve_40deg.point_from_proportion(0.9), DOWN)
         
         # Animation des axes et courbes
@@ -237,27 +375,29 @@ class SoilRoughnessEffect(Scene):
             run_time=1
         )
         
-        # Illustration visuelle des surfaces de différentes rugosités
+        # Illustration visuelle des surfaces de différentes rugosités : profils
+        # synthétiques dont l'écart type des hauteurs donne les ks marqués
+        def surface_profile(ks, seed):
+            xs = np.linspace(-SURFACE_LENGTH / 2, SURFACE_LENGTH / 2, SURFACE_SAMPLES)
+            heights = rough_profile(
+                SURFACE_SAMPLES, xs[1] - xs[0], rms_height(ks, RADAR_FREQUENCY),
+                correlation="exponential", seed=seed
+            )
+            scale = SURFACE_WIDTH / SURFACE_LENGTH
+            return profile_curve(xs * scale, heights * scale * SURFACE_HEIGHT_EXAGGERATION, color=BROWN)
+        
         # Surface peu rugueuse
-        smooth_surface = FunctionGraph(
-            lambda x: 0.05 * np.sin(10 * x),
-            x_range=[-3, 3],
-            color=BROWN
-        )
-        smooth_surface.scale(0.5).move_to(axes.coords_to_point(0.4, -26))
+        smooth_surface = surface_profile(LOW_ROUGHNESS_Ks, seed=1)
+        smooth_surface.move_to(axes.coords_to_point(0.4, -31))
         
-        smooth_label = Text("Surface faiblement rugueuse", font_size=20)
+        smooth_label = cached_text("Surface faiblement rugueuse", font_size=20)
         smooth_label.next_to(smooth_surface, DOWN)
         
         # Surface très rugueuse
-        rough_surface = FunctionGraph(
-            lambda x: 0.2 * np.sin(10 * x) + 0.1 * np.sin(20 * x),
-            x_range=[-3, 3],
-            color=BROWN
-        )
-        rough_surface.scale(0.5).move_to(axes.coords_to_point(1.2, -26))
+        rough_surface = surface_profile(HIGH_ROUGHNESS_Ks, seed=2)
+        rough_surface.move_to(axes.coords_to_point(1.2, -31))
         
-        rough_label = Text("Surface très rugueuse", font_size=20)
+        rough_label = cached_text("Surface très rugueuse", font_size=20)
         rough_label.next_to(rough_surface, DOWN)
         
         # Animation des surfaces
@@ -274,7 +414,7 @@ class SoilRoughnessEffect(Scene):
         )
         
         # Explication textuelle
-        explanation = Text(
+        explanation = cached_text(
             "La rétrodiffusion radar augmente avec la rugosité de surface",
             font_size=24
         )
@@ -290,13 +430,16 @@ class SoilRoughnessEffect(Scene):
         )
 
 
-class SoilMoistureEffect(Scene):
+class SoilMoistureEffect(LayeredScene):
     """
     Cette classe illustre l'effet de l'humidité du sol sur le coefficient de rétrodiffusion
     """
+    def setup(self):
+        prefetch_text(self)
+
     def construct(self):
         # Titre
-        title = Text("1.2 Sensibilité du signal radar à l'humidité du sol", font_size=36)
+        title = cached_text("1.2 Sensibilité du signal radar à l'humidité du sol", font_size=36)
         self.play(Write(title), run_time=1.5)
         self.play(title.animate.scale(0.8).to_edge(UP), run_time=1)
         
@@ -315,32 +458,35 @@ class SoilMoistureEffect(Scene):
         y_label = axes.get_y_axis_label(r"Coefficient de rétrodiffusion ($\sigma^{\circ}$) en dB", edge=LEFT, direction=LEFT)
         y_label.scale(0.8)
         
-        # Fonction de coefficient de rétrodiffusion vs humidité pour différentes rugosités
+        # Coefficient de rétrodiffusion vs humidité (en %) pour différentes rugosités
+        # (modèle d'Oh, bande C, polarisation VV, incidence de 20°)
         # Pour faible rugosité (Ks = 0.4)
         def backscatter_vs_moisture_low_roughness(x):
-            # Simulation simplifiée basée sur les données du document
-            base = -22  # valeur de base en dB
-            # Relation non linéaire avec saturation à des valeurs élevées d'humidité
-            sensitivity = 0.8 - (x/100) * 0.6  # sensibilité diminue avec l'humidité
-            return base + sensitivity * 15 * np.log10(1 + x/5)
+            return backscatter_db(LOW_ROUGHNESS_Ks, x / 100, 20)
         
         # Pour forte rugosité (Ks = 1.2)
         def backscatter_vs_moisture_high_roughness(x):
-            # Simulation simplifiée basée sur les données du document
-            base = -15  # valeur de base en dB
-            # Relation non linéaire avec saturation à des valeurs élevées d'humidité
-            sensitivity = 0.8 - (x/100) * 0.6  # sensibilité diminue avec l'humidité
-            return base + sensitivity * 12 * np.log10(1 + x/5)
+            return backscatter_db(HIGH_ROUGHNESS_Ks, x / 100, 20)
+        
+        # Famille de rugosités intermédiaires, interpolées dans la table du modèle
+        roughness_family = plot_family(
+            axes,
+            lambda x, ks: backscatter(ks, x / 100, 20),
+            np.linspace(0.2, 1.4, 13),
+            x_range=[0.1, 40],
+            stroke_width=1,
+            stroke_opacity=0.4,
+        ).set_color(GRAY)
         
         # Créer les courbes
-        curve_low_roughness = axes.plot(backscatter_vs_moisture_low_roughness, color=BLUE, x_range=[0.1, 40])
-        curve_high_roughness = axes.plot(backscatter_vs_moisture_high_roughness, color=RED, x_range=[0.1, 40])
+        curve_low_roughness = cached_plot(axes, backscatter_vs_moisture_low_roughness, x_range=[0.1, 40], use_vectorized=True, color=BLUE)
+        curve_high_roughness = cached_plot(axes, backscatter_vs_moisture_high_roughness, x_range=[0.1, 40], use_vectorized=True, color=RED)
         
         # Ajouter des étiquettes aux courbes
-        curve_label_low_roughness = Text("Faible rugosité (Ks = 0.4)", font_size=20, color=BLUE)
+        curve_label_low_roughness = cached_text("Faible rugosité (Ks = 0.4)", font_size=20, color=BLUE)
         curve_label_low_roughness.next_to(axes, RIGHT).shift(UP * 1)
         
-        curve_label_high_roughness = Text("Forte rugosité (Ks = 1.2)", font_size=20, color=RED)
+        curve_label_high_roughness = cached_text("Forte rugosité (Ks = 1.2)", font_size=20, color=RED)
         curve_label_high_roughness.next_to(curve_label_low_roughness, DOWN, aligned_edge=LEFT)
         
         # Animation des axes et courbes
@@ -351,6 +497,8 @@ class SoilMoistureEffect(Scene):
             run_time=2
         )
         
+        self.play(Create(roughness_family, lag_ratio=0.1), run_time=1.5)
+        
         self.play(
             Create(curve_low_roughness),
             Write(curve_label_low_roughness),
@@ -377,7 +525,7 @@ class SoilMoistureEffect(Scene):
         
         # Valeur d'augmentation (en dB)
         increase_1 = backscatter_vs_moisture_low_roughness(15) - backscatter_vs_moisture_low_roughness(5)
-        increase_label_1 = Text(f"Δσ° = {increase_1:.1f} dB", font_size=20, color=YELLOW)
+        increase_label_1 = cached_text(f"Δσ° = {increase_1:.1f} dB", font_size=20, color=YELLOW)
         increase_label_1.next_to(line_reference_1.get_center(), UP)
         
         # Animation des points et lignes de référence
@@ -402,7 +550,7 @@ class SoilMoistureEffect(Scene):
         
         # Valeur d'augmentation (en dB)
         increase_2 = backscatter_vs_moisture_low_roughness(30) - backscatter_vs_moisture_low_roughness(15)
-        increase_label_2 = Text(f"Δσ° = {increase_2:.1f} dB", font_size=20, color=GREEN)
+        increase_label_2 = cached_text(f"Δσ° = {increase_2:.1f} dB", font_size=20, color=GREEN)
         increase_label_2.next_to(line_reference_2.get_center(), UP)
         
         # Animation des points et lignes de référence
@@ -419,7 +567,7 @@ class SoilMoistureEffect(Scene):
         
         # Explication de la relation non linéaire
         explanation = VGroup(
-            Text("Relation non linéaire:", font_size=24, color=YELLOW),
+            cached_text("Relation non linéaire:", font_size=24, color=YELLOW),
             BulletedList(
                 "Forte sensibilité à faible humidité",
                 "Saturation à forte humidité",
@@ -432,7 +580,7 @@ class SoilMoistureEffect(Scene):
         self.wait(2)
         
         # Permittivité diélectrique
-        permittivity_title = Text("Permittivité diélectrique (εr)", font_size=28, color=BLUE)
+        permittivity_title = cached_text("Permittivité diélectrique (εr)", font_size=28, color=BLUE)
         permittivity_title.to_edge(RIGHT).shift(LEFT * 3 + UP * 1)
         
         permittivity_equation = MathTex(r"\varepsilon_r \propto", r" \text{humidité du sol}", font_size=24)
@@ -440,8 +588,8 @@ class SoilMoistureEffect(Scene):
         
         # Valeurs typiques
         permittivity_values = VGroup(
-            Text("Sol sec: εr ≈ 3-8", font_size=22),
-            Text("Sol saturé: εr ≈ 80", font_size=22)
+            cached_text("Sol sec: εr ≈ 3-8", font_size=22),
+            cached_text("Sol saturé: εr ≈ 80", font_size=22)
         ).arrange(DOWN, aligned_edge=LEFT)
         permittivity_values.next_to(permittivity_equation, DOWN, buff=0.5)
         
@@ -461,6 +609,112 @@ class SoilMoistureEffect(Scene):
             run_time=1.5
         )
         
+        # Balayage de l'humidité : εr' interpolé dans la table de Dobson à chaque image
+        moisture = ValueTracker(DRY_SOIL_MOISTURE)
+        moisture_label = cached_text("Humidité (%) :", font_size=22)
+        moisture_value = DecimalNumber(0, num_decimal_places=0, font_size=28)
+        moisture_value.add_updater(lambda m: m.set_value(100 * moisture.get_value()))
+        epsilon_label = MathTex(r"\varepsilon_r' =", font_size=28, color=BLUE)
+        epsilon_value = DecimalNumber(0, num_decimal_places=1, font_size=28, color=BLUE)
+        epsilon_value.add_updater(
+            lambda m: m.set_value(SOIL_TABLE(moisture.get_value(), RADAR_FREQUENCY).real)
+        )
+        moisture_sweep = VGroup(
+            VGroup(moisture_label, moisture_value).arrange(RIGHT, buff=0.2),
+            VGroup(epsilon_label, epsilon_value).arrange(RIGHT, buff=0.2),
+        ).arrange(DOWN, aligned_edge=LEFT, buff=0.2)
+        moisture_sweep.next_to(permittivity_values, DOWN, buff=0.4, aligned_edge=LEFT)
+        
+        self.play(FadeIn(moisture_sweep), run_time=0.5)
+        self.play(moisture.animate.set_value(0.45), run_time=3)
+        self.play(moisture.animate.set_value(WET_SOIL_MOISTURE), run_time=1)
+        moisture_value.clear_updaters()
+        epsilon_value.clear_updaters()
+        
+        self.wait(2)
+        
+        # Transition vers la prochaine scène
+        self.play(
+            *[FadeOut(mob) for mob in self.mobjects],
+            run_time=1.5
+        )
+
+
+class SoilMoistureRetrieval(Scene):
+    """
+    Inversion de σ° (VV et HH) en humidité du sol pour toute une image :
+    la carte estimée converge vers la vraie carte à mesure que les vues
+    s'accumulent et que le chatoiement diminue
+    """
+    def setup(self):
+        prefetch_text(self)
+
+    def construct(self):
+        # Titre
+        title = cached_text("Inversion : de σ° à l'humidité du sol", font_size=36)
+        self.play(Write(title), run_time=1.5)
+        self.play(title.animate.scale(0.8).to_edge(UP), run_time=1)
+        
+        # Vraie humidité et σ° moyens en VV et HH (modèle d'Oh)
+        size = (RETRIEVAL_IMAGE_SIZE, RETRIEVAL_IMAGE_SIZE)
+        moisture = soil_moisture_field(size, correlation_pixels=20)
+        intensities = [
+            mean_intensity(moisture, SAR_ROUGHNESS_Ks, SAR_INCIDENCE, polarization)
+            for polarization in INVERSION_POLARIZATIONS
+        ]
+        inversion = MoistureInversion()
+        
+        maps = Group(*[
+            RasterMap(moisture, colors=MOISTURE_COLORS, vmin=0.02, vmax=0.45, height=4.5)
+            for _ in range(2)
+        ])
+        maps.arrange(RIGHT, buff=1).next_to(title, DOWN, buff=0.7)
+        truth_map, retrieved_map = maps
+        retrieved_map.update_field(np.zeros(size))
+        
+        frames = VGroup(*[SurroundingRectangle(image, color=WHITE, buff=0, stroke_width=2) for image in maps])
+        map_labels = VGroup(
+            cached_text("Humidité réelle", font_size=24, color=YELLOW),
+            cached_text("Humidité estimée (VV, HH)", font_size=24, color=YELLOW),
+        )
+        for label, image in zip(map_labels, maps):
+            label.next_to(image, UP, buff=0.15)
+        
+        looks_value = Integer(0, font_size=28, color=YELLOW)
+        rmse_value = DecimalNumber(0, num_decimal_places=3, font_size=28, color=YELLOW)
+        status = VGroup(
+            cached_text("Vues :", font_size=24), looks_value,
+            cached_text("Erreur quadratique moyenne (m³/m³) :", font_size=24), rmse_value,
+        ).arrange(RIGHT, buff=0.25)
+        status.next_to(maps, DOWN, buff=0.4)
+        
+        self.play(FadeIn(maps), Create(frames), Write(map_labels), run_time=1.5)
+        self.play(FadeIn(status), run_time=0.5)
+        
+        # Vues cumulées en place ; l'image entière est inversée à chaque doublement
+        rng = np.random.default_rng(SAR_SEED)
+        sums = [np.zeros(size, dtype=np.float32) for _ in intensities]
+        looks = 0
+        while looks < RETRIEVAL_MAX_LOOKS:
+            for total, intensity in zip(sums, intensities):
+                for _ in range(max(looks, 1)):
+                    total += add_speckle(intensity, 1, seed=rng)
+            looks = max(2 * looks, 1)
+            sigma = np.stack(
+                [to_db(multilook_filter(total / looks, RETRIEVAL_WINDOW)) for total in sums], axis=-1
+            )
+            retrieved, _ = inversion.retrieve(sigma, SAR_INCIDENCE)
+            retrieved_map.update_field(retrieved)
+            looks_value.set_value(looks)
+            rmse_value.set_value(np.sqrt(np.mean((retrieved - moisture) ** 2)))
+            self.wait(0.6)
+        
+        explanation = cached_text(
+            "Table du modèle indexée par un arbre k-d : toute l'image est inversée en une requête groupée",
+            font_size=22
+        )
+        explanation.to_edge(DOWN, buff=0.4)
+        self.play(Write(explanation), run_time=1.5)
         self.wait(2)
         
         # Transition vers la prochaine scène
@@ -474,9 +728,12 @@ class IncidenceAngleEffect(Scene):
     """
     Cette classe illustre les différences entre les angles d'incidence (20° et 40°)
     """
+    def setup(self):
+        prefetch_text(self)
+
     def construct(self):
         # Titre
-        title = Text("1.3 Différences entre les deux angles d'incidence", font_size=36)
+        title = cached_text("1.3 Différences entre les deux angles d'incidence", font_size=36)
         self.play(Write(title), run_time=1.5)
         self.play(title.animate.scale(0.8).to_edge(UP), run_time=1)
         
@@ -502,7 +759,7 @@ class IncidenceAngleEffect(Scene):
         )
         angle_20deg_arc.move_to(incidence_point)
         
-        angle_20deg_label = Text("20°", font_size=24, color=RED)
+        angle_20deg_label = cached_text("20°", font_size=24, color=RED)
         angle_20deg_label.next_to(angle_20deg_arc, RIGHT)
         
         # 40 degrés
@@ -517,7 +774,7 @@ class IncidenceAngleEffect(Scene):
         )
         angle_40deg_arc.move_to(incidence_point)
         
-        angle_40deg_label = Text("40°", font_size=24, color=BLUE)
+        angle_40deg_label = cached_text("40°", font_size=24, color=BLUE)
         angle_40deg_label.next_to(angle_40deg_arc, RIGHT)
         
         # Animation de la représentation visuelle
@@ -548,7 +805,7 @@ class IncidenceAngleEffect(Scene):
         explanation_box.set_fill(BLACK, opacity=0.7)
         explanation_box.to_edge(RIGHT, buff=0.5)
         
-        explanation_title = Text("Différences clés:", font_size=28, color=YELLOW)
+        explanation_title = cached_text("Différences clés:", font_size=28, color=YELLOW)
         explanation_title.next_to(explanation_box.get_top(), DOWN, buff=0.3)
         
         explanation_text = BulletedList(
@@ -575,12 +832,12 @@ class IncidenceAngleEffect(Scene):
         # Illustration de la profondeur de pénétration
         # 20 degrés - pénétration moins profonde
         penetration_20deg = Line(incidence_point, incidence_point + DOWN * 0.7, color=RED, stroke_width=4)
-        penetration_20deg_label = Text("Pénétration à 20°", font_size=20, color=RED)
+        penetration_20deg_label = cached_text("Pénétration à 20°", font_size=20, color=RED)
         penetration_20deg_label.next_to(penetration_20deg, LEFT)
         
         # 40 degrés - pénétration plus profonde
         penetration_40deg = Line(incidence_point, incidence_point + DOWN * 0.4, color=BLUE, stroke_width=4)
-        penetration_40deg_label = Text("Pénétration à 40°", font_size=20, color=BLUE)
+        penetration_40deg_label = cached_text("Pénétration à 40°", font_size=20, color=BLUE)
         penetration_40deg_label.next_to(penetration_40deg, RIGHT)
         
         # Animation de la pénétration
@@ -597,7 +854,7 @@ class IncidenceAngleEffect(Scene):
         )
         
         # Explication finale
-        final_explanation = Text(
+        final_explanation = cached_text(
             "À 40°, le signal radar traverse davantage de matière avant d'atteindre le sol,\n"
             "réduisant sa sensibilité à l'humidité du sol, particulièrement sous la végétation.",
             font_size=24,
@@ -607,7 +864,120 @@ class IncidenceAngleEffect(Scene):
         
         self.play(Write(final_explanation), run_time=2)
         self.wait(2)
-        
+
+        # Émissivité de Fresnel du sol selon l'angle (vue du radiomètre)
+        self.play(
+            *[FadeOut(mob) for mob in self.mobjects if mob is not title],
+            run_time=1
+        )
+
+        axes = Axes(
+            x_range=[0, 70, 10],
+            y_range=[0, 1, 0.2],
+            axis_config={"include_tip": True, "include_numbers": True},
+            x_length=7,
+            y_length=4
+        )
+        axes.to_edge(LEFT, buff=1).shift(DOWN * 0.3)
+
+        x_label = axes.get_x_axis_label(MathTex(r"\text{Angle d'incidence}~\theta~(^\circ)"), edge=DOWN, direction=DOWN)
+        y_label = axes.get_y_axis_label(MathTex(r"\text{Émissivité}~e"), edge=LEFT, direction=LEFT)
+        y_label.scale(0.8)
+
+        # Permittivités des sols sec et humide (modèle de Dobson), lues dans la
+        # table au rendu plutôt qu'à l'import du module
+        dry_soil_dielectric = complex(SOIL_TABLE(DRY_SOIL_MOISTURE, RADAR_FREQUENCY))
+        wet_soil_dielectric = complex(SOIL_TABLE(WET_SOIL_MOISTURE, RADAR_FREQUENCY))
+
+        # Émissivités H et V d'un sol lisse sec et humide, pour tous les angles à la fois
+        def emissivity_dry_h(theta):
+            return fresnel_emissivity(dry_soil_dielectric, theta)[0]
+
+        def emissivity_dry_v(theta):
+            return fresnel_emissivity(dry_soil_dielectric, theta)[1]
+
+        def emissivity_wet_h(theta):
+            return fresnel_emissivity(wet_soil_dielectric, theta)[0]
+
+        def emissivity_wet_v(theta):
+            return fresnel_emissivity(wet_soil_dielectric, theta)[1]
+
+        emissivity_curves = VGroup(
+            cached_plot(axes, emissivity_dry_v, x_range=[0, 70], use_vectorized=True, color=ORANGE),
+            cached_plot(axes, emissivity_dry_h, x_range=[0, 70], use_vectorized=True, color=ORANGE, stroke_width=2),
+            cached_plot(axes, emissivity_wet_v, x_range=[0, 70], use_vectorized=True, color=TEAL),
+            cached_plot(axes, emissivity_wet_h, x_range=[0, 70], use_vectorized=True, color=TEAL, stroke_width=2),
+        )
+
+        angle_markers = VGroup(*[
+            DashedLine(axes.coords_to_point(angle, 0), axes.coords_to_point(angle, 1), color=color)
+            for angle, color in ((20, RED), (40, BLUE))
+        ])
+
+        legend = VGroup(
+            cached_text("Sol sec (5 %) : V puis H", font_size=20, color=ORANGE),
+            cached_text("Sol humide (35 %) : V puis H", font_size=20, color=TEAL),
+            cached_text("V augmente et H diminue avec l'angle", font_size=20),
+        ).arrange(DOWN, aligned_edge=LEFT, buff=0.25)
+        legend.next_to(axes, RIGHT, buff=0.6)
+
+        self.play(Create(axes), Write(x_label), Write(y_label), run_time=1.5)
+        self.play(Create(emissivity_curves), Create(angle_markers), run_time=2)
+        self.play(Write(legend), run_time=1.5)
+        self.wait(2)
+
+        # Rétrodiffusion selon l'angle : une courbe par humidité, rugosité animée
+        self.play(
+            FadeOut(emissivity_curves),
+            FadeOut(angle_markers),
+            FadeOut(legend),
+            FadeOut(axes),
+            FadeOut(x_label),
+            FadeOut(y_label),
+            run_time=1
+        )
+
+        sigma_axes = Axes(
+            x_range=[10, 60, 10],
+            y_range=[-30, 0, 5],
+            axis_config={"include_tip": True, "include_numbers": True},
+            x_length=7,
+            y_length=4
+        )
+        sigma_axes.to_edge(LEFT, buff=1).shift(DOWN * 0.3)
+
+        sigma_x_label = sigma_axes.get_x_axis_label(MathTex(r"\text{Angle d'incidence}~\theta~(^\circ)"), edge=DOWN, direction=DOWN)
+        sigma_y_label = sigma_axes.get_y_axis_label(MathTex(r"\sigma^{\circ}_{VV}~\text{(dB)}"), edge=LEFT, direction=LEFT)
+        sigma_y_label.scale(0.8)
+
+        # Courbes recalculées à chaque image par interpolation dans la table du modèle d'Oh
+        roughness = ValueTracker(LOW_ROUGHNESS_Ks)
+        moisture_family = always_redraw(lambda: plot_family(
+            sigma_axes,
+            lambda theta, moisture: backscatter(roughness.get_value(), moisture, theta),
+            np.linspace(DRY_SOIL_MOISTURE, 0.4, 12),
+            x_range=[10, 60],
+            stroke_width=2,
+        ).set_color_by_gradient(ORANGE, TEAL))
+
+        roughness_label = MathTex(r"K_s =", font_size=28, color=YELLOW)
+        roughness_value = DecimalNumber(LOW_ROUGHNESS_Ks, num_decimal_places=2, font_size=28, color=YELLOW)
+        roughness_value.add_updater(lambda m: m.set_value(roughness.get_value()))
+        family_legend = VGroup(
+            VGroup(roughness_label, roughness_value).arrange(RIGHT, buff=0.2),
+            cached_text("Humidité de 5 % (orange)", font_size=20, color=ORANGE),
+            cached_text("à 40 % (bleu-vert)", font_size=20, color=TEAL),
+        ).arrange(DOWN, aligned_edge=LEFT, buff=0.25)
+        family_legend.next_to(sigma_axes, RIGHT, buff=0.6)
+
+        self.play(Create(sigma_axes), Write(sigma_x_label), Write(sigma_y_label), run_time=1.5)
+        self.play(FadeIn(moisture_family), Write(family_legend), run_time=1.5)
+        self.play(roughness.animate.set_value(HIGH_ROUGHNESS_Ks), run_time=3)
+        self.play(roughness.animate.set_value(LOW_ROUGHNESS_Ks), run_time=2)
+        moisture_family.clear_updaters()
+        roughness_value.clear_updaters()
+        self.wait(1)
+
         # Transition vers la prochaine scène
         self.play(
             *[FadeOut(mob) for mob in self.mobjects],
@@ -620,15 +990,18 @@ class SoilMoistureRadarConclusion(Scene):
     Cette classe présente la conclusion et les applications de la télédétection radar
     pour l'humidité du sol
     """
+    def setup(self):
+        prefetch_text(self)
+
     def construct(self):
         # Titre
-        title = Text("Applications de la télédétection de l'humidité du sol", font_size=42)
+        title = cached_text("Applications de la télédétection de l'humidité du sol", font_size=42)
         self.play(Write(title), run_time=1.5)
         self.play(title.animate.scale(0.7).to_edge(UP), run_time=1)
         
         # Applications
         applications = VGroup(
-            Text("Agriculture", font_size=32, color=GREEN),
+            cached_text("Agriculture", font_size=32, color=GREEN),
             BulletedList(
                 "Optimisation de l'irrigation",
                 "Prévisions de rendement",
@@ -636,7 +1009,7 @@ class SoilMoistureRadarConclusion(Scene):
                 font_size=24
             ),
             
-            Text("Gestion des ressources en eau", font_size=32, color=BLUE),
+            cached_text("Gestion des ressources en eau", font_size=32, color=BLUE),
             BulletedList(
                 "Prévision des inondations",
                 "Gestion des bassins versants",
@@ -644,7 +1017,7 @@ class SoilMoistureRadarConclusion(Scene):
                 font_size=24
             ),
             
-            Text("Sciences climatiques", font_size=32, color=RED),
+            cached_text("Sciences climatiques", font_size=32, color=RED),
             BulletedList(
                 "Modélisation du cycle de l'eau",
                 "Études des changements climatiques",
@@ -692,14 +1065,14 @@ class SoilMoistureRadarConclusion(Scene):
         )
         
         # Satellites et capteurs radar utilisés
-        satellites_title = Text("Satellites & capteurs radar", font_size=32, color=YELLOW)
+        satellites_title = cached_text("Satellites & capteurs radar", font_size=32, color=YELLOW)
         satellites_title.to_edge(DOWN, buff=2)
         
         satellites = VGroup(
-            Text("Sentinel-1 (ESA)", font_size=24),
-            Text("RADARSAT-2 (Canada)", font_size=24),
-            Text("ALOS-2 PALSAR (Japon)", font_size=24),
-            Text("TerraSAR-X (Allemagne)", font_size=24)
+            cached_text("Sentinel-1 (ESA)", font_size=24),
+            cached_text("RADARSAT-2 (Canada)", font_size=24),
+            cached_text("ALOS-2 PALSAR (Japon)", font_size=24),
+            cached_text("TerraSAR-X (Allemagne)", font_size=24)
         ).arrange(RIGHT, buff=0.5)
         satellites.next_to(satellites_title, DOWN, buff=0.3)
         
@@ -714,7 +1087,7 @@ class SoilMoistureRadarConclusion(Scene):
         )
         
         # Conclusion finale
-        conclusion = Text(
+        conclusion = cached_text(
             "La télédétection radar offre une solution efficace pour surveiller\n"
             "l'humidité du sol à grande échelle, de jour comme de nuit\n"
             "et dans la plupart des conditions météorologiques.",
@@ -730,24 +1103,21 @@ class SoilMoistureRadarConclusion(Scene):
         self.wait(3)
 
 
-class SoilMoistureWithRadar(Scene):
+class SoilMoistureWithRadar(SceneSequence):
     """
-    Scène principale qui enchaîne toutes les scènes précédentes
+    Scène principale qui enchaîne toutes les scènes précédentes.
+    Chaque scène n'est rendue qu'une fois (ou reprise si elle n'a pas changé),
+    puis les vidéos sont concaténées sans nouveau rendu d'image.
     """
-    def construct(self):
-        # Créer toutes les scènes
-        scenes = [
-            RadarBasics(),
-            SoilRoughnessEffect(),
-            SoilMoistureEffect(),
-            IncidenceAngleEffect(),
-            SoilMoistureRadarConclusion()
-        ]
-        
-        # Jouer chaque scène
-        for scene in scenes:
-            for animation in scene.animations:
-                self.play(animation)
+    scenes = [
+        RadarBasics,
+        SarSpeckleFiltering,
+        SoilRoughnessEffect,
+        SoilMoistureEffect,
+        SoilMoistureRetrieval,
+        IncidenceAngleEffect,
+        SoilMoistureRadarConclusion,
+    ]
 
 
 # Si ce fichier est exécuté directement
@@ -755,7 +1125,10 @@ if __name__ == "__main__":
     print("Ce fichier contient des animations sur l'humidité du sol avec radar.")
     print("Utilisez manim pour les exécuter, par exemple:")
     print("manim -pqh soil_moisture_radar.py RadarBasics")
+    print("manim -pqh soil_moisture_radar.py SarSpeckleFiltering")
     print("manim -pqh soil_moisture_radar.py SoilRoughnessEffect")
     print("manim -pqh soil_moisture_radar.py SoilMoistureEffect")
+    print("manim -pqh soil_moisture_radar.py SoilMoistureRetrieval")
     print("manim -pqh soil_moisture_radar.py IncidenceAngleEffect")
     print("manim -pqh soil_moisture_radar.py SoilMoistureRadarConclusion")
+    print("manim -pqh soil_moisture_radar.py SoilMoistureWithRadar  # enchaînement complet")
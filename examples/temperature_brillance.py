@@ -1,9 +1,24 @@
 from manim import *
 
+from physics.growth import IceGrowth, freeze_up_series
+from rendering.plotting import plot_piecewise
+from rendering.prefetch import prefetch_text
+from rendering.raster import RasterMap, StreamField
+from rendering.text import cached_text
+
+# Simulation du gel : grille (lignes, colonnes), durée et intervalle entre images (jours)
+FREEZE_UP_GRID = (80, 240)
+FREEZE_UP_DAYS = 10
+FREEZE_UP_INTERVAL = 0.05
+
 class EvolutionTemperatureBrillance(Scene):
+    def setup(self):
+        # Textes et formules préparés en arrière-plan pendant les premières animations
+        prefetch_text(self)
+
     def construct(self):
         # Titre
-        title = Text("Évolution de Tᴮ lors du gel de l'eau salée", font_size=40)
+        title = cached_text("Évolution de Tᴮ lors du gel de l'eau salée", font_size=40)
         self.play(Write(title))
         self.wait()
         self.play(title.animate.scale(0.7).to_edge(UP))
@@ -18,44 +33,44 @@ class EvolutionTemperatureBrillance(Scene):
         x_label = axes.get_x_axis_label("Temps")
         y_label = axes.get_y_axis_label("Valeur")
         
-        # Courbe de la température physique (constante)
-        temp_phys_curve = axes.plot(
-            lambda x: 1,
+        # Courbes issues de la simulation du gel (moyennes sur la grille)
+        times, sim_emissivity, sim_temperature, sim_tb = freeze_up_series(
+            FREEZE_UP_DAYS, FREEZE_UP_INTERVAL, shape=FREEZE_UP_GRID
+        )
+        
+        # Courbe de la température physique (en légère baisse pendant le gel)
+        temp_phys_curve = plot_piecewise(
+            axes,
+            lambda x: np.interp(x, times, sim_temperature),
+            times,
             color=BLUE
         )
-        temp_phys_label = Text("Température physique", font_size=20, color=BLUE).next_to(temp_phys_curve, UP)
-        
-        # Courbe de l'émissivité
-        def emissivity(x):
-            if x < 3:
-                return 0.55  # Eau de mer
-            elif x < 6:
-                return 0.55 + (0.92 - 0.55) * (x - 3) / 3  # Transition
-            else:
-                return 0.92  # Glace
-        
-        emissivity_curve = axes.plot(
-            emissivity,
+        temp_phys_label = cached_text("Température physique", font_size=20, color=BLUE).next_to(temp_phys_curve, UP)
+        
+        # Courbe de l'émissivité (eau de mer -> transition -> glace)
+        emissivity_curve = plot_piecewise(
+            axes,
+            lambda x: np.interp(x, times, sim_emissivity),
+            times,
             x_range=[0, 10],
             color=GREEN
         )
-        emissivity_label = Text("Émissivité", font_size=20, color=GREEN).next_to(emissivity_curve.get_end(), RIGHT)
-        
-        # Courbe de la température de brillance (Tᴮ)
-        def brightness_temp(x):
-            return emissivity(x) * 1  # Tᴮ = émissivité * température physique
+        emissivity_label = cached_text("Émissivité", font_size=20, color=GREEN).next_to(emissivity_curve.get_end(), RIGHT)
         
-        tb_curve = axes.plot(
-            brightness_temp,
+        # Courbe de la température de brillance (Tᴮ = émissivité * température physique)
+        tb_curve = plot_piecewise(
+            axes,
+            lambda x: np.interp(x, times, sim_tb),
+            times,
             x_range=[0, 10],
             color=RED
         )
-        tb_label = Text("Température de brillance (Tᴮ)", font_size=20, color=RED).next_to(tb_curve.get_end(), RIGHT)
+        tb_label = cached_text("Température de brillance (Tᴮ)", font_size=20, color=RED).next_to(tb_curve.get_end(), RIGHT)
         
         # Animation du système physique
         ocean = Rectangle(width=6, height=2, fill_opacity=0.8, color=BLUE_E)
         ocean.move_to(DOWN * 3)
-        ocean_label = Text("Océan arctique", font_size=25).next_to(ocean, UP)
+        ocean_label = cached_text("Océan arctique", font_size=25).next_to(ocean, UP)
         
         # Affichage des valeurs
         emissivity_value_water = MathTex(r"\text{Émissivité eau} \approx 0.45-0.65", color=GREEN).to_edge(LEFT).shift(DOWN)
@@ -77,19 +92,21 @@ class EvolutionTemperatureBrillance(Scene):
         self.wait()
         
         # Animation de la transition eau-glace
-        ice_formation = Rectangle(width=0, height=2, fill_opacity=0.7, color=WHITE)
-        ice_formation.align_to(ocean, DOWN+LEFT)
+        ice_growth = IceGrowth(shape=FREEZE_UP_GRID)
+        ice_formation = RasterMap(ice_growth.thickness, colors=[BLUE_E, WHITE], vmax=0.2, width=ocean.width)
+        ice_formation.stretch_to_fit_height(ocean.height).move_to(ocean)
+        self.add(ice_formation)
         
+        ice_frames = (state.thickness for state in ice_growth.frames(FREEZE_UP_DAYS, FREEZE_UP_INTERVAL))
         self.play(
-            GrowFromPoint(ice_formation, ice_formation.get_center(), rate_func=rate_functions.linear),
-            ice_formation.animate.stretch_to_fit_width(6),
+            StreamField(ice_formation, ice_frames, round(FREEZE_UP_DAYS / FREEZE_UP_INTERVAL) + 1),
             run_time=5
         )
         
         # Conclusion
-        conclusion = Text(
+        conclusion = cached_text(
             "La température de brillance Tᴮ augmente significativement\n"
-            "malgré une température constante, en raison de\n"
+            "alors que la température physique baisse, en raison de\n"
             "l'augmentation de l'émissivité lors de la formation de la glace.",
             font_size=30
         )
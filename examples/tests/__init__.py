@@ -0,0 +1,4 @@
+"""
+Tests des modules partagés (``physics``, ``rendering``) qui ne demandent pas
+de rendu : ``python -m pytest`` depuis ``examples/``.
+"""
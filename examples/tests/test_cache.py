@@ -0,0 +1,28 @@
+import pytest
+
+import physics.backscatter as bs
+from physics.backscatter import backscatter
+from physics.cache import FingerprintError, function_fingerprint
+
+
+def test_fingerprint_follows_tables_and_modules(monkeypatch):
+    # backscatter -> BACKSCATTER_TABLES (dict de LookupTable) -> backscatter_db -> oh_backscatter
+    tabulated = lambda x: backscatter(x, 0.2, 20)  # noqa: E731
+    direct = lambda x: bs.backscatter_db(x, 0.2, 20)  # noqa: E731
+    before = function_fingerprint(tabulated), function_fingerprint(direct)
+
+    original = bs.oh_backscatter
+    monkeypatch.setattr(bs, "oh_backscatter", lambda ks, permittivity, angle: original(ks, permittivity, angle) * 2)
+    after = function_fingerprint(tabulated), function_fingerprint(direct)
+
+    assert before[0] != after[0]
+    assert before[1] != after[1]
+
+
+def test_fingerprint_rejects_opaque_objects():
+    class Model:
+        pass
+
+    model = Model()
+    with pytest.raises(FingerprintError):
+        function_fingerprint(lambda x: model)
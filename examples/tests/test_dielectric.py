@@ -0,0 +1,23 @@
+import numpy as np
+
+from physics.dielectric import free_water_permittivity, seawater_permittivity
+
+
+def test_fresh_seawater_matches_free_water():
+    # Sans sel, Klein et Swift se réduisent à la relaxation de Debye de l'eau pure
+    # (deux ajustements différents : écart de l'ordre du pour cent)
+    temperature = np.array([0.0, 10.0, 20.0, 30.0])[:, None]
+    frequency = np.geomspace(1, 100, 25)
+    np.testing.assert_allclose(
+        seawater_permittivity(temperature, 0, frequency),
+        free_water_permittivity(frequency, temperature),
+        rtol=2e-2,
+    )
+
+
+def test_seawater_reference_values():
+    # Eau de mer standard (20 °C, 35 ‰) : ε ≈ 72 - 67j en bande L (Klein et Swift, 1977),
+    # fréquence de relaxation vers 17 GHz, donc ε' < 20 à 37 GHz
+    np.testing.assert_allclose(seawater_permittivity(20, 35, 1.4), 72 - 67j, rtol=2e-2)
+    assert 15 < seawater_permittivity(20, 35, 37).real < 20
+    assert 25 < -seawater_permittivity(20, 35, 37).imag < 32
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+manim = pytest.importorskip("manim")
+
+from manim import BLUE, DOWN, GREEN, LEFT, RED, RIGHT, UP, Circle, Dot, ImageMobject, Line, Square  # noqa: E402
+
+from rendering.layers import LayeredCamera  # noqa: E402
+
+PIXEL_WIDTH = 320
+PIXEL_HEIGHT = 180
+FRAMES = 6
+
+
+class CountingCamera(LayeredCamera):
+    """``LayeredCamera`` qui compte les images redessinées entièrement."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.full_redraws = 0
+
+    def set_pixel_array(self, *args, **kwargs):
+        self.full_redraws = getattr(self, "full_redraws", 0) + 1
+        return super().set_pixel_array(*args, **kwargs)
+
+
+def moving_dot():
+    square = Square(2, color=BLUE, fill_opacity=0.5)
+    dot = Dot(LEFT * 2)
+    for step in range(FRAMES):
+        dot.move_to(LEFT * 2 + RIGHT * 0.5 * step)
+        yield [square, dot]
+
+
+def removed_mobject():
+    square = Square(2, color=BLUE, fill_opacity=0.5)
+    circle = Circle(0.5, color=RED, fill_opacity=0.8).shift(RIGHT * 0.5)
+    dot = Dot(LEFT * 3)
+    for step in range(FRAMES):
+        dot.shift(UP * 0.2)
+        yield [square, circle, dot] if step < 3 else [square, dot]
+
+
+def image_over_vmobject():
+    pixels = np.zeros((16, 16, 4), dtype=np.uint8)
+    pixels[..., 0] = 255
+    pixels[..., 3] = 128
+    image = ImageMobject(pixels).scale_to_fit_height(2)
+    line = Line(LEFT * 3, RIGHT * 3, stroke_width=8)
+    dot = Dot(DOWN * 2 + LEFT * 4)
+    for step in range(FRAMES):
+        dot.shift(RIGHT * 0.3)
+        if step == 2:
+            line.shift(UP * 0.3)
+        if step == 4:
+            image.pixel_array[..., 1] = 200
+        yield [line, image, dot]
+
+
+def reordered_mobjects():
+    first = Square(2, color=RED, fill_opacity=1)
+    second = Square(2, color=GREEN, fill_opacity=1).shift(RIGHT)
+    dot = Dot(UP * 3 + LEFT * 4)
+    for step in range(FRAMES):
+        dot.shift(RIGHT * 0.3)
+        yield [first, second, dot] if step < 3 else [second, first, dot]
+
+
+def _render(scenario, dirty_rectangles):
+    # Même enchaînement que le renderer Cairo : reset puis capture, image par image
+    camera = CountingCamera(
+        dirty_rectangles=dirty_rectangles, pixel_width=PIXEL_WIDTH, pixel_height=PIXEL_HEIGHT
+    )
+    camera.full_redraws = 0
+    frames = []
+    for mobjects in scenario():
+        camera.reset()
+        camera.capture_mobjects(mobjects)
+        frames.append(np.array(camera.pixel_array))
+    return frames, camera.full_redraws
+
+
+@pytest.mark.parametrize(
+    "scenario", [moving_dot, removed_mobject, image_over_vmobject, reordered_mobjects]
+)
+def test_dirty_rectangles_match_full_redraw(scenario):
+    expected, _ = _render(scenario, dirty_rectangles=False)
+    frames, full_redraws = _render(scenario, dirty_rectangles=True)
+    for index, (frame, reference) in enumerate(zip(frames, expected)):
+        assert np.array_equal(frame, reference), f"image {index} différente"
+    # Seule la première image est dessinée entièrement, les suivantes par rectangles
+    assert full_redraws == 1
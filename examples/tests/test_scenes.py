@@ -0,0 +1,17 @@
+import pytest
+
+from rendering.scenes import EXAMPLES_DIR, discover_scenes
+
+
+@pytest.mark.parametrize(
+    "file, scene",
+    [
+        ("improved_temperature_brillance.py", "BrightnessTemperatureEvolutionImproved"),
+        ("microwave_remote_sensing.py", "MicrowaveRemoteSensing"),
+        ("fixed_satellite_technology.py", "ImprovedMicrowaveRemoteSensing"),
+        ("soil_moisture_radar.py", "SoilMoistureEffect"),
+    ],
+)
+def test_layered_scenes_are_discovered(file, scene):
+    scenes = discover_scenes(EXAMPLES_DIR, files=[file], use_cache=False)
+    assert scene in {entry["scene"] for entry in scenes}
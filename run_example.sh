@@ -17,12 +17,8 @@ if [ $# -eq 0 ]; then
     echo "Qualités disponibles: l (basse), m (moyenne), h (haute)"
     echo ""
     echo "Animations disponibles:"
-    echo "  • Dans temperature_brillance.py:"
-    echo "    - EvolutionTemperatureBrillance (défaut)"
-    echo "  • Dans microwave_remote_sensing.py:"
-    echo "    - MicrowaveRemoteSensing"
-    echo "    - BrightnessTemperatureEvolution"
-    echo "    - SatelliteMicroResonaTechnology"
+    # Liste obtenue par analyse des fichiers, sans importer manim
+    (cd examples && python -m rendering.scenes)
     exit 1
 fi
 
@@ -38,6 +34,14 @@ if [ "$filename" == "temperature_brillance" ]; then
     default_class="EvolutionTemperatureBrillance"
 elif [ "$filename" == "microwave_remote_sensing" ]; then
     default_class="MicrowaveRemoteSensing"
+elif [ -f "examples/$1" ]; then
+    # Une seule scène dans le fichier : c'est la classe par défaut
+    scenes=$(cd examples && python -m rendering.scenes --names "$1")
+    if [ -n "$scenes" ] && [ "$(echo "$scenes" | wc -l)" -eq 1 ]; then
+        default_class="$scenes"
+    else
+        default_class=""
+    fi
 else
     default_class=""
 fi
@@ -49,6 +53,10 @@ class=${3:-$default_class}
 if [ -z "$class" ]; then
     echo "Erreur: Aucune classe spécifiée et aucune classe par défaut pour ce fichier."
     echo "Veuillez spécifier une classe."
+    if [ -f "examples/$1" ]; then
+        echo "Scènes disponibles dans '$1':"
+        (cd examples && python -m rendering.scenes --names "$1")
+    fi
     exit 1
 fi
 